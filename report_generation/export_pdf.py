@@ -1,81 +1,72 @@
+import argparse
 import asyncio
 import logging
-import requests
-from pyppeteer import launch
-from pyppeteer.chromium_downloader import download_chromium
+import time
+from src.browser_pool import export_pdfs, run_daemon
+from src.config import BROWSER_ENDPOINT_PATH, PDF_DAEMON_OUTPUT_DIR, PDF_DAEMON_PORT
+from src.pdf_optimize import describe, optimize_pdf
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-async def wait_with_retries(page, selector, max_retries=3, initial_delay=5):
-    for attempt in range(max_retries):
-        try:
-            await page.waitForSelector(selector, {'timeout': 30000})
-            return
-        except Exception as e:
-            logging.warning(f"Attempt {attempt + 1}/{max_retries} failed: {e}. Retrying after delay...")
-            await asyncio.sleep(initial_delay * (2 ** attempt))
-    raise Exception(f"Failed to find selector '{selector}' after {max_retries} retries.")
+DEFAULT_URL = 'http://127.0.0.1:8050'
+DEFAULT_OUTPUT = 'dash_report.pdf'
 
-async def export_dash_to_pdf():
-    # Ensure Chromium is downloaded
-    logging.info("Checking for Chromium installation...")
-    try:
-        download_chromium()
-        logging.info("Chromium is ready.")
-    except Exception as e:
-        logging.error(f"Failed to download Chromium: {e}")
-        raise
-
-    # Wait for Dash server to be ready
-    max_attempts = 20
-    for attempt in range(max_attempts):
-        try:
-            response = requests.get('http://127.0.0.1:8050', timeout=5)
-            if response.status_code == 200:
-                logging.info("Dash server is ready.")
-                break
-        except requests.exceptions.RequestException as e:
-            logging.warning(f"Attempt {attempt + 1}/{max_attempts}: Dash server not ready yet. Error: {e}")
-        await asyncio.sleep(3)
-    else:
-        raise Exception("Dash server did not become ready in time.")
-
-    # Launch Chromium with CI-friendly arguments
-    browser = await launch(
-        headless=True,
-        args=['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
-    )
-    page = await browser.newPage()
-    await page.setViewport({'width': 1280, 'height': 1024})
-
-    # Load your Dash app
-    await page.goto('http://127.0.0.1:8050', {'waitUntil': 'networkidle2'})
-
-    # Wait for Plotly to render with retries
-    await wait_with_retries(page, 'g.cartesianlayer')
+async def export_dash_to_pdf(jobs, pages, max_uses, endpoint_path, use_daemon=True, optimize=True):
+    start = time.monotonic()
+    results = await export_pdfs(jobs, pages, max_uses, endpoint_path, use_daemon)
 
-    # Alternative/more robust check (use one or both)
-    await page.waitForFunction('''() => {
-        const elem = document.querySelector('g.cartesianlayer');
-        return elem && elem.children.length > 0;
-    }''', {'timeout': 60000})
+    failed = 0
+    for (source, output), result in zip(jobs, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            logging.error(f"❌ {source} -> {output}: {result}")
+        else:
+            logging.info(f"✅ PDF saved as {output} ({result:.2f}s)")
+            if optimize:
+                stats = optimize_pdf(output)
+                logging.info(f"Optimised {describe(output, stats)}")
+                if stats.images:
+                    logging.warning(f"⚠️ {output} has {stats.images} raster images; charts drawn with "
+                                    f"--svg-charts (or plain Plotly SVG traces) stay vector")
+    logging.info(f"{len(jobs) - failed}/{len(jobs)} PDFs in {time.monotonic() - start:.2f}s")
+    if failed:
+        raise Exception(f"{failed} of {len(jobs)} exports failed.")
 
-    # Buffer time
-    await asyncio.sleep(5)
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export report pages to PDF through headless Chromium.")
+    parser.add_argument('--url', action='append',
+                        help=f"Page URL or local HTML file (e.g. main.py --html output) to export; "
+                             f"repeat with --output for a batch (default: {DEFAULT_URL})")
+    parser.add_argument('--output', action='append', help=f"PDF path for the matching --url (default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--pages', type=int, default=4, help="Concurrent pages in the pool (default: 4)")
+    parser.add_argument('--max-uses', type=int, default=50, help="Exports per page before it is replaced (default: 50)")
+    parser.add_argument('--serve', action='store_true',
+                        help="Run the warm browser daemon until interrupted; later exports are sent to it")
+    parser.add_argument('--port', type=int, default=PDF_DAEMON_PORT, help=f"Daemon job port with --serve (default: {PDF_DAEMON_PORT})")
+    parser.add_argument('--output-dir', default=PDF_DAEMON_OUTPUT_DIR,
+                        help=f"With --serve, only write PDFs under this directory (default: {PDF_DAEMON_OUTPUT_DIR})")
+    parser.add_argument('--endpoint', default=BROWSER_ENDPOINT_PATH,
+                        help=f"Daemon endpoint file (default: {BROWSER_ENDPOINT_PATH})")
+    parser.add_argument('--no-daemon', action='store_true', help="Always launch a fresh browser, even if a daemon is running")
+    parser.add_argument('--no-optimize', action='store_true',
+                        help="Keep Chromium's PDF as printed (skip deduplication and recompression)")
+    args = parser.parse_args()
 
-    # Export to PDF
-    await page.pdf({
-        'path': 'dash_report.pdf',
-        'format': 'A4',
-        'printBackground': True
-    })
-    logging.info("✅ PDF saved as dash_report.pdf")
-    await browser.close()
+    urls, outputs = args.url or [DEFAULT_URL], args.output or [DEFAULT_OUTPUT]
+    if len(urls) != len(outputs):
+        parser.error("give one --output per --url")
+    args.jobs = list(zip(urls, outputs))
+    return args
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        asyncio.get_event_loop().run_until_complete(export_dash_to_pdf())
+        if args.serve:
+            asyncio.run(run_daemon(args.endpoint, args.port, args.pages, args.max_uses, args.output_dir))
+        else:
+            asyncio.run(export_dash_to_pdf(args.jobs, args.pages, args.max_uses, args.endpoint, not args.no_daemon,
+                                           not args.no_optimize))
     except Exception as e:
         logging.error(f"Failed to export PDF: {e}")
         raise
@@ -1,3 +1,4 @@
 rm -rf src/__pycache__/*
 rm -rf scripts/__pycache__/*
 python3 -m scripts.test_data_extraction
+python3 -m scripts.test_validate_report
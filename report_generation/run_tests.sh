@@ -0,0 +1,8 @@
+set -e
+rm -rf src/__pycache__/*
+rm -rf scripts/__pycache__/*
+python3 -m scripts.test_pagination
+python3 -m scripts.test_pdf_export
+python3 -m scripts.test_history
+python3 -m scripts.test_portfolio_cube
+python3 -m scripts.test_report_server
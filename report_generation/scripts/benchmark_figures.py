@@ -0,0 +1,92 @@
+"""Benchmark maturity chart construction: validated go.Figure per card vs the memoized dict factory.
+
+Times building all maturity charts of a report (and the whole Technical Overview section)
+with generate_chart() and with maturity_chart_figure(), cold and warm cache.
+
+Run from report_generation/:
+    python3 -m scripts.benchmark_figures
+    python3 -m scripts.benchmark_figures -c data/combined_report_original.md -r 20
+"""
+import argparse
+import contextlib
+import io
+import json
+import time
+
+import plotly
+
+from src import technical_overview
+from src.chart_generation import generate_chart, maturity_chart_figure, _maturity_chart_dict, _maturity_chart_layout
+from src.config import COMBINED_REPORT_PATH
+from src.data_extraction import extract_report
+from src.utils import read_file
+
+
+def clear_caches():
+    _maturity_chart_dict.cache_clear()
+    _maturity_chart_layout.cache_clear()
+
+
+def best_time(func, repeat, before=None):
+    best = float("inf")
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def figure_json(figure):
+    return json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark maturity bar chart construction.")
+    parser.add_argument("-c", "--current", default=COMBINED_REPORT_PATH, help=f"Report to chart (default: {COMBINED_REPORT_PATH})")
+    parser.add_argument("-r", "--repeat", type=int, default=10, help="Runs per case; the best time is reported (default: 10)")
+    args = parser.parse_args()
+
+    text = read_file(args.current)
+    if not text:
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        items = extract_report(text).maturity
+    triples = {(tuple(item.scores), item.prev_score_missing) for item in items}
+    print(f"{len(items)} maturity items, {len(triples)} distinct score triples")
+
+    mismatched = [item.title for item in items
+                  if figure_json(generate_chart(item.scores, item.prev_score_missing))
+                  != figure_json(maturity_chart_figure(item.scores, item.prev_score_missing))]
+    if mismatched:
+        print(f"❌ Factory output differs from generate_chart for: {', '.join(mismatched)}")
+        return
+
+    def build(factory):
+        return lambda: [factory(item.scores, item.prev_score_missing) for item in items]
+
+    def build_section(factory):
+        def run():
+            original = technical_overview.maturity_chart_figure
+            technical_overview.maturity_chart_figure = factory
+            try:
+                technical_overview.create_technical_overview(items)
+            finally:
+                technical_overview.maturity_chart_figure = original
+        return run
+
+    cases = [
+        ("charts: generate_chart", build(generate_chart), None),
+        ("charts: factory (cold)", build(maturity_chart_figure), clear_caches),
+        ("charts: factory (warm)", build(maturity_chart_figure), None),
+        ("section: generate_chart", build_section(generate_chart), None),
+        ("section: factory (warm)", build_section(maturity_chart_figure), None),
+    ]
+    print(f"{'case':<26} {'best':>10}")
+    for name, func, before in cases:
+        print(f"{name:<26} {best_time(func, args.repeat, before) * 1000:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark the Technical Overview layouts: one dcc.Graph per maturity card vs one subplot-grid figure.
+
+Always reports layout build time, layout JSON size and the number of Plotly graphs. With --browser
+(needs pyppeteer and Chromium) it also serves each layout and times, in headless Chromium, how long
+until the page publishes window.reportReady (every graph drawn) and how long page.pdf() takes.
+
+Run from report_generation/:
+    python3 -m scripts.benchmark_layouts
+    python3 -m scripts.benchmark_layouts -c data/combined_report_original.md --browser -r 3
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import tempfile
+import threading
+import time
+
+import plotly
+from werkzeug.serving import make_server
+
+from src.config import COMBINED_REPORT_PATH
+from src.data_extraction import extract_report
+from src.document_creation import create_dash_app
+from src.technical_overview import create_technical_overview
+from src.utils import read_file
+
+LAYOUTS = {"cards": False, "grid": True}     # name: chart_grid
+
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def layout_stats(report, chart_grid, repeat):
+    build = best_time(lambda: create_technical_overview(report.maturity, chart_grid=chart_grid), repeat)
+    payload = json.dumps(create_technical_overview(report.maturity, chart_grid=chart_grid), cls=plotly.utils.PlotlyJSONEncoder)
+    return build, len(payload), payload.count('"type": "Graph"')
+
+
+async def browser_times(apps, repeat):
+    """{layout: (best ms until all graphs drawn, best ms for page.pdf())}, one local server per layout."""
+    from pyppeteer import launch
+
+    servers = {name: make_server("127.0.0.1", 0, app.server, threaded=True) for name, app in apps.items()}
+    for server in servers.values():
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    browser = await launch(headless=True, args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"])
+    results = {}
+    try:
+        for name, server in servers.items():
+            render, pdf = float("inf"), float("inf")
+            for _ in range(repeat):
+                page = await browser.newPage()
+                await page.setViewport({"width": 1280, "height": 1024})
+                await page.goto(f"http://127.0.0.1:{server.server_port}", {"waitUntil": "load"})
+                await page.waitForFunction("() => window.reportReady === true", {"timeout": 120000, "polling": "raf"})
+                render = min(render, await page.evaluate("() => performance.now()"))
+                with tempfile.NamedTemporaryFile(suffix=".pdf") as out:
+                    start = time.perf_counter()
+                    await page.pdf({"path": out.name, "format": "A4", "printBackground": True})
+                    pdf = min(pdf, (time.perf_counter() - start) * 1000)
+                await page.close()
+            results[name] = (render, pdf)
+    finally:
+        await browser.close()
+        for server in servers.values():
+            server.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the per-card and subplot-grid Technical Overview layouts.")
+    parser.add_argument("-c", "--current", default=COMBINED_REPORT_PATH, help=f"Report to lay out (default: {COMBINED_REPORT_PATH})")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Runs per case; the best time is reported (default: 5)")
+    parser.add_argument("--browser", action="store_true", help="Also time rendering and PDF export in headless Chromium (pyppeteer)")
+    args = parser.parse_args()
+
+    text = read_file(args.current)
+    if not text:
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = extract_report(text)
+
+    print(f"{len(report.maturity)} maturity items")
+    print(f"{'layout':<8} {'build':>10} {'JSON':>10} {'graphs':>7}")
+    for name, chart_grid in LAYOUTS.items():
+        build, size, graphs = layout_stats(report, chart_grid, args.repeat)
+        print(f"{name:<8} {build * 1000:>7.2f} ms {size / 1024:>7.1f} KB {graphs:>7}")
+
+    if not args.browser:
+        return
+    try:
+        import pyppeteer  # noqa: F401
+    except ImportError:
+        print("⚠️ pyppeteer is not installed; skipping browser timings.")
+        return
+    apps = {
+        name: create_dash_app(report.maturity, report.technical, report.critical_risks, report.final_maturity,
+                              report.compliance, chart_grid=chart_grid)
+        for name, chart_grid in LAYOUTS.items()
+    }
+    times = asyncio.get_event_loop().run_until_complete(browser_times(apps, args.repeat))
+    print(f"\n{'layout':<8} {'all graphs drawn':>18} {'page.pdf()':>12}")
+    for name, (render, pdf) in times.items():
+        print(f"{name:<8} {render:>15.0f} ms {pdf:>9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Benchmark the shared "report" Plotly template against figures that carry their layout inline.
+
+"template" is the report as built: every figure references chart_generation's registered "report"
+template and carries only its data and the layout it does not share. "inline" rewrites the same
+figures in the earlier style: the full default "plotly" template plus the shared settings written
+into every figure's layout. The layout includes the Portfolio Benchmark charts when the history
+store has the client (--client, default: its first client). Checks that every figure uses the
+"report" template, then reports the serialized layout size (raw and gzipped) and the bytes spent
+on templates. With --browser (needs pyppeteer and Chromium) it also serves both and
+times, in headless Chromium, how long until the page publishes window.reportReady (every graph
+drawn) and how long page.pdf() takes.
+
+Run from report_generation/:
+    python3 -m scripts.benchmark_template
+    python3 -m scripts.benchmark_template -c data/combined_report_original.md --browser -r 3
+    python3 -m scripts.benchmark_template --history data/output/history.sqlite3 --client acme
+"""
+import argparse
+import asyncio
+import contextlib
+import gzip
+import io
+import json
+import os
+
+import plotly
+import plotly.io as pio
+
+from scripts.benchmark_layouts import browser_times
+from src.chart_generation import REPORT_TEMPLATE
+from src.config import COMBINED_REPORT_PATH, HISTORY_DB_PATH
+from src.data_extraction import extract_report
+from src.document_creation import create_dash_app
+from src.history import AssessmentHistory
+from src.utils import read_file
+
+
+def _merge(base, override):
+    """override on top of base, recursively for nested dicts."""
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = _merge(base[key], value) if isinstance(value, dict) and isinstance(base.get(key), dict) else value
+    return merged
+
+
+def _to_json(obj):
+    return json.loads(json.dumps(obj, cls=plotly.utils.PlotlyJSONEncoder))
+
+
+def inline_figure(figure):
+    """The figure with the report template's layout written into its own layout, on the full default template."""
+    figure = _to_json(figure)
+    shared = pio.templates[REPORT_TEMPLATE].to_plotly_json()["layout"]
+    layout = {key: value for key, value in figure["layout"].items() if key != "template"}
+    for axis in [key for key in layout if key.startswith(("xaxis", "yaxis"))]:
+        layout[axis] = _merge(shared.get(axis[:5], {}), layout[axis])
+    layout = _merge({key: value for key, value in shared.items() if key not in ("xaxis", "yaxis")}, layout)
+    layout["template"] = pio.templates["plotly"].to_plotly_json()
+    return {**figure, "layout": layout}
+
+
+def inline_templates(component):
+    """Rewrite every dcc.Graph figure in a layout tree with inline_figure."""
+    if isinstance(component, (list, tuple)):
+        for child in component:
+            inline_templates(child)
+        return
+    if not hasattr(component, "to_plotly_json"):
+        return
+    if type(component).__name__ == "Graph" and getattr(component, "figure", None):
+        component.figure = inline_figure(component.figure)
+    inline_templates(getattr(component, "children", None))
+
+
+def figure_templates(layout_json):
+    """layout.template of every dcc.Graph figure in a serialized layout."""
+    def walk(node):
+        if isinstance(node, dict):
+            if node.get("type") == "Graph" and isinstance(node.get("props", {}).get("figure"), dict):
+                return [node["props"]["figure"].get("layout", {}).get("template", {})]
+            return [template for value in node.values() for template in walk(value)]
+        if isinstance(node, list):
+            return [template for value in node for template in walk(value)]
+        return []
+    return walk(json.loads(layout_json))
+
+
+def template_bytes(layout_json):
+    """Bytes spent on layout.template across every figure of a serialized layout."""
+    return sum(len(json.dumps(template)) for template in figure_templates(layout_json))
+
+
+def load_benchmark(history_path, client):
+    """(client, Portfolio Benchmark view) from the history store, or (None, None) without one."""
+    if not os.path.exists(history_path):
+        return None, None
+    with AssessmentHistory(history_path) as history:
+        client = client or next(iter(history.clients()), None)
+        return client, history.cube.client_view(client) if client else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the shared report template with inline figure layouts.")
+    parser.add_argument("-c", "--current", default=COMBINED_REPORT_PATH, help=f"Report to lay out (default: {COMBINED_REPORT_PATH})")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Runs per case in the browser; the best time is reported (default: 5)")
+    parser.add_argument("--history", default=HISTORY_DB_PATH, help=f"History store for the Portfolio Benchmark charts (default: {HISTORY_DB_PATH})")
+    parser.add_argument("--client", help="Client whose Portfolio Benchmark is included (default: the first in --history)")
+    parser.add_argument("--browser", action="store_true", help="Also time rendering and PDF export in headless Chromium (pyppeteer)")
+    args = parser.parse_args()
+
+    text = read_file(args.current)
+    if not text:
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = extract_report(text)
+    client, benchmark = load_benchmark(args.history, args.client)
+
+    apps = {}
+    for name in ("inline", "template"):
+        apps[name] = create_dash_app(report.maturity, report.technical, report.critical_risks, report.final_maturity,
+                                     report.compliance, benchmark=benchmark, client=client)
+    inline_templates(apps["inline"].layout)
+
+    expected = pio.templates[REPORT_TEMPLATE].to_plotly_json()
+    templates = figure_templates(json.dumps(apps["template"].layout, cls=plotly.utils.PlotlyJSONEncoder))
+    others = sum(_to_json(template) != expected for template in templates)
+    if others:
+        print(f"❌ {others} of {len(templates)} figures do not use the \"{REPORT_TEMPLATE}\" template")
+    else:
+        print(f"✅ All {len(templates)} figures use the \"{REPORT_TEMPLATE}\" template")
+    print(f"{len(report.maturity)} maturity items, "
+          + (f"Portfolio Benchmark for {client}" if benchmark else "no Portfolio Benchmark (no history store or client)"))
+    print(f"{'figures':<10} {'JSON':>10} {'gzipped':>10} {'templates':>10}")
+    sizes = {}
+    for name, app in apps.items():
+        payload = json.dumps(app.layout, cls=plotly.utils.PlotlyJSONEncoder)
+        sizes[name] = len(payload)
+        print(f"{name:<10} {len(payload) / 1024:>7.1f} KB {len(gzip.compress(payload.encode())) / 1024:>7.1f} KB "
+              f"{template_bytes(payload) / 1024:>7.1f} KB")
+    print(f"✅ The shared template makes the layout {1 - sizes['template'] / sizes['inline']:.0%} smaller")
+
+    if not args.browser:
+        return
+    try:
+        import pyppeteer  # noqa: F401
+    except ImportError:
+        print("⚠️ pyppeteer is not installed; skipping browser timings.")
+        return
+    times = asyncio.get_event_loop().run_until_complete(browser_times(apps, args.repeat))
+    print(f"\n{'figures':<10} {'all graphs drawn':>18} {'page.pdf()':>12}")
+    for name, (render, pdf) in times.items():
+        print(f"{name:<10} {render:>15.0f} ms {pdf:>9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Fuzz and time-bound harness for src.data_extraction.
+
+Feeds adversarial shapes (unterminated bullets, risks without **Solution:**, huge single
+lines, heading floods) and random mutations of data/combined_report.md into extract_report,
+at a base size and at 4x that size. Fails if extraction raises, if an input takes longer
+than the absolute bound, or if 4x the input takes much more than 4x the time.
+
+Run from report_generation/:
+    python3 -m scripts.fuzz_extraction
+    python3 -m scripts.fuzz_extraction --seed 7 --mutations 200 --large-bytes 10000000
+"""
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+
+from src.config import COMBINED_REPORT_PATH
+from src.data_extraction import extract_report
+from src.utils import read_file
+
+SCALE = 4                   # size ratio between the two runs of each case
+MAX_GROWTH = SCALE * 2.5    # linear stays near 4x; quadratic lands near 16x
+SECONDS_PER_MB = 1.0        # absolute bound, generous for slow CI runners
+SECONDS_FLOOR = 0.25        # timings below this are too noisy to compare
+
+FRAGMENTS = [
+    "- **", "**", ")**", " (Score: ", "1.5", "X", ") (Priority level: ", "2", ") (Personas: ", "Operator",
+    "**Business Impact:**", "**Solution:**", "- **Immediate:**", "- **Short-term:**", "- **Long-term:**",
+    "### 1. ", "## 1. Critical Risks", "## 2. Platform Maturity Scoring", "#### ", "---", "|", "| Area |",
+    "*Findings:*", "%", "\n", "\n\n", " ",
+]
+
+
+def _section(title, body):
+    return f"## {title}\n\n{body}\n"
+
+
+ADVERSARIAL = {
+    "unterminated bullets": lambda n: _section(
+        "2. Platform Maturity Scoring", "- **Item with no score or closing bold\n  findings text\n" * n),
+    "bullets without findings": lambda n: _section(
+        "2. Platform Maturity Scoring", "- **Item (Score: 1.0) (Priority level: 2) (Personas: Operator)**\n\n" * n),
+    "one endless finding": lambda n: _section(
+        "2. Platform Maturity Scoring",
+        "- **Item (Score: 1.0) (Priority level: 2) (Personas: Operator)**\n" + "  more findings text\n" * n),
+    "risks without solution": lambda n: _section(
+        "1. Critical Risks", "### 1. Risk\n\n**Business Impact:**\nImpact text.\n\n" * n),
+    "risk without long-term": lambda n: _section(
+        "1. Critical Risks",
+        "### 1. Risk\n\n**Business Impact:**\nImpact.\n\n**Solution:**\n- **Immediate:** a\n"
+        + "- **Short-term:** b\n" * n),
+    "single huge line": lambda n: _section(
+        "2. Platform Maturity Scoring", "- **" + "x (Score: (Priority level: " * n),
+    "heading flood": lambda n: _section("1. Critical Risks", "### 1. **Risk**\n" * n),
+    "table flood": lambda n: _section("6. Technical Focus Area Scores", "| a | b | c | d |\n|---|\n" * n),
+}
+
+
+def mutate(rng, lines, count):
+    """Apply `count` random line-level edits drawn from FRAGMENTS."""
+    lines = list(lines)
+    for _ in range(count):
+        i = rng.randrange(len(lines) or 1)
+        op = rng.random()
+        if not lines or op < 0.3:
+            lines.insert(i, "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 6))))
+        elif op < 0.5:
+            del lines[i]
+        elif op < 0.7:
+            lines.insert(i, lines[i])
+        elif op < 0.85:
+            cut = rng.randrange(len(lines[i]) + 1)
+            lines[i] = lines[i][:cut]
+        else:
+            j = rng.randrange(len(lines))
+            lines[i], lines[j] = lines[j], lines[i]
+    return lines
+
+
+def timed_extract(text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        extract_report(text)
+        return time.perf_counter() - start
+
+
+def check(name, build, base_bytes):
+    """Run one case at base size and SCALE x base size; return a list of failure messages."""
+    small, large = build(base_bytes), build(base_bytes * SCALE)
+    try:
+        t_small, t_large = timed_extract(small), timed_extract(large)
+    except Exception as e:  # any crash on malformed input is a failure
+        return [f"{name}: extract_report raised {type(e).__name__}: {e}"], None
+
+    failures = []
+    bound = SECONDS_FLOOR + SECONDS_PER_MB * len(large) / 1e6
+    if t_large > bound:
+        failures.append(f"{name}: {len(large)} chars took {t_large:.2f}s (bound {bound:.2f}s)")
+    if t_large > SECONDS_FLOOR and t_large > MAX_GROWTH * max(t_small, SECONDS_FLOOR / SCALE):
+        failures.append(f"{name}: {SCALE}x input took {t_large / t_small:.1f}x time (max {MAX_GROWTH:.0f}x)")
+    return failures, (len(large), t_small, t_large)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzz report extraction and assert linear running time.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mutations", type=int, default=50, help="Number of mutated reports to try (default: 50)")
+    parser.add_argument("--large-bytes", type=int, default=2_500_000,
+                        help=f"Base size for the adversarial cases; each also runs at {SCALE}x (default: 2500000)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    seed_lines = (read_file(COMBINED_REPORT_PATH) or "").splitlines()
+    failures = []
+
+    print(f"{'case':<28} {'chars':>10} {'base':>10} {f'{SCALE}x':>10}")
+    for name, shape in ADVERSARIAL.items():
+        unit = max(1, len(shape(1)))
+        case_failures, result = check(name, lambda size, shape=shape, unit=unit: shape(max(1, size // unit)), args.large_bytes)
+        failures += case_failures
+        if result:
+            print(f"{name:<28} {result[0]:>10} {result[1] * 1000:>8.1f}ms {result[2] * 1000:>8.1f}ms")
+
+    for i in range(args.mutations):
+        mutated = "\n".join(mutate(rng, seed_lines, rng.randint(1, 40)))
+        case_failures, _ = check(f"mutation {i}", lambda size, text=mutated: text * max(1, size // max(len(text), 1)), 100_000)
+        failures += case_failures
+    print(f"{args.mutations} mutated reports checked (seed {args.seed}).")
+
+    if failures:
+        print("\nFAILED")
+        for failure in failures:
+            print("-", failure)
+        sys.exit(1)
+    print("All cases parsed without errors within the linear time bound.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Load past combined reports into the assessment history store and print score trends.
+
+Run from report_generation/:
+    python3 -m scripts.history add --client acme --date 2024-06-01 data/previous_report.md
+    python3 -m scripts.history show --client acme
+    python3 -m scripts.history show --client acme --title "Production-Ready Environment" --area "Installation"
+    python3 -m scripts.history search "disaster recovery backup" --kind finding --limit 10
+"""
+import argparse
+import contextlib
+import io
+import time
+from datetime import date
+
+from src.config import HISTORY_DB_PATH
+from src.data_extraction import extract_report
+from src.history import AssessmentHistory
+from src.utils import read_file
+
+
+def _iso_date(value):
+    return date.fromisoformat(value).isoformat()
+
+
+def add(history, args):
+    text = read_file(args.report)
+    if not text:
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = extract_report(text)
+    history.save(args.client, args.date, report, source=args.report)
+
+
+def show(history, args):
+    dates = history.assessment_dates(args.client)
+    if not dates:
+        print(f"❌ No assessments for {args.client} in {history.path}")
+        return
+    print(f"{args.client}: {len(dates)} assessment(s), {dates[0]} to {dates[-1]}")
+
+    report = history.load(args.client, dates[-1])
+    print("\nFinal Maturity Scores (current % / target %)")
+    for score in report.final_maturity:
+        trend = history.final_maturity_trend(args.client, score.rubric)
+        print(f"  {score.rubric:<12} " + "  ".join(f"{on}: {cur:.2f} / {tgt:.2f}" for on, cur, tgt in trend))
+
+    for title in args.title:
+        print(f"\n{title}")
+        for on, current in history.maturity_trend(args.client, title):
+            print(f"  {on}: {current}")
+    for area in args.area:
+        print(f"\n{area}")
+        for on, current in history.technical_trend(args.client, area):
+            print(f"  {on}: {current}")
+
+
+def search(history, args):
+    start = time.perf_counter()
+    hits = history.search(args.query, client=args.client, kinds=args.kind, limit=args.limit, raw=args.raw)
+    elapsed = (time.perf_counter() - start) * 1000
+    for hit in hits:
+        print(f"{hit.rank:7.2f}  {hit.client}  {hit.assessed_on}  {hit.kind:<15} {hit.title}")
+        print(f"         {' '.join(hit.snippet.split())}")
+    print(f"{len(hits)} hit(s) in {elapsed:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the assessment history store.")
+    parser.add_argument("--history", default=HISTORY_DB_PATH, help=f"History database (default: {HISTORY_DB_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = commands.add_parser("add", help="Extract a combined_report.md and save it for a client and date")
+    add_parser.add_argument("--client", required=True)
+    add_parser.add_argument("--date", type=_iso_date, required=True, help="Assessment date (YYYY-MM-DD)")
+    add_parser.add_argument("report", help="Path to the combined_report.md")
+    add_parser.set_defaults(run=add)
+
+    show_parser = commands.add_parser("show", help="Print a client's assessments and score trends")
+    show_parser.add_argument("--client", required=True)
+    show_parser.add_argument("--title", action="append", default=[], help="Platform maturity rubric item to trend (repeatable)")
+    show_parser.add_argument("--area", action="append", default=[], help="Technical focus area to trend (repeatable)")
+    show_parser.set_defaults(run=show)
+
+    search_parser = commands.add_parser("search", help="Full-text search over findings, business impact and solutions")
+    search_parser.add_argument("query", help="Words that must all match (stemmed); see --raw")
+    search_parser.add_argument("--client", default=None, help="Only this client's assessments")
+    search_parser.add_argument("--kind", action="append", choices=["finding", "business_impact", "solution"],
+                               help="Only these kinds of text (repeatable)")
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum hits, best first (default: 20)")
+    search_parser.add_argument("--raw", action="store_true", help="Treat the query as FTS5 syntax (OR, NEAR, \"phrase\", prefix*)")
+    search_parser.set_defaults(run=search)
+
+    args = parser.parse_args()
+    with AssessmentHistory(args.history) as history:
+        args.run(history, args)
+
+
+if __name__ == "__main__":
+    main()
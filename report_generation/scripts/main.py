@@ -1,31 +1,88 @@
 # scripts/main.py
 import argparse
+import asyncio
+import threading
+import time
+from datetime import date
+from dataclasses import replace
 from typing import Dict, Any, List
 
 from src.data_extraction import (
+    extract_report,
     extract_platform_entries,
     extract_technical_scores,
-    extract_critical_risks,
-    extract_compliance_posture,
-    extract_final_maturity_scores,
-    write_entry,
-    write_final_maturity_entry,
+    index_sections,
+    write_text_report,
+    write_report_json,
+)
+from src.utils import read_file
+from src.history import AssessmentHistory
+from src.columnar_export import write_parquet, append_to_dataset
+from src.document_creation import create_report_app, create_report_sections
+from src.technical_overview import build_card_index, register_card_callbacks
+from src.static_html import write_static_html
+from src.config import (
+    COMBINED_REPORT_PATH, REPORT_PATH, REPORT_JSON_PATH, REPORT_HTML_PATH, REPORT_PDF_PATH, HISTORY_DB_PATH, PARQUET_DIR,
+    DATASET_DIR, BROWSER_ENDPOINT_PATH
 )
-from src.utils import read_file, parse_report_file
-from src.document_creation import create_dash_app
-from src.config import COMBINED_REPORT_PATH, REPORT_PATH
 
 
-def _map_by_key(items: List[Dict[str, Any]], key: str) -> Dict[str, Dict[str, Any]]:
-    """Build a dict keyed by `key` (e.g., title/area) for quick lookups."""
+def _map_by_key(items: List[Any], key: str) -> Dict[str, Any]:
+    """Build a dict keyed by the `key` attribute (e.g., title/area) for quick lookups."""
     out = {}
     for it in items:
-        k = it.get(key)
+        k = getattr(it, key, None)
         if k:
             out[k] = it
     return out
 
 
+def _with_previous(items: List[Any], prev_map: Dict[str, Any], key: str) -> List[Any]:
+    """Use each matching PREVIOUS entry's current score as this entry's 'Previous' value."""
+    out = []
+    for entry in items:
+        prev = prev_map.get(getattr(entry, key))
+        out.append(replace(entry, previous=prev.current) if prev else entry)
+    return out
+
+
+def _iso_date(value: str) -> str:
+    return date.fromisoformat(value).isoformat()
+
+
+def _export(report, args):
+    """Write the JSON export and any optional exports (report.txt, Parquet); run off the main thread."""
+    try:
+        if args.json:
+            write_report_json(report, args.json)
+        if args.text_report:
+            write_text_report(report, args.text_report)
+        if args.parquet:
+            write_parquet(report, args.parquet)
+        if args.dataset:
+            append_to_dataset(report, args.dataset, args.client, args.date)
+    except Exception as e:  # an export failure must not take the dashboard down
+        print(f"❌ Report export failed: {e}")
+
+
+def _export_pdf(app, sections, path):
+    """
+    Print the report to path one section fragment at a time from its static HTML (browser daemon if running,
+    else a one-off browser); fragments whose content is unchanged come from the cache.
+    """
+    from src.pdf_fragments import export_sectioned_pdf     # pyppeteer and pypdf are only needed for PDF output
+
+    start = time.perf_counter()
+    try:
+        rendered, cached = asyncio.run(export_sectioned_pdf(app, sections, path, endpoint_path=BROWSER_ENDPOINT_PATH))
+    except Exception as e:
+        print(f"❌ PDF export failed: {e}")
+        return False
+    print(f"✅ Generated PDF report: {path} ({rendered} sections rendered, {cached} cached, "
+          f"{time.perf_counter() - start:.2f}s)")
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(description="Render Dash report from combined markdown.")
     parser.add_argument(
@@ -36,92 +93,157 @@ def main():
     parser.add_argument(
         "-p", "--previous",
         default=None,
-        help="Path to PREVIOUS combined_report.md (optional). When provided, 'Previous' values in report.txt will be populated."
+        help="Path to PREVIOUS combined_report.md (optional). When provided, 'Previous' values will be populated "
+             "from it instead of from the assessment history."
+    )
+    parser.add_argument(
+        "--client",
+        default=None,
+        help="Client name. When provided, 'Previous' values come from the client's latest earlier assessment "
+             "in the history store, and this report is saved to it."
+    )
+    parser.add_argument(
+        "--date",
+        type=_iso_date,
+        default=date.today().isoformat(),
+        help="Assessment date (YYYY-MM-DD) recorded with --client (default: today)"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Add the Portfolio Benchmark section (needs --client): this client against all other clients in the history store"
+    )
+    parser.add_argument(
+        "--svg-charts",
+        action="store_true",
+        help="Draw the maturity, Final Maturity and Overall charts as static SVG rendered in Python "
+             "instead of Plotly graphs (nothing to wait for in the browser before printing)"
+    )
+    parser.add_argument(
+        "--chart-grid",
+        action="store_true",
+        help="Draw all Technical Overview bar charts as one subplot-grid figure beside the card text "
+             "instead of one graph per card (ignored with --svg-charts)"
+    )
+    parser.add_argument(
+        "--lazy-cards",
+        type=int,
+        metavar="N",
+        default=None,
+        help="Serve only the first N Technical Overview cards in the initial page and load the rest in batches of N "
+             "as the reader scrolls (interactive server only; --html and --pdf always get every card)"
+    )
+    parser.add_argument(
+        "--history",
+        default=HISTORY_DB_PATH,
+        help=f"Assessment history database (default: {HISTORY_DB_PATH})"
+    )
+    parser.add_argument(
+        "--json",
+        default=REPORT_JSON_PATH,
+        help=f"Where to write the extracted report as JSON (default: {REPORT_JSON_PATH}; pass '' to skip)"
+    )
+    parser.add_argument(
+        "--text-report",
+        nargs="?",
+        const=REPORT_PATH,
+        default=None,
+        help=f"Also write the legacy report.txt export (default path when given without a value: {REPORT_PATH})"
+    )
+    parser.add_argument(
+        "--html",
+        nargs="?",
+        const=REPORT_HTML_PATH,
+        default=None,
+        help="Write the dashboard as a self-contained static HTML file and exit instead of starting the server "
+             f"(default path when given without a value: {REPORT_HTML_PATH})"
+    )
+    parser.add_argument(
+        "--pdf",
+        nargs="?",
+        const=REPORT_PDF_PATH,
+        default=None,
+        help="Print the dashboard to PDF straight from its in-memory static HTML (headless Chromium, no server), one cached fragment per section, "
+             f"and exit (default path when given without a value: {REPORT_PDF_PATH})"
+    )
+    parser.add_argument(
+        "--parquet",
+        nargs="?",
+        const=PARQUET_DIR,
+        default=None,
+        help=f"Also write one Parquet file per table (default directory when given without a value: {PARQUET_DIR})"
+    )
+    parser.add_argument(
+        "--dataset",
+        nargs="?",
+        const=DATASET_DIR,
+        default=None,
+        help=f"Append to the Parquet dataset partitioned by client and date (needs --client; default: {DATASET_DIR})"
     )
     args = parser.parse_args()
+    if args.dataset and not args.client:
+        print("⚠️ --dataset needs --client; skipping the Parquet dataset append.")
+        args.dataset = None
 
     # Load CURRENT combined report
     combined_text = read_file(args.current)
     if not combined_text:
         return
 
-    # Always extract CURRENT
-    cur_maturity = extract_platform_entries(combined_text)
-    cur_tech = extract_technical_scores(combined_text)
-    cur_risks = extract_critical_risks(combined_text)
-    cur_compliance = extract_compliance_posture(combined_text)
-    cur_final = extract_final_maturity_scores(combined_text)
+    # Always extract CURRENT (one tokenizer pass shared by all extractors)
+    report = extract_report(combined_text)
 
     # Optionally extract PREVIOUS to populate "Previous" values
-    prev_maturity_map = {}
-    prev_tech_map = {}
     if args.previous:
         prev_text = read_file(args.previous)
         if prev_text:
-            prev_maturity = extract_platform_entries(prev_text)
-            prev_tech = extract_technical_scores(prev_text)
+            prev_sections = index_sections(prev_text)
             # Map by title / area for quick lookups
-            prev_maturity_map = _map_by_key(prev_maturity, "title")
-            prev_tech_map = _map_by_key(prev_tech, "area")
-
-    # Write normalized report.txt with optional previous values filled
-    with open(REPORT_PATH, "w", encoding="utf-8") as f:
-        # --- Technical Overview (per-rubric maturity cards)
-        f.write("## Technical Overview\n\n")
-        for entry in cur_maturity:
-            # If we have a previous version, use its CURRENT score as the "Previous Score" for this title
-            if prev_maturity_map:
-                prev = prev_maturity_map.get(entry["title"])
-                if prev:
-                    # entry fields are from extract_platform_entries:
-                    #   previous_score, current_score, target_score
-                    entry = dict(entry)  # shallow copy
-                    entry["previous_score"] = prev["current_score"]
-            print(f"Main: Writing entry: {entry['title']}")
-            write_entry(f, entry)
-
-        # --- Technical Focus Area Scores (0–2)
-        f.write("## Technical Focus Area Scores\n\n")
-        for entry in cur_tech:
-            if prev_tech_map:
-                prev = prev_tech_map.get(entry["area"])
-                if prev:
-                    entry = dict(entry)
-                    entry["previous"] = prev["score"]
-            write_entry(f, entry, is_tech=True)
-
-        # --- Critical Risks (unchanged)
-        f.write("## Critical Risks\n\n")
-        for risk in cur_risks:
-            f.write(f"Title: {risk['title']}\n")
-            f.write(f"Business Impact: {risk['business_impact']}\n")
-            f.write("Solution:\n")
-            f.write(f"- Immediate: {risk['solution']['immediate']}\n")
-            f.write(f"- Short-term: {risk['solution']['short_term']}\n")
-            f.write(f"- Long-term: {risk['solution']['long_term']}\n\n")
-
-        # --- Compliance Posture (unchanged)
-        if cur_compliance:
-            f.write("## Compliance Posture\n\n")
-            f.write(f"Overall Compliance Score: {cur_compliance['score']}\n")
-            f.write(f"Description: {cur_compliance['description']}\n\n")
-
-        # --- Final Maturity Scores (unchanged; "Overall" line chart uses quarters dynamically)
-        if cur_final:
-            f.write("## Final Maturity Scores\n\n")
-            for entry in cur_final:
-                write_final_maturity_entry(f, entry)
-
-    print(
-        f"✅ Generated report.txt with {len(cur_maturity)} technical overview entries, "
-        f"{len(cur_tech)} technical scores, {len(cur_risks)} critical risks, "
-        f"{'compliance posture, ' if cur_compliance else ''}"
-        f"and {len(cur_final)} final maturity scores."
-    )
-
-    # Re-parse normalized file and run the Dash app
-    maturity_data, technical_data, _, final_maturity_scores = parse_report_file(REPORT_PATH)
-    app = create_dash_app(maturity_data, technical_data, cur_risks, final_maturity_scores)
+            prev_maturity_map = _map_by_key(extract_platform_entries(prev_text, prev_sections), "title")
+            prev_tech_map = _map_by_key(extract_technical_scores(prev_text, prev_sections), "area")
+            report = replace(
+                report,
+                maturity=_with_previous(report.maturity, prev_maturity_map, "title"),
+                technical=_with_previous(report.technical, prev_tech_map, "area"),
+            )
+
+    # Record this assessment; without -p, "Previous" values are one indexed lookup in the history
+    benchmark = None
+    if args.benchmark and not args.client:
+        print("⚠️ --benchmark needs --client; skipping the Portfolio Benchmark section.")
+    if args.client:
+        with AssessmentHistory(args.history) as history:
+            if not args.previous:
+                report = history.apply_previous(report, args.client, args.date)
+            history.save(args.client, args.date, report, source=args.current)
+            if args.benchmark:
+                benchmark = history.cube.client_view(args.client)
+
+    # Exports are write-only side outputs; the Dash app is built from the same objects in memory
+    export = threading.Thread(
+        target=_export, args=(report, args), name="report-export"
+    )
+    export.start()
+
+    # Printed and static output gets the full, non-interactive layout; the server gets the Technical
+    # Overview filters (answered from one card index) and, with --lazy-cards, lazy cards
+    interactive = not (args.html or args.pdf)
+    card_index = build_card_index(report.maturity) if interactive else None
+    sections = create_report_sections(
+        report.maturity, report.technical, report.critical_risks, report.final_maturity, report.compliance,
+        benchmark=benchmark, client=args.client, svg_charts=args.svg_charts, chart_grid=args.chart_grid,
+        source="report" if interactive else None, card_index=card_index, lazy_cards=args.lazy_cards
+    )
+    app = create_report_app(sections)
+    if interactive:
+        register_card_callbacks(app, lambda source: card_index, args.lazy_cards, args.svg_charts)
+    export.join()
+    if args.html or args.pdf:
+        if args.html:
+            write_static_html(app, args.html)
+        if args.pdf and not _export_pdf(app, sections, args.pdf):
+            raise SystemExit(1)
+        return
     app.run_server(debug=True, dev_tools_ui=False)
 
 
@@ -0,0 +1,74 @@
+"""Print portfolio statistics over every assessment in the history store.
+
+Run from report_generation/:
+    python3 -m scripts.portfolio
+    python3 -m scripts.portfolio --client acme --cohorts data/cohorts.csv
+"""
+import argparse
+import csv
+import time
+
+import numpy as np
+
+from src.config import HISTORY_DB_PATH
+from src.history import AssessmentHistory
+from src.portfolio import Portfolio, PERCENTILES
+
+
+def _row(label, values, fmt="{:>8.1f}"):
+    return f"  {label:<32}" + "".join("     n/a" if np.isnan(v) else fmt.format(v) for v in values)
+
+
+def load_cohorts(path):
+    """{client: cohort} from a two-column CSV (client,cohort)."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return {row[0].strip(): row[1].strip() for row in csv.reader(f) if len(row) >= 2}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score distributions across all clients' latest assessments.")
+    parser.add_argument("--history", default=HISTORY_DB_PATH, help=f"History database (default: {HISTORY_DB_PATH})")
+    parser.add_argument("--client", default=None, help="Also show where this client ranks (percentile per rubric/area)")
+    parser.add_argument("--cohorts", default=None, help="CSV of client,cohort rows; prints the mean scores per cohort")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with AssessmentHistory(args.history) as history:
+        portfolio = Portfolio.from_history(history)
+    loaded = time.perf_counter()
+    if not len(portfolio):
+        print(f"❌ No assessments in {args.history}")
+        return
+
+    print(f"{int(portfolio.latest.sum())} clients, {len(portfolio)} assessments")
+    for kind, title in (("final", "Final Maturity Scores (%)"), ("technical", "Technical Focus Area Scores (0–2)")):
+        columns = portfolio.columns(kind)
+        distribution = portfolio.distribution(kind)
+        percentiles = portfolio.percentiles(kind)
+        deltas = portfolio.deltas(kind)[portfolio.latest]
+        print(f"\n{title}")
+        print(f"  {'':<32}" + "".join(f"{label:>8}" for label in ["mean"] + [f"p{q}" for q in PERCENTILES] + ["Δ prev"]))
+        for i, column in enumerate(columns):
+            mean_delta = np.nanmean(deltas[:, i]) if np.any(~np.isnan(deltas[:, i])) else np.nan
+            print(_row(column, [distribution["mean"][i], *percentiles[:, i], mean_delta]))
+
+        if args.client:
+            ranks = portfolio.percentile_ranks(kind, args.client)
+            if ranks is None:
+                print(f"  ❌ {args.client} has no assessments.")
+            else:
+                print(f"  {args.client} percentile vs other clients:")
+                for column, rank in zip(columns, ranks):
+                    print(_row(column, [rank]))
+
+        if args.cohorts:
+            for cohort, means in portfolio.cohort_means(kind, load_cohorts(args.cohorts)).items():
+                print(f"  Cohort {cohort}:")
+                for column, mean in zip(columns, means):
+                    print(_row(column, [mean]))
+
+    print(f"\nLoaded in {(loaded - start) * 1000:.0f} ms, analysed in {(time.perf_counter() - loaded) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Render every chart of one or more combined reports to SVG files, in a process pool.
+
+Writes <output>/<report name>/maturity-NN.svg (one per Technical Overview card),
+final_maturity.svg and overall.svg, and prints the render time.
+
+Run from report_generation/:
+    python3 -m scripts.render_charts
+    python3 -m scripts.render_charts -c data/combined_report.md data/previous_report.md --workers 4
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+from pathlib import Path
+
+from src.chart_generation import get_month_labels, get_current_quarter_and_target
+from src.config import COMBINED_REPORT_PATH, CHARTS_DIR
+from src.data_extraction import extract_report
+from src.svg_charts import render_svgs
+from src.utils import read_file
+
+
+def chart_jobs(report):
+    """[(file name, (kind, args))] for every chart in the report, with labels resolved once."""
+    labels = tuple(get_month_labels())
+    quarters = get_current_quarter_and_target()
+    jobs = [
+        (f"maturity-{i:02d}.svg", ("maturity", (item.scores, item.prev_score_missing, labels)))
+        for i, item in enumerate(report.maturity, 1)
+    ]
+    rubrics = [score for score in report.final_maturity if score.rubric != "Overall"]
+    if rubrics:
+        jobs.append(("final_maturity.svg", ("final_maturity", (rubrics,))))
+    overall = next((score for score in report.final_maturity if score.rubric == "Overall"), None)
+    if overall:
+        jobs.append(("overall.svg", ("single_maturity", (overall, 450, quarters))))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render report charts to SVG without Plotly or a browser.")
+    parser.add_argument("-c", "--current", nargs="+", default=[COMBINED_REPORT_PATH],
+                        help=f"Combined report(s) to render (default: {COMBINED_REPORT_PATH})")
+    parser.add_argument("-o", "--output", default=CHARTS_DIR, help=f"Output directory (default: {CHARTS_DIR})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Render processes (default: one per CPU; 1 renders in-process)")
+    args = parser.parse_args()
+
+    paths, jobs = [], []
+    for source in args.current:
+        text = read_file(source)
+        if not text:
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = extract_report(text)
+        for name, job in chart_jobs(report):
+            paths.append(Path(args.output) / Path(source).stem / name)
+            jobs.append(job)
+    if not jobs:
+        print("❌ No charts to render.")
+        return
+
+    start = time.perf_counter()
+    svgs = render_svgs(jobs, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    for path, svg in zip(paths, svgs):
+        os.makedirs(path.parent, exist_ok=True)
+        path.write_text(svg, encoding="utf-8")
+    print(f"✅ Rendered {len(svgs)} charts in {elapsed * 1000:.1f} ms into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
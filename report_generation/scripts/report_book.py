@@ -0,0 +1,125 @@
+"""Compile many client reports to PDF in one browser session: the portfolio "report book".
+
+Each combined report is turned into its static HTML page (no Dash server), written next to one
+shared plotly.min.js, and all pages are printed through a single headless Chromium: the running
+browser daemon (export_pdf.py --serve) if there is one, else one launched for the batch, with
+--pages reports printing concurrently. Writes <output>/<report name>.pdf per report (deduplicated
+and recompressed by src.pdf_optimize) and, with
+--merge, one bound PDF with a bookmark per report in which identical objects (embedded fonts,
+images) are stored once. Logs throughput in reports per minute.
+
+Run from report_generation/:
+    python3 -m scripts.report_book -c data/clients/*.md
+    python3 -m scripts.report_book -c data/clients/*.md --pages 6 --merge data/output/book/portfolio.pdf
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import time
+from pathlib import Path
+
+from pypdf import PdfWriter
+
+from src.browser_pool import export_pdfs
+from src.config import COMBINED_REPORT_PATH, REPORT_BOOK_DIR, BROWSER_ENDPOINT_PATH
+from src.data_extraction import extract_report
+from src.document_creation import create_dash_app
+from src.pdf_optimize import optimize_pdf, optimize_writer
+from src.static_html import render_static_html, write_plotlyjs
+from src.utils import read_file
+
+PLOTLYJS_NAME = "plotly.min.js"
+
+
+def report_names(paths):
+    """Unique output names from the report file names (report, report-2, ... on clashes)."""
+    names, seen = [], {}
+    for path in paths:
+        stem = Path(path).stem
+        seen[stem] = seen.get(stem, 0) + 1
+        names.append(stem if seen[stem] == 1 else f"{stem}-{seen[stem]}")
+    return names
+
+
+def write_pages(sources, html_dir, svg_charts=False, chart_grid=False):
+    """Write each report's static HTML page into html_dir; returns [(name, html path)] for the readable ones."""
+    os.makedirs(html_dir, exist_ok=True)
+    write_plotlyjs(os.path.join(html_dir, PLOTLYJS_NAME))
+    pages = []
+    for source, name in zip(sources, report_names(sources)):
+        text = read_file(source)
+        if not text:
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = extract_report(text)
+        app = create_dash_app(report.maturity, report.technical, report.critical_risks, report.final_maturity,
+                              report.compliance, svg_charts=svg_charts, chart_grid=chart_grid)
+        path = os.path.join(html_dir, f"{name}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render_static_html(app, include_plotlyjs=PLOTLYJS_NAME))
+        pages.append((name, path))
+    return pages
+
+
+def merge_book(pdfs, output):
+    """Bind [(name, pdf path)] into output with a bookmark per report; returns (bytes before, bytes after dedup)."""
+    writer = PdfWriter()
+    for name, path in pdfs:
+        writer.append(path, outline_item=name)
+    before = sum(os.path.getsize(path) for _, path in pdfs)
+    optimize_writer(writer)     # one copy of identical fonts, images and other objects
+    with open(output, "wb") as f:
+        writer.write(f)
+    return before, os.path.getsize(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print many combined reports to PDF through one shared browser.")
+    parser.add_argument("-c", "--current", nargs="+", default=[COMBINED_REPORT_PATH],
+                        help=f"Combined reports to print (default: {COMBINED_REPORT_PATH})")
+    parser.add_argument("-o", "--output", default=REPORT_BOOK_DIR, help=f"Output directory (default: {REPORT_BOOK_DIR})")
+    parser.add_argument("--pages", type=int, default=4, help="Reports printed concurrently (default: 4)")
+    parser.add_argument("--max-uses", type=int, default=50, help="Reports per browser page before it is replaced (default: 50)")
+    parser.add_argument("--merge", metavar="PATH", help="Also bind every report into one PDF at PATH")
+    parser.add_argument("--svg-charts", action="store_true", help="Draw the charts as static SVG (no plotly.js to run)")
+    parser.add_argument("--chart-grid", action="store_true", help="One subplot-grid figure for the Technical Overview")
+    parser.add_argument("--no-daemon", action="store_true", help="Always launch a browser, even if a daemon is running")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pages = write_pages(args.current, os.path.join(args.output, "html"), args.svg_charts, args.chart_grid)
+    if not pages:
+        print("❌ No reports to print.")
+        raise SystemExit(1)
+    rendered = time.perf_counter()
+    print(f"✅ Rendered {len(pages)} static pages in {rendered - start:.1f}s")
+
+    jobs = [(path, os.path.join(args.output, f"{name}.pdf")) for name, path in pages]
+    results = asyncio.run(export_pdfs(jobs, pages=args.pages, max_uses=args.max_uses,
+                                      endpoint_path=BROWSER_ENDPOINT_PATH, use_daemon=not args.no_daemon))
+    elapsed = time.perf_counter() - start
+    printed = []
+    for (name, _), (_, pdf), result in zip(pages, jobs, results):
+        if isinstance(result, BaseException):
+            print(f"❌ {name}: {result}")
+        else:
+            printed.append((name, pdf))
+    print(f"✅ Printed {len(printed)}/{len(jobs)} reports into {args.output} in {elapsed:.1f}s "
+          f"({len(printed) / elapsed * 60:.1f} reports/min; printing {time.perf_counter() - rendered:.1f}s)")
+
+    if printed:
+        stats = [optimize_pdf(pdf) for _, pdf in printed]
+        print(f"✅ Optimised the report PDFs: {sum(s.before for s in stats) / 1024:.0f} KB -> "
+              f"{sum(s.after for s in stats) / 1024:.0f} KB, {sum(s.images for s in stats)} raster images")
+    if args.merge and printed:
+        before, after = merge_book(printed, args.merge)
+        print(f"✅ Bound {len(printed)} reports into {args.merge}: {after / 1024:.0f} KB "
+              f"({before / 1024:.0f} KB as separate files)")
+    if len(printed) < len(jobs):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
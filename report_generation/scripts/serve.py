@@ -0,0 +1,65 @@
+"""Serve every report from one Dash app (src/report_server.py) under a multi-worker WSGI server.
+
+Runs gunicorn with --workers processes (each keeps its own layout cache) and Dash's debug
+machinery off: no reloader process, no file watchers, no dev tools. Without gunicorn (e.g. on
+Windows) it falls back to a single threaded Werkzeug server.
+
+Run from report_generation/:
+    python3 -m scripts.serve --workers 4
+    python3 -m scripts.serve --reports data/reports --history data/output/history.sqlite3 --port 8050
+    gunicorn -w 4 -b 0.0.0.0:8050 'src.report_server:wsgi_app()'     # same app, gunicorn CLI
+"""
+import argparse
+import os
+
+from src.config import HISTORY_DB_PATH, REPORTS_DIR
+from src.report_server import LAYOUT_CACHE_SIZE, create_report_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve all reports from one production Dash app.")
+    parser.add_argument("--reports", default=REPORTS_DIR, help=f"Directory of combined reports served at /reports/<name> (default: {REPORTS_DIR})")
+    parser.add_argument("--history", default=HISTORY_DB_PATH, help=f"History store served at /clients/<client> (default: {HISTORY_DB_PATH})")
+    parser.add_argument("--host", default=os.environ.get("HOST", "127.0.0.1"), help="Bind address (default: $HOST or 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8050)), help="Port (default: $PORT or 8050)")
+    parser.add_argument("--workers", type=int, default=(os.cpu_count() or 1) * 2 + 1,
+                        help="gunicorn worker processes (default: 2 x CPUs + 1)")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per worker (default: 4)")
+    parser.add_argument("--cache-size", type=int, default=LAYOUT_CACHE_SIZE,
+                        help=f"Report layouts cached per worker (default: {LAYOUT_CACHE_SIZE})")
+    parser.add_argument("--lazy-cards", type=int, metavar="N",
+                        help="Only the first N Technical Overview cards in the initial page, the rest loaded on scroll "
+                             "(add ?full=1 to a report URL for every card, e.g. to print it)")
+    parser.add_argument("--svg-charts", action="store_true", help="Draw the charts as static SVG")
+    parser.add_argument("--chart-grid", action="store_true", help="One subplot-grid figure for the Technical Overview")
+    args = parser.parse_args()
+
+    def load():
+        return create_report_server(args.reports, args.history, args.svg_charts, args.chart_grid, args.cache_size,
+                                    args.lazy_cards).server
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        from werkzeug.serving import run_simple
+
+        print("⚠️ gunicorn is not installed; serving from one threaded Werkzeug process.")
+        run_simple(args.host, args.port, load(), threaded=True)
+        return
+
+    class ReportApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{args.host}:{args.port}")
+            self.cfg.set("workers", args.workers)
+            self.cfg.set("threads", args.threads)
+            self.cfg.set("worker_class", "gthread")
+
+        def load(self):
+            return load()
+
+    print(f"✅ Serving reports on http://{args.host}:{args.port} ({args.workers} workers x {args.threads} threads)")
+    ReportApplication().run()
+
+
+if __name__ == "__main__":
+    main()
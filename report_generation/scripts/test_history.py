@@ -0,0 +1,148 @@
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+from dataclasses import replace
+
+from src.config import COMBINED_REPORT_PATH, INPUT_DIR
+from src.data_extraction import extract_report
+from src.history import AssessmentHistory, history_key
+from src.utils import read_file
+
+PREVIOUS_REPORT_PATH = f"{INPUT_DIR}/previous_report.md"
+CLIENT = "Acme Corp"
+OTHER_CLIENT = "Globex"
+PREVIOUS_DATE, CURRENT_DATE = "2025-10-01", "2026-10-01"
+
+
+def _extract(path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return extract_report(read_file(path))
+
+
+@contextlib.contextmanager
+def _history(*saves, client=CLIENT):
+    """A history store in a temporary directory holding the (date, report) saves for client, or (client, date, report)."""
+    with tempfile.TemporaryDirectory() as workdir:
+        with AssessmentHistory(os.path.join(workdir, "history.sqlite3")) as history, \
+                contextlib.redirect_stdout(io.StringIO()):
+            for save in saves:
+                history.save(*(save if len(save) == 3 else (client, *save)))
+        with AssessmentHistory(os.path.join(workdir, "history.sqlite3")) as history:
+            yield history
+
+
+def test_save_round_trip():
+    # A saved assessment reloads field for field, and saving the same date again replaces it
+    previous, current = _extract(PREVIOUS_REPORT_PATH), _extract(COMBINED_REPORT_PATH)
+    with _history((PREVIOUS_DATE, current), (PREVIOUS_DATE, previous), (CURRENT_DATE, current)) as history:
+        dates = history.assessment_dates(CLIENT)
+        with contextlib.redirect_stdout(io.StringIO()):
+            reloaded = history.load(CLIENT, PREVIOUS_DATE)
+        missing = history.load(CLIENT, "2024-01-01")
+    if dates != [PREVIOUS_DATE, CURRENT_DATE]:
+        print(f"❌ Stored assessment dates {dates}; expected {[PREVIOUS_DATE, CURRENT_DATE]}")
+        return False
+    if reloaded != previous or missing is not None:
+        print(f"❌ {PREVIOUS_DATE} did not reload as saved (or a missing date loaded: {missing})")
+        return False
+    print(f"✅ Saved assessments reload unchanged ({len(previous.maturity)} maturity items, "
+          f"{len(previous.technical)} technical scores); re-saving a date replaces it.")
+    return True
+
+
+def test_previous_deltas():
+    # "Previous" scores come from the latest earlier assessment, matched on case/whitespace-insensitive keys
+    previous, current = _extract(PREVIOUS_REPORT_PATH), _extract(COMBINED_REPORT_PATH)
+    renamed = replace(current, maturity=[replace(current.maturity[0], title=f"  {current.maturity[0].title.upper()} ")]
+                      + current.maturity[1:])
+    with _history((PREVIOUS_DATE, previous), (CURRENT_DATE, current)) as history:
+        applied = history.apply_previous(renamed, CLIENT, CURRENT_DATE)
+        reloaded = history.load(CLIENT, CURRENT_DATE)
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = history.apply_previous(previous, CLIENT, PREVIOUS_DATE)
+
+    expected = {history_key(item.title): item.current for item in previous.maturity}
+    expected_technical = {history_key(item.area): item.current for item in previous.technical}
+    # Every item of the fixture also appears in the previous report, so every one must be filled
+    wrong = [item.title for item in applied.maturity if item.previous is None
+             or item.previous != expected.get(history_key(item.title))]
+    wrong += [item.area for item in applied.technical if item.previous is None
+              or item.previous != expected_technical.get(history_key(item.area))]
+    if wrong:
+        print(f"❌ Wrong previous scores for: {', '.join(wrong)}")
+        return False
+    if [item.previous for item in reloaded.maturity] != [item.previous for item in applied.maturity]:
+        print(f"❌ load({CURRENT_DATE}) did not fill the same previous scores as apply_previous")
+        return False
+    if any(item.previous is not None for item in first.maturity + first.technical):
+        print("❌ The first assessment got previous scores")
+        return False
+    deltas = [item.current - item.previous for item in applied.maturity]
+    print(f"✅ Previous scores filled for {len(applied.maturity)} maturity items and {len(applied.technical)} "
+          f"technical scores (deltas {min(deltas):+.1f} to {max(deltas):+.1f}); none before the first assessment.")
+    return True
+
+
+def _searchable(report):
+    """(kind, title, text) of every passage the full-text index holds for a report."""
+    passages = [("finding", item.title, item.findings) for item in report.maturity]
+    for risk in report.critical_risks:
+        solution = risk.solution
+        passages += [("business_impact", risk.title, risk.business_impact),
+                     ("solution", risk.title, f"{solution.immediate} {solution.short_term} {solution.long_term}")]
+    return passages
+
+
+def test_search():
+    # FTS5 hits are exactly the passages containing the (stemmed) words, filtered by client and kind
+    previous, current = _extract(PREVIOUS_REPORT_PATH), _extract(COMBINED_REPORT_PATH)
+    reports = {CLIENT: previous, OTHER_CLIENT: current}
+    # Saving CLIENT's date twice must replace its indexed passages, not add a second copy
+    with _history((CLIENT, PREVIOUS_DATE, current), (CLIENT, PREVIOUS_DATE, previous),
+                  (OTHER_CLIENT, CURRENT_DATE, current)) as history:
+        if not history.searchable:
+            print("⚠️ This SQLite build has no FTS5; skipping the search check.")
+            return True
+        hits = history.search("backups", limit=100)
+        one_client = history.search("backup", client=OTHER_CLIENT, limit=100)
+        solutions = history.search("backup", kinds=["solution"], limit=100)
+        phrase = history.search("disaster recovery", limit=100)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            punctuated = history.search("BCDR? Deficiencies", limit=100)
+        none = history.search("zyxwvut", limit=100)
+        either = history.search("zyxwvut OR backup", raw=True, limit=100)
+
+    backup = re.compile(r"\bbackups?\b", re.IGNORECASE)
+    expected = sorted((client, kind, title) for client, report in reports.items()
+                      for kind, title, text in _searchable(report) if backup.search(text))
+    found = sorted((hit.client, hit.kind, hit.title) for hit in hits)
+    if not expected or found != expected:
+        print(f"❌ search('backups') found {found}; expected {expected}")
+        return False
+    if not all("[" in hit.snippet and "]" in hit.snippet for hit in hits):
+        print("❌ Search snippets do not mark the matched words")
+        return False
+    if sorted((h.client, h.kind, h.title) for h in one_client) != [e for e in expected if e[0] == OTHER_CLIENT] \
+            or sorted((h.client, h.kind, h.title) for h in solutions) != [e for e in expected if e[1] == "solution"]:
+        print("❌ The client or kind filter returned other passages")
+        return False
+    if not phrase or not all(re.search(r"disaster", h.title + h.snippet, re.IGNORECASE) for h in phrase):
+        print(f"❌ search('disaster recovery') returned {len(phrase)} unrelated or no hits")
+        return False
+    if none or sorted((h.client, h.kind, h.title) for h in either) != expected:
+        print(f"❌ A term that matches nothing returned {len(none)} hits; raw OR returned {len(either)}")
+        return False
+    if not punctuated or "Invalid search query" in output.getvalue():
+        print(f"❌ search('BCDR? Deficiencies') failed: {output.getvalue().strip() or 'no hits'}")
+        return False
+    print(f"✅ Full-text search: 'backups' finds the {len(expected)} passages mentioning backup(s), filters by client "
+          f"and kind; 'zyxwvut' finds nothing; punctuation in plain queries is not FTS syntax.")
+    return True
+
+
+if __name__ == "__main__":
+    if not all([test_save_round_trip(), test_previous_deltas(), test_search()]):
+        sys.exit(1)
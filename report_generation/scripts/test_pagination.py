@@ -0,0 +1,102 @@
+import contextlib
+import io
+import sys
+
+from dash import html
+
+from src.config import COMBINED_REPORT_PATH
+from src.data_extraction import extract_report
+from src.document_creation import create_report_sections, report_layout
+from src.pagination import paginate
+from src.technical_overview import LOAD_MORE_ID, MORE_CARDS_ID
+from src.utils import read_file
+
+
+def _ids(component):
+    """Every component id in a layout tree."""
+    if isinstance(component, (list, tuple)):
+        return [i for child in component for i in _ids(child)]
+    if not hasattr(component, "to_plotly_json"):
+        return []
+    own = [component.id] if getattr(component, "id", None) is not None else []
+    return own + _ids(getattr(component, "children", None))
+
+
+def _table(rows):
+    header = html.Tr([html.Th("Area"), html.Th("Score")])
+    return html.Table([header] + [html.Tr([html.Td(f"Row {i}"), html.Td(str(i))]) for i in range(rows)])
+
+
+def test_table_split():
+    # A table taller than the page splits between rows, each part repeating the header row
+    pages = paginate([_table(200)])
+    parts = [block for page in pages for block in page]
+    headers = [part.children[0].children[0].children for part in parts]
+    rows = [row.children[0].children for part in parts for row in part.children[1:]]
+    if len(parts) < 2 or any(type(part).__name__ != "Table" for part in parts):
+        print(f"❌ A 200-row table paginated into {len(parts)} parts over {len(pages)} pages")
+        return False
+    if headers != ["Area"] * len(parts) or rows != [f"Row {i}" for i in range(200)]:
+        print(f"❌ Split table parts lost their header or rows: headers {headers}, {len(rows)} rows")
+        return False
+    print(f"✅ A 200-row table splits into {len(parts)} parts, each with its header, all rows in order.")
+    return True
+
+
+def test_heading_carry():
+    # A heading at the bottom of a full page moves to the next page with the block it introduces
+    filler, heading, block = html.Div(style={"height": "900px"}), html.H2("Findings"), html.Div(style={"height": "300px"})
+    pages = paginate([filler, heading, block])
+    if [len(page) for page in pages] != [1, 2] or pages[1][0] is not heading:
+        print(f"❌ Heading carry-over: pages hold {[[type(b).__name__ for b in page] for page in pages]}")
+        return False
+    print("✅ A trailing heading starts the next page with the block it introduces.")
+    return True
+
+
+def test_page_break_before():
+    # pageBreakBefore: always starts a new page even when the block would fit
+    breaking = html.Div("Next section", style={"pageBreakBefore": "always"})
+    pages = paginate([html.P("Short"), breaking, html.P("After")])
+    if len(pages) != 2 or pages[1][0] is not breaking:
+        print(f"❌ pageBreakBefore: {len(pages)} pages, second starts with {pages[1][0] if len(pages) > 1 else None}")
+        return False
+    print("✅ pageBreakBefore: always starts a new page.")
+    return True
+
+
+def test_id_containers_kept():
+    # Unstyled wrappers are opened into their blocks; a div with an id (a callback target) stays whole
+    target = html.Div(id="more", children=[])
+    wrapped = [html.P("One"), html.P("Two")]
+    pages = paginate([target, html.Div(children=wrapped)])
+    blocks = [block for page in pages for block in page]
+    if len(blocks) != 3 or any(got is not want for got, want in zip(blocks, [target, *wrapped])):
+        print(f"❌ Paginated blocks: {[getattr(b, 'id', None) or type(b).__name__ for b in blocks]}")
+        return False
+    print("✅ Unstyled wrappers are opened; the empty div with an id is kept.")
+    return True
+
+
+def test_callback_targets_kept():
+    # The lazy cards' empty container is a callback output: paginating must not unwrap it
+    text = read_file(COMBINED_REPORT_PATH)
+    if not text:
+        return False
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = extract_report(text)
+    sections = create_report_sections(report.maturity, report.technical, report.critical_risks, report.final_maturity,
+                                      report.compliance, source="report", lazy_cards=2)
+    ids = _ids(report_layout([component for children in sections.values() for component in children]))
+    missing = [i for i in (MORE_CARDS_ID, LOAD_MORE_ID) if i not in ids]
+    if missing:
+        print(f"❌ report_layout dropped the lazy card ids: {', '.join(missing)}")
+        return False
+    print(f"✅ report_layout keeps {MORE_CARDS_ID} and {LOAD_MORE_ID} in the lazy layout.")
+    return True
+
+
+if __name__ == "__main__":
+    if not all([test_table_split(), test_heading_carry(), test_page_break_before(), test_id_containers_kept(),
+                test_callback_targets_kept()]):
+        sys.exit(1)
@@ -0,0 +1,228 @@
+"""End-to-end PDF export checks in headless Chromium (needs pyppeteer; skipped without it).
+
+Run from report_generation/:
+    python3 -m scripts.test_pdf_export
+"""
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from pypdf import PdfReader
+
+from src.config import COMBINED_REPORT_PATH, INPUT_DIR
+from src.data_extraction import extract_report
+from src.document_creation import create_dash_app, create_report_app, create_report_sections
+from src.static_html import render_static_html
+from src.utils import read_file
+
+DAEMON_START_TIMEOUT = 60       # seconds for export_pdf.py --serve to publish its endpoint
+BOOK_REPORTS = [COMBINED_REPORT_PATH, f"{INPUT_DIR}/previous_report.md"]
+
+
+def _report():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return extract_report(read_file(COMBINED_REPORT_PATH))
+
+
+def _report_html():
+    """The combined report as one static HTML document, with its number of .report-page containers."""
+    report = _report()
+    app = create_dash_app(report.maturity, report.technical, report.critical_risks, report.final_maturity,
+                          report.compliance)
+    html = render_static_html(app)
+    return html, html.count('class="report-page"')
+
+
+def _pdf_pages(path):
+    return len(PdfReader(path).pages)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _pooled_export(html, workdir):
+    from src.browser_pool import PagePool, export_many, launch_browser, load, wait_until_ready
+
+    browser = await launch_browser()
+    try:
+        # max_uses=1 replaces every page after its job, so the replacement path runs too
+        pool = await PagePool(browser, 2, max_uses=1).start()
+        async with pool.lease() as page:
+            await load(page, html)
+            await wait_until_ready(page)
+            drawn = await page.evaluate(
+                '() => [Array.from(document.querySelectorAll(".js-plotly-plot"))'
+                '.filter(gd => gd._fullLayout && gd.querySelector(".main-svg")).length, '
+                'Number(document.querySelector("[data-graphs]").getAttribute("data-graphs"))]')
+        path = os.path.join(workdir, "report.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        jobs = [(html, os.path.join(workdir, "string.pdf")), (path, os.path.join(workdir, "file.pdf"))]
+        results = await export_many(pool, jobs)
+        await pool.close()
+        return drawn, jobs, results, pool.recycled
+    finally:
+        await browser.close()
+
+
+def test_pooled_export():
+    # Pooled pages: setContent and file:// sources, the readiness wait and page replacement
+    html, containers = _report_html()
+    with tempfile.TemporaryDirectory() as workdir:
+        (graphs, expected), jobs, results, recycled = asyncio.run(_pooled_export(html, workdir))
+        if graphs != expected:
+            print(f"❌ window.reportReady was set with {graphs} of {expected} graphs drawn")
+            return False
+        failed = [f"{source[:40]!r}: {result}" for (source, _), result in zip(jobs, results)
+                  if isinstance(result, BaseException)]
+        if failed:
+            print(f"❌ Pooled exports failed: {'; '.join(failed)}")
+            return False
+        pages = [_pdf_pages(output) for _, output in jobs]
+        if min(pages) < containers:
+            print(f"❌ Pooled exports have {pages} pages; the layout has {containers} .report-page containers")
+            return False
+    print(f"✅ Pooled export: reportReady after all {expected} graphs drew; HTML string and file printed "
+          f"{pages[0]} pages each; {recycled} pages replaced.")
+    return True
+
+
+async def _daemon_jobs(endpoint, jobs):
+    from src.browser_pool import daemon_alive, daemon_endpoint, export_pdfs
+
+    port, _ = daemon_endpoint(endpoint)
+    alive = bool(port) and await daemon_alive(port)
+    return alive, await export_pdfs(jobs, endpoint_path=endpoint)
+
+
+@contextlib.contextmanager
+def _daemon(output_dir):
+    """Run export_pdf.py --serve writing under output_dir; yields its endpoint file, or None if it did not start."""
+    endpoint = os.path.join(output_dir, "browser.json")
+    daemon = subprocess.Popen([sys.executable, "export_pdf.py", "--serve", "--pages", "2",
+                               "--port", str(_free_port()), "--output-dir", output_dir, "--endpoint", endpoint],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT
+        while not os.path.exists(endpoint) and daemon.poll() is None and time.monotonic() < deadline:
+            time.sleep(0.2)
+        yield endpoint if os.path.exists(endpoint) else None
+    finally:
+        daemon.terminate()
+        daemon.wait(timeout=30)
+
+
+def test_daemon_export():
+    # export_pdf.py --serve: jobs run through its warm pool; outputs outside --output-dir are refused
+    html, containers = _report_html()
+    with tempfile.TemporaryDirectory() as workdir, tempfile.TemporaryDirectory() as elsewhere, \
+            _daemon(workdir) as endpoint:
+        if endpoint is None:
+            print("❌ The browser daemon did not publish its endpoint")
+            return False
+        mode = os.stat(endpoint).st_mode & 0o777
+        with open(endpoint, encoding="utf-8") as f:
+            token = json.load(f).get("token")
+        inside, outside = os.path.join(workdir, "daemon.pdf"), os.path.join(elsewhere, "daemon.pdf")
+        alive, results = asyncio.run(_daemon_jobs(endpoint, [(html, inside), (html, outside)]))
+        if not alive or mode != 0o600 or not token:
+            print(f"❌ Daemon endpoint: answering={alive}, mode={oct(mode)}, token={'set' if token else 'missing'}")
+            return False
+        if isinstance(results[0], BaseException):
+            print(f"❌ Daemon export failed: {results[0]}")
+            return False
+        pages = _pdf_pages(inside)
+        if pages < containers:
+            print(f"❌ The daemon's PDF has {pages} pages; the layout has {containers} .report-page containers")
+            return False
+        if not isinstance(results[1], BaseException) or os.path.exists(outside):
+            print(f"❌ The daemon wrote {outside}, outside its --output-dir")
+            return False
+    print(f"✅ Daemon export: printed {pages} pages inside --output-dir through the warm pool and refused "
+          f"an output outside it ({results[1]}).")
+    return True
+
+
+def test_fragment_export():
+    # Sections print as cached fragments, then assemble with one bookmark per section and page numbers
+    from src.pdf_fragments import export_sectioned_pdf
+
+    report = _report()
+    sections = create_report_sections(report.maturity, report.technical, report.critical_risks, report.final_maturity,
+                                      report.compliance)
+    app = create_report_app(sections)
+    with tempfile.TemporaryDirectory() as workdir:
+        cache_dir, output = os.path.join(workdir, "fragments"), os.path.join(workdir, "report.pdf")
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = asyncio.run(export_sectioned_pdf(app, sections, output, cache_dir))
+            second = asyncio.run(export_sectioned_pdf(app, sections, output, cache_dir))
+        reader = PdfReader(output)
+        titles = [item.title for item in reader.outline]
+        total = len(reader.pages)
+        numbers = [reader.pages[i].extract_text().strip().endswith(f"{i + 1} / {total}") for i in (0, total - 1)]
+    if first != (len(sections), 0) or second != (0, len(sections)):
+        print(f"❌ Fragments (rendered, cached): first export {first}, second {second}; expected "
+              f"{(len(sections), 0)} then {(0, len(sections))}")
+        return False
+    if titles != list(sections) or not all(numbers):
+        print(f"❌ Assembled PDF: bookmarks {titles}, page numbers stamped on first/last page: {numbers}")
+        return False
+    print(f"✅ Fragment export: {len(sections)} sections rendered, then all cached; {total} pages bookmarked "
+          f"{', '.join(titles)} and numbered.")
+    return True
+
+
+def test_report_book():
+    # scripts.report_book's static pages print through a daemon, then bind into one deduplicated book
+    from scripts.report_book import merge_book, report_names, write_pages
+    from src.browser_pool import export_pdfs
+    from src.pdf_optimize import optimize_pdf
+
+    sources = BOOK_REPORTS
+    with tempfile.TemporaryDirectory() as workdir, _daemon(workdir) as endpoint:
+        if endpoint is None:
+            print("❌ The browser daemon did not publish its endpoint")
+            return False
+        with contextlib.redirect_stdout(io.StringIO()):
+            pages = write_pages(sources, os.path.join(workdir, "html"))
+        jobs = [(path, os.path.join(workdir, f"{name}.pdf")) for name, path in pages]
+        results = asyncio.run(export_pdfs(jobs, endpoint_path=endpoint))
+        failed = [f"{name}: {result}" for (name, _), result in zip(pages, results) if isinstance(result, BaseException)]
+        if failed:
+            print(f"❌ Report book pages failed to print: {'; '.join(failed)}")
+            return False
+        for _, pdf in jobs:
+            optimize_pdf(pdf)
+        printed = [(name, pdf) for (name, _), (_, pdf) in zip(pages, jobs)]
+        book = os.path.join(workdir, "book.pdf")
+        before, after = merge_book(printed, book)
+        reader = PdfReader(book)
+        titles = [item.title for item in reader.outline]
+        expected_pages = sum(_pdf_pages(pdf) for _, pdf in printed)
+        if titles != report_names(sources) or len(reader.pages) != expected_pages or after >= before:
+            print(f"❌ Report book: bookmarks {titles}, {len(reader.pages)} of {expected_pages} pages, "
+                  f"{after} bytes bound vs {before} as separate files")
+            return False
+    print(f"✅ Report book: {len(printed)} reports printed through the daemon and bound into {expected_pages} pages, "
+          f"{after / 1024:.0f} KB ({before / 1024:.0f} KB as separate files).")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        import pyppeteer  # noqa: F401
+    except ImportError:
+        print("⚠️ pyppeteer is not installed; skipping the PDF export checks.")
+        sys.exit(0)
+    if not all([test_pooled_export(), test_daemon_export(), test_fragment_export(), test_report_book()]):
+        sys.exit(1)
@@ -0,0 +1,91 @@
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+from dataclasses import replace
+
+import numpy as np
+
+from src.config import COMBINED_REPORT_PATH
+from src.data_extraction import extract_report
+from src.history import AssessmentHistory
+from src.portfolio import Portfolio
+from src.utils import read_file
+
+CLIENTS = [f"client-{n}" for n in range(8)]
+DATES = ["2025-04-01", "2025-10-01", "2026-04-01"]
+QUARTILES = (0.25, 0.5, 0.75)
+
+
+def _variant(report, rng):
+    """The report with random scores from small value sets (so clients tie) and sometimes one area left out."""
+    final = [replace(score, current_percent=float(rng.choice([40, 55, 55, 70, 85]))) for score in report.final_maturity]
+    technical = [replace(item, current=rng.choice([0, 1, 1, 2])) for item in report.technical]
+    if rng.random() < 0.3:
+        technical.pop(rng.randrange(len(technical)))
+    return replace(report, final_maturity=final, technical=technical)
+
+
+def _floats(values):
+    return [np.nan if value is None else value for value in values]
+
+
+def _nearest_rank(values, q):
+    return float(np.percentile(values, q * 100, method="inverted_cdf"))
+
+
+def _mismatches(history, client):
+    """Differences between the cube's benchmark rows and the same numbers computed from Portfolio's arrays."""
+    portfolio = Portfolio.from_history(history)
+    view = history.cube.client_view(client)
+    problems = []
+    for kind in ("final", "technical"):
+        columns = portfolio.columns(kind)
+        ranks = portfolio.percentile_ranks(kind, client)
+        values = portfolio.scores[kind].values
+        others = values[portfolio.latest & (portfolio.clients != client)]
+        for row in view[kind]:
+            col = columns.index(row.column)
+            peers = others[:, col][~np.isnan(others[:, col])]
+            expected = (float(ranks[col]) if len(peers) else None,
+                        *(_nearest_rank(peers, q) if len(peers) else None for q in QUARTILES), len(peers))
+            got = (row.percentile, row.p25, row.median, row.p75, row.peers)
+            if not np.allclose(_floats(got), _floats(expected), equal_nan=True):
+                problems.append(f"{client} {row.column}: cube {got}, direct {expected}")
+    return problems
+
+
+def test_cube_matches_portfolio():
+    # Percentiles and quartiles read from the incrementally maintained cube equal the direct computation
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = extract_report(read_file(COMBINED_REPORT_PATH))
+    rng = random.Random(34)
+    with tempfile.TemporaryDirectory() as workdir:
+        with AssessmentHistory(os.path.join(workdir, "history.sqlite3")) as history, \
+                contextlib.redirect_stdout(io.StringIO()):
+            # Dates out of order and re-saves, so refresh_client swaps clients' latest rows both ways
+            for assessed_on in (DATES[1], DATES[0], DATES[2], DATES[2]):
+                for client in CLIENTS[:-1] if assessed_on == DATES[0] else CLIENTS:
+                    history.save(client, assessed_on, _variant(report, rng))
+            incremental = {client: history.cube.client_view(client) for client in CLIENTS}
+            problems = [p for client in CLIENTS for p in _mismatches(history, client)]
+            with history.conn:
+                history.cube.rebuild()
+            rebuilt = {client: history.cube.client_view(client) for client in CLIENTS}
+    if problems:
+        print(f"❌ {len(problems)} benchmark rows differ from the Portfolio computation, e.g. {problems[0]}")
+        return False
+    if incremental != rebuilt:
+        print("❌ The incrementally refreshed cube differs from one rebuilt from scratch")
+        return False
+    rows = sum(len(view["final"]) + len(view["technical"]) for view in incremental.values())
+    print(f"✅ Portfolio cube: percentiles, quartiles and peer counts of {rows} benchmark rows over {len(CLIENTS)} "
+          f"clients equal the direct Portfolio computation, and match a rebuilt cube.")
+    return True
+
+
+if __name__ == "__main__":
+    if not all([test_cube_matches_portfolio()]):
+        sys.exit(1)
@@ -0,0 +1,197 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from src.config import COMBINED_REPORT_PATH, INPUT_DIR
+from src.data_extraction import extract_report
+from src.history import AssessmentHistory
+from src.report_server import ReportServer, create_report_server
+from src.technical_overview import (CARD_TYPE, CARDS_STATE_ID, FILTER_COUNT_ID, HIDDEN_CARD_STYLE, MATURITY_CARD_STYLE,
+                                    PERSONA_FILTER_ID, PRIORITY_FILTER_ID, build_card_index)
+from src.utils import read_file
+
+PREVIOUS_REPORT_PATH = f"{INPUT_DIR}/previous_report.md"
+REPORT_ID = "acme-q1"
+CLIENT, OTHER_CLIENT = "Acme Corp", "Globex"
+PREVIOUS_DATE, CURRENT_DATE = "2025-10-01", "2026-10-01"
+
+
+def _extract(path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return extract_report(read_file(path))
+
+
+@contextlib.contextmanager
+def _store():
+    """(reports_dir, history_path): a reports directory holding REPORT_ID and a history store with CLIENT's two assessments."""
+    with tempfile.TemporaryDirectory() as workdir:
+        reports_dir, history_path = os.path.join(workdir, "reports"), os.path.join(workdir, "history.sqlite3")
+        os.makedirs(reports_dir)
+        shutil.copy(COMBINED_REPORT_PATH, os.path.join(reports_dir, f"{REPORT_ID}.md"))
+        with AssessmentHistory(history_path) as history, contextlib.redirect_stdout(io.StringIO()):
+            history.save(CLIENT, PREVIOUS_DATE, _extract(PREVIOUS_REPORT_PATH))
+            history.save(CLIENT, CURRENT_DATE, _extract(COMBINED_REPORT_PATH))
+        yield reports_dir, history_path
+
+
+@contextlib.contextmanager
+def _server(**options):
+    with _store() as paths, contextlib.redirect_stdout(io.StringIO()):
+        yield ReportServer(*paths, **options)
+
+
+def _counted(server):
+    """Wrap server.resolve so the paths it is called with are recorded; returns that list."""
+    calls, resolve = [], server.resolve
+
+    def counting(pathname):
+        calls.append(pathname)
+        return resolve(pathname)
+
+    server.resolve = counting
+    return calls
+
+
+def test_resolve():
+    # Paths route to report files and client assessments; anything else gets a message layout
+    with _server() as server:
+        report = server.resolve(f"/reports/{REPORT_ID}")
+        latest = server.resolve("/clients/Acme%20Corp")
+        dated = server.resolve(f"/clients/Acme%20Corp/{PREVIOUS_DATE}")
+        unknown = [path for path in ("/reports/..%2F..%2Fetc%2Fpasswd", "/reports/missing", "/clients/Nobody",
+                                     "/clients/Acme%20Corp/2020-01-01", "/elsewhere", f"/reports/{REPORT_ID}/x")
+                   if isinstance(server.resolve(path), tuple)]
+    if not isinstance(report, tuple) or report[1] != _extract(COMBINED_REPORT_PATH) or report[2:] != (None, None):
+        print(f"❌ /reports/{REPORT_ID} did not resolve to the report file")
+        return False
+    if not isinstance(latest, tuple) or latest[2] is None or latest[3] != CLIENT:
+        print("❌ /clients/<client> did not resolve to the latest assessment with its benchmark")
+        return False
+    if not isinstance(dated, tuple) or dated[2] is not None or dated[0] == latest[0] \
+            or [item.current for item in dated[1].maturity] != [
+                item.current for item in _extract(PREVIOUS_REPORT_PATH).maturity]:
+        print(f"❌ /clients/<client>/{PREVIOUS_DATE} did not resolve to that assessment without a benchmark")
+        return False
+    if unknown:
+        print(f"❌ These paths resolved to a report: {', '.join(unknown)}")
+        return False
+    print("✅ Routing: /reports/<id> and /clients/<client>[/<date>] resolve; traversal, unknown reports, clients, "
+          "dates and paths get a message layout.")
+    return True
+
+
+def test_client_cache():
+    # Client pages are keyed on the assessment id and cube version: repeats skip loading, any save changes the key
+    with _server() as server:
+        first = server.resolve("/clients/Acme%20Corp")
+        second = server.resolve("/clients/Acme%20Corp")
+        loads = server.client_reports.misses
+        with AssessmentHistory(server.history_path) as history, contextlib.redirect_stdout(io.StringIO()):
+            history.save(OTHER_CLIENT, CURRENT_DATE, _extract(PREVIOUS_REPORT_PATH))
+        after_save = server.resolve("/clients/Acme%20Corp")
+    if loads != 1 or server.client_reports.hits != 1 or first[0] != second[0] or second[1] is not first[1]:
+        print(f"❌ A repeated client request loaded the assessment again ({loads} loads)")
+        return False
+    if after_save[0] == first[0] or after_save[2] == first[2]:
+        print("❌ Another client's save did not change the key or the benchmark peers")
+        return False
+    print("✅ Client pages: a repeat request is served from the cache without loading; another client's save "
+          "changes the key and the benchmark.")
+    return True
+
+
+def test_card_index():
+    # Routed paths answer card callbacks without resolving; other workers' paths resolve once, unknown ones give None
+    path = f"/reports/{REPORT_ID}"
+    with _server(lazy_cards=4) as routed, _server(lazy_cards=4) as fresh:
+        layout = routed.page(path)
+        same, other = routed.page(path), routed.page("/clients/Acme%20Corp")
+        routed_calls, fresh_calls = _counted(routed), _counted(fresh)
+        from_route = routed.card_index(path)
+        from_path = fresh.card_index(path)
+        again = fresh.card_index(path)
+        missing = fresh.card_index("/reports/missing")
+    items = _extract(COMBINED_REPORT_PATH).maturity
+    if routed_calls or from_route is None or from_route.items != items:
+        print(f"❌ card_index of a routed page resolved {routed_calls} instead of using the routed key")
+        return False
+    if fresh_calls != [path, "/reports/missing"] or from_path is None or from_path.items != items \
+            or again is not from_path or missing is not None:
+        print(f"❌ card_index on another worker: resolved {fresh_calls}, missing path gave {missing}")
+        return False
+    if same is not layout or other is layout:
+        print("❌ Layouts are not cached per path")
+        return False
+    print(f"✅ Card index: routed pages answer without resolving, other workers resolve {path} once, "
+          "unknown paths give None; layouts are cached per path.")
+    return True
+
+
+def _card_id(index):
+    return {"type": CARD_TYPE, "index": index}
+
+
+def _filter(client, source, styles, personas, priorities):
+    """
+    POST the filter_cards callback as the browser would, with the cards' current styles; returns the
+    status and {card index: new style} (cards left as they were are absent) plus the count label.
+    """
+    card_ids = [_card_id(index) for index in range(len(styles))]
+    response = client.post("/_dash-update-component", json={
+        "output": f"..{json.dumps(_card_id(['ALL']), sort_keys=True, separators=(',', ':'))}.style"
+                  f"...{FILTER_COUNT_ID}.children..",
+        "outputs": [[{"id": card_id, "property": "style"} for card_id in card_ids],
+                    {"id": FILTER_COUNT_ID, "property": "children"}],
+        "inputs": [{"id": PERSONA_FILTER_ID, "property": "value", "value": personas},
+                   {"id": PRIORITY_FILTER_ID, "property": "value", "value": priorities}],
+        "state": [[{"id": card_id, "property": "style", "value": style} for card_id, style in zip(card_ids, styles)],
+                  {"id": CARDS_STATE_ID, "property": "data", "value": {"source": source, "loaded": len(styles)}}],
+        "changedPropIds": [f"{PERSONA_FILTER_ID}.value"],
+    })
+    if response.status_code != 200:
+        return response.status_code, {}, None
+    updates = response.get_json()["response"]
+    count = updates.pop(FILTER_COUNT_ID)["children"]
+    return 200, {json.loads(key)["index"]: value["style"] for key, value in updates.items()}, count
+
+
+def test_filter_callback():
+    # Filtering restyles exactly the cards whose visibility changes; the rest are left alone (no_update)
+    source = f"/reports/{REPORT_ID}"
+    card_index = build_card_index(_extract(COMBINED_REPORT_PATH).maturity)
+    total = len(card_index.items)
+    persona = next(name for name, positions in card_index.personas.items() if 0 < len(positions) < total)
+    steps = [([persona], []), ([persona], ["1"]), ([], ["2", "3"]), ([], [])]
+    with _store() as paths, contextlib.redirect_stdout(io.StringIO()):
+        client = create_report_server(*paths).server.test_client()
+        styles, problems, restyled = [MATURITY_CARD_STYLE] * total, [], []
+        for personas, priorities in steps:
+            shown = card_index.matching(personas, priorities)
+            expected = {index: MATURITY_CARD_STYLE if index in shown else HIDDEN_CARD_STYLE
+                        for index, style in enumerate(styles) if (index in shown) == (style.get("display") == "none")}
+            status, updates, count = _filter(client, source, styles, personas, priorities)
+            if status != 200 or updates != expected or count != f"Showing {len(shown)} of {total} items":
+                problems.append(f"{personas} {priorities}: restyled {sorted(updates)}, expected {sorted(expected)} "
+                                f"({count})")
+            styles = [updates.get(index, style) for index, style in enumerate(styles)]
+            restyled.append(len(updates))
+        gone = _filter(client, "/reports/missing", styles, [persona], [])[0]
+    if problems:
+        print(f"❌ Filter callback: {'; '.join(problems)}")
+        return False
+    if gone != 204:
+        print(f"❌ Filtering a report that is gone answered {gone}, not 204 (PreventUpdate)")
+        return False
+    print(f"✅ Filter callback: {len(steps)} persona/priority selections hide and show exactly the cards "
+          f"CardIndex.matching says ({', '.join(map(str, restyled))} of {total} restyled, the rest untouched); "
+          f"a gone report is not updated.")
+    return True
+
+
+if __name__ == "__main__":
+    if not all([test_resolve(), test_client_cache(), test_card_index(), test_filter_callback()]):
+        sys.exit(1)
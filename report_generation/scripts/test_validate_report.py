@@ -0,0 +1,35 @@
+import contextlib
+import io
+
+from src.config import INPUT_DIR
+from src.data_extraction import extract_report
+from src.utils import read_file
+from validate_report import parse_outline_and_blocks
+
+FIXTURE_PATH = f"{INPUT_DIR}/new_combined_report.md"
+
+def test_validate_percentages():
+    # Every Final Maturity row the extractor reads must pass the validator's percentage check
+    text = read_file(FIXTURE_PATH)
+    if not text:
+        return
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = extract_report(text)
+    value_errs = []
+    parse_outline_and_blocks(text, value_errs)
+    flagged = [e for e in value_errs if "Final Maturity Score" in e]
+
+    if not report.final_maturity:
+        print(f"❌ No Final Maturity scores extracted from {FIXTURE_PATH}.")
+        return
+    if flagged:
+        print(f"❌ validate_report.py flagged {len(flagged)} Final Maturity cells that data_extraction.py reads:")
+        for e in flagged:
+            print(f"  - {e}")
+        return
+
+    print(f"✅ validate_report.py accepts all {len(report.final_maturity)} Final Maturity rows extracted from {FIXTURE_PATH}.")
+
+if __name__ == "__main__":
+    test_validate_percentages()
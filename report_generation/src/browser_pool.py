@@ -0,0 +1,290 @@
+"""Headless Chromium page pool and the warm PDF export daemon.
+
+PagePool keeps `size` open pages that concurrent export jobs lease one at a time; a page is closed
+and replaced after `max_uses` jobs (or after a failed job) to bound renderer memory. run_daemon
+keeps one browser and its pool alive between exports: it writes the browser's DevTools endpoint,
+its job port and a random job token to BROWSER_ENDPOINT_PATH (readable by its owner only) and
+accepts one JSON export job per line on that port, so export_pdf.py runs skip the Chromium cold
+start. Jobs without the token, or writing outside the daemon's output directory, are refused.
+
+A job's source is a URL, a local HTML file or an HTML document string. Files and strings (such as
+src.static_html output, which inlines its CSS, figures and plotly.js) are loaded straight into the
+page, with no server and no network-idle wait.
+"""
+import asyncio
+import hmac
+import json
+import logging
+import os
+import secrets
+import signal
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from pyppeteer import launch
+from pyppeteer.chromium_downloader import check_chromium, download_chromium
+from pyppeteer.errors import PageError
+
+from src.config import PDF_DAEMON_OUTPUT_DIR
+
+CHROMIUM_ARGS = ['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
+VIEWPORT = {'width': 1280, 'height': 1024}
+PDF_OPTIONS = {'format': 'A4', 'printBackground': True}
+SERVER_TIMEOUT = 60         # seconds to keep retrying while the Dash server is still starting
+READY_TIMEOUT_MS = 120000   # how long the page may take to publish window.reportReady
+JOB_LINE_LIMIT = 64 * 1024 * 1024   # daemon jobs may carry a whole HTML document
+
+
+async def launch_browser(**kwargs):
+    """Launch headless Chromium, downloading it first only if it is missing."""
+    if not check_chromium():
+        logging.info("Downloading Chromium...")
+        download_chromium()
+    return await launch(headless=True, args=CHROMIUM_ARGS, **kwargs)
+
+
+async def goto_when_up(page, url, timeout=SERVER_TIMEOUT):
+    """Navigate to url, retrying only while the server refuses connections (it is still starting)."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return await page.goto(url, {'waitUntil': 'load'})
+        except PageError as e:
+            if 'ERR_CONNECTION_REFUSED' not in str(e) or time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+async def wait_until_ready(page, timeout=READY_TIMEOUT_MS):
+    """Wait for the report page's readiness flag: every graph drawn, images loaded, fonts ready."""
+    await page.waitForFunction('() => window.reportReady === true', {'timeout': timeout, 'polling': 'raf'})
+
+
+def is_html(source):
+    return source.lstrip().startswith("<")
+
+
+def resolve_source(source):
+    """Local file paths become absolute file:// URLs (the daemon may run elsewhere); URLs and HTML pass through."""
+    if is_html(source) or "://" in source:
+        return source
+    return Path(source).resolve().as_uri()
+
+
+async def load(page, source):
+    """Show an HTML document string, a local HTML file or a URL in page."""
+    if is_html(source):
+        await page.setContent(source)
+    elif source.startswith("file://"):
+        await page.goto(source, {'waitUntil': 'load'})
+    else:
+        await goto_when_up(page, source)
+
+
+async def export_pdf(page, source, output):
+    """Load source in page, wait until it is rendered and print it to output; returns the seconds taken."""
+    start = time.monotonic()
+    await load(page, resolve_source(source))
+    await wait_until_ready(page)
+    await page.pdf({**PDF_OPTIONS, 'path': output})
+    return time.monotonic() - start
+
+
+class PagePool:
+    """
+    `size` pages leased to concurrent jobs; each is replaced after `max_uses` jobs or a failed job.
+    A slot whose replacement could not be opened (e.g. the browser crashed) holds None and is
+    reopened by the next lease, so the pool never loses slots.
+    """
+
+    def __init__(self, browser, size=4, max_uses=50):
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.recycled = 0
+        self._idle = asyncio.Queue()
+        self._uses = {}
+
+    async def _new_page(self):
+        page = await self.browser.newPage()
+        await page.setViewport(VIEWPORT)
+        self._uses[page] = 0
+        return page
+
+    async def start(self):
+        for page in await asyncio.gather(*(self._new_page() for _ in range(self.size))):
+            self._idle.put_nowait(page)
+        return self
+
+    async def _replace(self, page):
+        del self._uses[page]
+        try:
+            await page.close()
+        except Exception as e:
+            logging.warning(f"Closing a recycled page failed: {e}")
+        replacement = None
+        try:
+            replacement = await self._new_page()
+            self.recycled += 1
+        except Exception as e:
+            logging.warning(f"Opening a replacement page failed, retrying on the next lease: {e}")
+        finally:
+            self._idle.put_nowait(replacement)
+
+    @asynccontextmanager
+    async def lease(self):
+        page = await self._idle.get()
+        if page is None:
+            try:
+                page = await self._new_page()
+            except BaseException:
+                self._idle.put_nowait(None)
+                raise
+        failed = True
+        try:
+            yield page
+            failed = False
+        finally:
+            self._uses[page] += 1
+            if failed or self._uses[page] >= self.max_uses:
+                await self._replace(page)
+            else:
+                self._idle.put_nowait(page)
+
+    async def export(self, source, output):
+        async with self.lease() as page:
+            return await export_pdf(page, source, output)
+
+    async def close(self):
+        while not self._idle.empty():
+            page = self._idle.get_nowait()
+            if page is not None:
+                await page.close()
+
+
+async def export_many(pool, jobs):
+    """Run (source, output) jobs concurrently through the pool; returns seconds per job, or the exception."""
+    return await asyncio.gather(*(pool.export(source, output) for source, output in jobs), return_exceptions=True)
+
+
+async def export_pdfs(jobs, pages=4, max_uses=50, endpoint_path=None, use_daemon=True):
+    """
+    Export (source, output) jobs through the running daemon if one answers at endpoint_path,
+    otherwise through a browser launched for this call; returns seconds per job, or the exception.
+    """
+    port, token = daemon_endpoint(endpoint_path) if use_daemon and endpoint_path else (None, None)
+    if port and await daemon_alive(port):
+        logging.info(f"Exporting through the browser daemon on port {port}.")
+        return await asyncio.gather(*(submit(port, token, source, output) for source, output in jobs),
+                                    return_exceptions=True)
+    if port:
+        logging.warning(f"No browser daemon answering on port {port} (stale {endpoint_path}); launching Chromium.")
+    browser = await launch_browser()
+    try:
+        pool = await PagePool(browser, min(pages, len(jobs)), max_uses).start()
+        return await export_many(pool, jobs)
+    finally:
+        await browser.close()
+
+
+# --- Daemon ------------------------------------------------------------------
+
+def _inside(path, directory):
+    """Whether path, with symlinks resolved, lies in directory."""
+    path, directory = os.path.realpath(path), os.path.realpath(directory)
+    return os.path.commonpath([path, directory]) == directory
+
+
+def _write_private(path, data):
+    """
+    Write a JSON file only its owner can read: it holds the daemon's job token and DevTools endpoint.
+    It is written beside path and renamed into place, so clients never read it half-written.
+    """
+    part = f"{path}.{os.getpid()}.part"
+    fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)        # O_CREAT's mode does not apply to an existing file
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(part, path)
+
+
+async def run_daemon(endpoint_path, port, pages=4, max_uses=50, output_dir=PDF_DAEMON_OUTPUT_DIR):
+    """
+    Keep a browser and PagePool warm and serve export jobs on 127.0.0.1:port until SIGINT/SIGTERM.
+    Only jobs carrying the token from endpoint_path are run, and only for outputs inside output_dir.
+    """
+    browser = await launch_browser(handleSIGINT=False, handleSIGTERM=False, handleSIGHUP=False)
+    pool = await PagePool(browser, pages, max_uses).start()
+    token = secrets.token_urlsafe(32)
+
+    async def handle(reader, writer):
+        # One {"token", "source", "output"} JSON object per line in, one {"ok", "seconds" | "error"} line out
+        while line := await reader.readline():
+            try:
+                job = json.loads(line)
+                if not hmac.compare_digest(str(job.get('token', '')), token):
+                    writer.write(json.dumps({'ok': False, 'error': "invalid job token"}).encode() + b'\n')
+                    break
+                if not _inside(job['output'], output_dir):
+                    raise ValueError(f"output {job['output']} is outside {os.path.abspath(output_dir)}")
+                reply = {'ok': True, 'seconds': await pool.export(job['source'], job['output'])}
+            except Exception as e:
+                reply = {'ok': False, 'error': str(e)}
+            writer.write(json.dumps(reply).encode() + b'\n')
+            await writer.drain()
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', port, limit=JOB_LINE_LIMIT)
+    _write_private(endpoint_path, {'devtools': browser.wsEndpoint, 'port': port, 'token': token, 'pid': os.getpid()})
+    logging.info(f"✅ Browser daemon ready: {pages} pages, jobs on 127.0.0.1:{port} writing under "
+                 f"{os.path.abspath(output_dir)}, DevTools {browser.wsEndpoint}")
+
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        server.close()
+        await server.wait_closed()
+        if os.path.exists(endpoint_path):
+            os.remove(endpoint_path)
+        await pool.close()
+        await browser.close()
+        logging.info(f"Browser daemon stopped ({pool.recycled} pages recycled).")
+
+
+def daemon_endpoint(endpoint_path):
+    """The running daemon's (job port, job token) from its endpoint file, or (None, None)."""
+    try:
+        with open(endpoint_path, encoding='utf-8') as f:
+            endpoint = json.load(f)
+        return endpoint['port'], endpoint['token']
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+
+async def daemon_alive(port):
+    try:
+        _, writer = await asyncio.open_connection('127.0.0.1', port)
+    except OSError:
+        return False
+    writer.close()
+    return True
+
+
+async def submit(port, token, source, output):
+    """Send one export job to the daemon; returns the seconds it took."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        job = {'token': token, 'source': resolve_source(source), 'output': os.path.abspath(output)}
+        writer.write(json.dumps(job).encode() + b'\n')
+        await writer.drain()
+        reply = json.loads(await reader.readline())
+    finally:
+        writer.close()
+    if not reply['ok']:
+        raise RuntimeError(reply['error'])
+    return reply['seconds']
@@ -1,18 +1,19 @@
 from dash import html, dcc
 from src.styles import CARD_STYLE
 from src.chart_generation import generate_single_maturity_chart
+from src.svg_charts import single_maturity_chart_svg, svg_graph
 
 def create_critical_risk_card(risk, index):
     """Create a card for Critical Risks with title, business impact, and solutions, using a table layout for consistent alignment."""
     return html.Div(style={**CARD_STYLE, "marginBottom": "30px"}, children=[
         # Title
-        html.H4(f"{index + 1}. {risk['title']}", style={"color": "#2a4e85", "marginBottom": "10px", "borderBottom": "2px solid #000", "paddingBottom": "5px"}),
+        html.H4(f"{index + 1}. {risk.title}", style={"color": "#2a4e85", "marginBottom": "10px", "borderBottom": "2px solid #000", "paddingBottom": "5px"}),
         # Table for Business Impact and Solution
         html.Table(style={"width": "100%", "borderCollapse": "collapse", "marginBottom": "15px"}, children=[
             # Business Impact Row
             html.Tr([
                 html.Td(html.Strong("Business Impact:"), style={"width": "150px", "fontSize": "14px", "verticalAlign": "top"}),
-                html.Td(risk["business_impact"], style={"fontSize": "14px"})
+                html.Td(risk.business_impact, style={"fontSize": "14px"})
             ], style={"borderBottom": "2px solid #000"}),
             # Solution Row with Nested Table
             html.Tr([
@@ -21,15 +22,15 @@ def create_critical_risk_card(risk, index):
                     html.Table(style={"width": "100%", "borderCollapse": "collapse"}, children=[
                         html.Tr([
                             html.Td("- Immediate:", style={"width": "100px", "fontSize": "14px", "verticalAlign": "top", "paddingTop": "10px"}),
-                            html.Td(risk["solution"]["immediate"], style={"fontSize": "14px", "paddingTop": "10px"})
+                            html.Td(risk.solution.immediate, style={"fontSize": "14px", "paddingTop": "10px"})
                         ]),
                         html.Tr([
                             html.Td("- Short-term:", style={"width": "100px", "fontSize": "14px", "verticalAlign": "top"}),
-                            html.Td(risk["solution"]["short_term"], style={"fontSize": "14px"})
+                            html.Td(risk.solution.short_term, style={"fontSize": "14px"})
                         ]),
                         html.Tr([
                             html.Td("- Long-term:", style={"width": "100px", "fontSize": "14px", "verticalAlign": "top"}),
-                            html.Td(risk["solution"]["long_term"], style={"fontSize": "14px"})
+                            html.Td(risk.solution.long_term, style={"fontSize": "14px"})
                         ]),
                     ])
                 )
@@ -114,10 +115,10 @@ def create_point_legend():
         ]
     )
 
-def create_business_overview(critical_risks, final_maturity_scores=None):
+def create_business_overview(critical_risks, final_maturity_scores=None, svg_charts=False):
     """Generate the Business Overview section layout with Overall Maturity Score graph and score band."""
     # Find the Overall rubric data
-    overall_data = next((score for score in final_maturity_scores if score["rubric"] == "Overall"), None) if final_maturity_scores else None
+    overall_data = next((score for score in final_maturity_scores if score.rubric == "Overall"), None) if final_maturity_scores else None
 
     # Create critical risk cards with spacing
     risk_elements = []
@@ -143,8 +144,11 @@ def create_business_overview(critical_risks, final_maturity_scores=None):
                         style={"flex": "0 0 450px"},
                         children=[
                             html.H2("Maturity Score", style={"color": "#2a4e85", "marginBottom": "10px"}),
-                            create_score_band(overall_data["current_percent"]),
-                            dcc.Graph(
+                            create_score_band(overall_data.current_percent),
+                            svg_graph(
+                                single_maturity_chart_svg(overall_data, width=450),
+                                style={"pageBreakInside": "avoid"}
+                            ) if svg_charts else dcc.Graph(
                                 figure=generate_single_maturity_chart(overall_data, width=450),
                                 config={"displayModeBar": False},
                                 style={"pageBreakInside": "avoid"}
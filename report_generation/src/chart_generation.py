@@ -1,5 +1,7 @@
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime
+from functools import lru_cache
 import math
 
 # --- Color helpers -----------------------------------------------------------
@@ -59,10 +61,58 @@ def get_month_labels(now: datetime | None = None):
     ]
 
 
+# --- Template ----------------------------------------------------------------
+
+REPORT_TEMPLATE = "report"
+
+
+def _report_template():
+    """
+    Layout shared by the report charts, on top of the parts of Plotly's default "plotly" template that
+    2D bar and line charts use. Its polar, geo, 3D and colour-scale defaults are left out: serialized
+    into every figure, they made up over 90% of each chart's JSON.
+    """
+    base = pio.templates["plotly"]
+    return go.layout.Template(
+        layout=dict(
+            autotypenumbers=base.layout.autotypenumbers,
+            colorway=base.layout.colorway,
+            font=base.layout.font,
+            hovermode=base.layout.hovermode,
+            hoverlabel=base.layout.hoverlabel,
+            xaxis=base.layout.xaxis,
+            yaxis=go.layout.YAxis(base.layout.yaxis, fixedrange=True, gridcolor="#ddd"),
+            title=dict(x=0.5),
+            plot_bgcolor="white",
+            paper_bgcolor="white",
+        ),
+        data=dict(bar=base.data.bar, scatter=base.data.scatter),
+    )
+
+
+pio.templates[REPORT_TEMPLATE] = _report_template()
+
+
 # --- Figures -----------------------------------------------------------------
 
-def generate_chart(scores, prev_score_missing: bool = False):
-    """Generate a bar chart for Platform Maturity scores (Previous / Current / Target)."""
+MATURITY_CHART_CACHE_SIZE = 256     # distinct (scores, missing-previous, labels) figures kept
+
+MATURITY_CHART_LAYOUT = dict(
+    template=REPORT_TEMPLATE,
+    height=260,
+    width=420,
+    margin=dict(l=10, r=10, t=30, b=40),
+    yaxis=dict(range=[0, 5], tick0=1, dtick=1, showgrid=False),
+    bargap=0.1,
+)
+
+
+def _maturity_xaxis(labels):
+    return dict(tickangle=0, tickmode="array", tickvals=list(range(3)), ticktext=list(labels))
+
+
+def _maturity_bar(scores, prev_score_missing):
+    """(colors, display text, plotted values) for the Previous / Current / Target bars."""
     colors = [
         "#CCCCCC" if prev_score_missing else get_maturity_color(scores[0]),
         get_maturity_color(scores[1]),
@@ -78,6 +128,12 @@ def generate_chart(scores, prev_score_missing: bool = False):
         scores[1],
         scores[2],
     ]
+    return colors, display_scores, plotted_scores
+
+
+def generate_chart(scores, prev_score_missing: bool = False):
+    """Generate a bar chart for Platform Maturity scores (Previous / Current / Target)."""
+    colors, display_scores, plotted_scores = _maturity_bar(scores, prev_score_missing)
 
     # Dynamic labels for all 12 months (based on today's month)
     labels = get_month_labels()
@@ -94,24 +150,84 @@ def generate_chart(scores, prev_score_missing: bool = False):
             width=0.3,
         )
     ])
-    fig.update_layout(
-        height=260,
-        width=420,
-        margin=dict(l=10, r=10, t=30, b=40),
-        yaxis=dict(range=[0, 5], tick0=1, dtick=1, showgrid=False, fixedrange=True),
-        xaxis=dict(tickangle=0, tickmode="array", tickvals=x_vals, ticktext=labels),
-        bargap=0.1,
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-    )
+    fig.update_layout(**MATURITY_CHART_LAYOUT, xaxis=_maturity_xaxis(labels))
     return fig
 
 
+@lru_cache(maxsize=12)
+def _maturity_chart_layout(labels):
+    """Layout dict shared by every maturity chart with these month labels; validated by Plotly only once."""
+    return go.Figure(layout=dict(**MATURITY_CHART_LAYOUT, xaxis=_maturity_xaxis(labels))).to_dict()["layout"]
+
+
+@lru_cache(maxsize=MATURITY_CHART_CACHE_SIZE)
+def _maturity_chart_dict(scores, prev_score_missing, labels):
+    colors, display_scores, plotted_scores = _maturity_bar(scores, prev_score_missing)
+    return {
+        "data": [{
+            "type": "bar",
+            "x": list(range(3)),
+            "y": plotted_scores,
+            "marker": {"color": colors},
+            "text": [str(score) for score in display_scores],
+            "textposition": "inside",
+            "textfont": {"color": "white", "size": 12},
+            "width": 0.3,
+        }],
+        "layout": _maturity_chart_layout(labels),
+    }
+
+
+def maturity_chart_figure(scores, prev_score_missing: bool = False):
+    """
+    Plain-dict equivalent of generate_chart() for dcc.Graph, without Plotly's per-property validation.
+    Memoized on (scores, prev_score_missing, month labels); the returned dict is shared, so don't mutate it.
+    """
+    return _maturity_chart_dict(tuple(scores), prev_score_missing, tuple(get_month_labels()))
+
+
+MATURITY_GRID_PADDING = dict(t=30, b=60)   # px between a grid row's top/bottom and its plot area (month labels below)
+
+
+def maturity_grid_figure(charts, row_heights, row_gap):
+    """
+    All maturity bar charts as one figure: one subplot row per (scores, prev_score_missing) in `charts`.
+    Row i is row_heights[i] px tall and rows are row_gap px apart, so the figure lines up with HTML rows
+    of the same heights. Bars, colours and month labels match maturity_chart_figure().
+    """
+    labels = tuple(get_month_labels())
+    shared = _maturity_chart_layout(labels)
+    total = sum(row_heights) + row_gap * max(len(row_heights) - 1, 0)
+    layout = {
+        "template": shared["template"],
+        "height": total,
+        "width": MATURITY_CHART_LAYOUT["width"],
+        "margin": {"l": 30, "r": MATURITY_CHART_LAYOUT["margin"]["r"], "t": 0, "b": 0},
+        "bargap": MATURITY_CHART_LAYOUT["bargap"],
+        "showlegend": False,
+    }
+    data, top = [], 0
+    for i, ((scores, prev_score_missing), height) in enumerate(zip(charts, row_heights), 1):
+        suffix = "" if i == 1 else str(i)
+        plot_bottom = top + min(height, MATURITY_CHART_LAYOUT["height"]) - MATURITY_GRID_PADDING["b"]
+        layout[f"xaxis{suffix}"] = {
+            **shared["xaxis"], "anchor": f"y{suffix}", "range": [-0.5, 2.5], "domain": [0, 1],
+        }
+        layout[f"yaxis{suffix}"] = {
+            **shared["yaxis"], "anchor": f"x{suffix}",
+            "domain": [1 - plot_bottom / total, 1 - (top + MATURITY_GRID_PADDING["t"]) / total],
+        }
+        trace = _maturity_chart_dict(tuple(scores), prev_score_missing, labels)["data"][0]
+        data.append({**trace, "xaxis": f"x{suffix}", "yaxis": f"y{suffix}"})
+        top += height + row_gap
+    return {"data": data, "layout": layout}
+
+
 def generate_final_maturity_chart(final_maturity_scores):
     """Generate a bar chart for Final Maturity Scores with Current and Target percentages."""
-    rubrics = [score["rubric"] for score in final_maturity_scores]
-    current_percents = [score["current_percent"] for score in final_maturity_scores]
-    target_percents = [score["target_percent"] for score in final_maturity_scores]
+    rubrics = [score.rubric for score in final_maturity_scores]
+    current_percents = [score.current_percent for score in final_maturity_scores]
+    target_percents = [score.target_percent for score in final_maturity_scores]
 
     fig = go.Figure(data=[
         go.Bar(
@@ -135,6 +251,7 @@ def generate_final_maturity_chart(final_maturity_scores):
     ])
 
     fig.update_layout(
+        template=REPORT_TEMPLATE,
         height=300,
         width=600,
         margin=dict(l=20, r=20, t=50, b=100),
@@ -144,15 +261,10 @@ def generate_final_maturity_chart(final_maturity_scores):
             tick0=0,
             dtick=10,
             showgrid=True,
-            gridcolor="#ddd",
-            fixedrange=True,
         ),
         barmode="group",
         bargap=0.2,
-        plot_bgcolor="white",
-        paper_bgcolor="white",
         title="Final Maturity Scores",
-        title_x=0.5,
         legend=dict(
             x=0.5,
             y=-0.3,
@@ -194,10 +306,10 @@ def generate_single_maturity_chart(rubric_data, width=450):
     Generate a line chart for a single Final Maturity Score rubric (e.g., Overall)
     with lines for Target and optional Decline (if provided on 'Overall').
     """
-    rubric = rubric_data["rubric"]
-    current_percent = rubric_data["current_percent"]
-    target_percent = rubric_data["target_percent"]
-    decline_percent = rubric_data.get("decline_percent")  # May be None for non-Overall rubrics
+    rubric = rubric_data.rubric
+    current_percent = rubric_data.current_percent
+    target_percent = rubric_data.target_percent
+    decline_percent = rubric_data.decline_percent  # May be None for non-Overall rubrics
 
     # Get current and target quarters dynamically
     current_quarter, target_quarter = get_current_quarter_and_target()
@@ -241,6 +353,7 @@ def generate_single_maturity_chart(rubric_data, width=450):
         ))
 
     fig.update_layout(
+        template=REPORT_TEMPLATE,
         height=200,
         width=width,  # Fixed width for both web and PDF
         margin=dict(l=10, r=10, t=10, b=30),
@@ -250,8 +363,6 @@ def generate_single_maturity_chart(rubric_data, width=450):
             tick0=0,
             dtick=20,
             showgrid=True,
-            gridcolor="#ddd",
-            fixedrange=True,
             titlefont=dict(size=8),
             tickfont=dict(size=6),
         ),
@@ -263,13 +374,68 @@ def generate_single_maturity_chart(rubric_data, width=450):
             titlefont=dict(size=8),
             tickfont=dict(size=6),
         ),
-        plot_bgcolor="white",
-        paper_bgcolor="white",
         title=f"{rubric} Maturity Score",
-        title_x=0.5,
         titlefont=dict(size=10),
         showlegend=False,  # Hide default legend; score band acts as legend
     )
 
     return fig
 
+
+
+def generate_benchmark_chart(rows, title, x_range, tick_format="{:.0f}"):
+    """
+    Generate a horizontal chart placing a client's scores (diamonds) against the other clients:
+    the grey bar spans their 25th–75th percentile and the black tick marks their median.
+    `rows` are portfolio_cube.BenchmarkRow; the client's percentile is printed next to each diamond.
+    """
+    columns = [row.column for row in rows]
+    banded = [row for row in rows if row.peers]
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name="Middle 50% of clients",
+        y=[row.column for row in banded],
+        x=[row.p75 - row.p25 for row in banded],
+        base=[row.p25 for row in banded],
+        orientation="h",
+        marker_color="#dddddd",
+        width=0.5,
+        customdata=[row.p75 for row in banded],     # x is the band's width, not its upper end
+        hovertemplate="%{y}: 25th–75th percentile %{base}–%{customdata}<extra></extra>",
+    ))
+    fig.add_trace(go.Scatter(
+        name="Median",
+        y=[row.column for row in banded],
+        x=[row.median for row in banded],
+        mode="markers",
+        marker=dict(symbol="line-ns-open", size=18, color="black", line=dict(width=2)),
+    ))
+    fig.add_trace(go.Scatter(
+        name="This client",
+        y=columns,
+        x=[row.value for row in rows],
+        mode="markers+text",
+        marker=dict(symbol="diamond", size=11, color="#2a4e85", line=dict(width=1, color="black")),
+        text=["" if row.percentile is None else f"P{row.percentile:.0f}" for row in rows],
+        textposition="middle right",
+        textfont=dict(size=10),
+        hovertext=[
+            f"{row.column}: {tick_format.format(row.value)}"
+            + ("" if row.percentile is None else f" (higher than {row.percentile:.0f}% of {row.peers} clients)")
+            for row in rows
+        ],
+        hoverinfo="text",
+    ))
+
+    fig.update_layout(
+        template=REPORT_TEMPLATE,
+        height=80 + 28 * len(rows),
+        width=700,
+        margin=dict(l=20, r=20, t=40, b=40),
+        xaxis=dict(range=x_range, showgrid=True, gridcolor="#ddd", fixedrange=True),
+        yaxis=dict(autorange="reversed", categoryorder="array", categoryarray=columns, showgrid=False),
+        title=title,
+        legend=dict(x=0.5, y=-0.1, xanchor="center", yanchor="top", orientation="h"),
+    )
+    return fig
@@ -0,0 +1,118 @@
+"""Arrow/Parquet export of extracted report data for downstream analytics.
+
+Each record type becomes one Arrow table with a fixed schema, its rows numbered by a 1-based
+position column in report order. Tables are written either as
+standalone Parquet files per report, or appended to a dataset partitioned by client and
+assessment date (client=<name>/assessed_on=<date>/...), one directory per table.
+"""
+import os
+import shutil
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+SCHEMAS = {
+    "maturity_items": pa.schema([
+        ("position", pa.int32()),
+        ("title", pa.string()),
+        ("priority", pa.int32()),           # null when the report says N/A
+        ("personas", pa.string()),
+        ("previous", pa.float64()),
+        ("current", pa.float64()),
+        ("target", pa.float64()),
+        ("findings", pa.string()),
+    ]),
+    "technical_scores": pa.schema([
+        ("position", pa.int32()),
+        ("area", pa.string()),
+        ("previous", pa.int32()),
+        ("current", pa.int32()),
+        ("target", pa.int32()),
+        ("justification", pa.string()),
+    ]),
+    "critical_risks": pa.schema([
+        ("position", pa.int32()),
+        ("title", pa.string()),
+        ("business_impact", pa.string()),
+        ("immediate", pa.string()),
+        ("short_term", pa.string()),
+        ("long_term", pa.string()),
+    ]),
+    "final_maturity_scores": pa.schema([
+        ("position", pa.int32()),
+        ("rubric", pa.string()),
+        ("current_percent", pa.float64()),
+        ("target_percent", pa.float64()),
+        ("decline_percent", pa.float64()),  # only set on the Overall rubric
+    ]),
+    "compliance_posture": pa.schema([
+        ("position", pa.int32()),
+        ("score", pa.string()),
+        ("description", pa.string()),
+    ]),
+}
+PARTITIONING = ds.partitioning(pa.schema([("client", pa.string()), ("assessed_on", pa.string())]), flavor="hive")
+
+
+def _columns(records, names):
+    return {name: [getattr(record, name) for record in records] for name in names}
+
+
+def _rows(records, names):
+    """Columns `names` of records, after their 1-based position."""
+    return {"position": list(range(1, len(records) + 1)), **_columns(records, names)}
+
+
+def report_tables(report):
+    """{table name: pyarrow.Table} for one ReportData."""
+    risks = report.critical_risks
+    fields = {name: schema.names[1:] for name, schema in SCHEMAS.items()}    # after "position"
+    columns = {
+        "maturity_items": _rows(report.maturity, fields["maturity_items"]),
+        "technical_scores": _rows(report.technical, fields["technical_scores"]),
+        "critical_risks": {
+            **_rows(risks, ["title", "business_impact"]),
+            **_columns([risk.solution for risk in risks], ["immediate", "short_term", "long_term"]),
+        },
+        "final_maturity_scores": _rows(report.final_maturity, fields["final_maturity_scores"]),
+        "compliance_posture": _rows([report.compliance] if report.compliance else [], fields["compliance_posture"]),
+    }
+    return {name: pa.Table.from_pydict(columns[name], schema=schema) for name, schema in SCHEMAS.items()}
+
+
+def write_parquet(report, output_dir):
+    """Write one <table>.parquet per table into output_dir."""
+    os.makedirs(output_dir, exist_ok=True)
+    for name, table in report_tables(report).items():
+        pq.write_table(table, f"{output_dir}/{name}.parquet")
+    print(f"✅ Generated Parquet tables in {output_dir}")
+
+
+def append_to_dataset(report, root, client, assessed_on):
+    """Add the report to <root>/<table>/client=<client>/assessed_on=<date>/, replacing that partition if present."""
+    partition, _ = PARTITIONING.format((ds.field("client") == client) & (ds.field("assessed_on") == assessed_on))
+    for name, table in report_tables(report).items():
+        if table.num_rows == 0:
+            # Writing no rows would leave an earlier save's partition in place
+            shutil.rmtree(f"{root}/{name}/{partition}", ignore_errors=True)
+            continue
+        table = (
+            table.append_column("client", pa.array([client] * table.num_rows, pa.string()))
+                 .append_column("assessed_on", pa.array([assessed_on] * table.num_rows, pa.string()))
+        )
+        ds.write_dataset(
+            table,
+            f"{root}/{name}",
+            format="parquet",
+            partitioning=PARTITIONING,
+            basename_template="part-{i}.parquet",
+            existing_data_behavior="delete_matching",
+        )
+    print(f"✅ Appended {client} assessment of {assessed_on} to the Parquet dataset in {root}")
+
+
+def read_dataset(root, name, columns=None, client=None):
+    """Read one table of the partitioned dataset, scanning only `columns` (and `client`'s partitions if given)."""
+    dataset = ds.dataset(f"{root}/{name}", format="parquet", partitioning=PARTITIONING)
+    return dataset.to_table(columns=columns, filter=ds.field("client") == client if client else None)
@@ -2,4 +2,17 @@
 INPUT_DIR = "data"
 OUTPUT_DIR = "data/output"
 COMBINED_REPORT_PATH = f"{INPUT_DIR}/combined_report.md"
+REPORTS_DIR = f"{INPUT_DIR}/reports"
 REPORT_PATH = f"{OUTPUT_DIR}/report.txt"
+REPORT_JSON_PATH = f"{OUTPUT_DIR}/report.json"
+REPORT_HTML_PATH = f"{OUTPUT_DIR}/report.html"
+REPORT_PDF_PATH = f"{OUTPUT_DIR}/report.pdf"
+HISTORY_DB_PATH = f"{OUTPUT_DIR}/history.sqlite3"
+PARQUET_DIR = f"{OUTPUT_DIR}/parquet"
+DATASET_DIR = f"{OUTPUT_DIR}/dataset"
+CHARTS_DIR = f"{OUTPUT_DIR}/charts"
+REPORT_BOOK_DIR = f"{OUTPUT_DIR}/book"
+PDF_FRAGMENT_DIR = f"{OUTPUT_DIR}/pdf_fragments"
+BROWSER_ENDPOINT_PATH = f"{OUTPUT_DIR}/browser.json"
+PDF_DAEMON_PORT = 8765
+PDF_DAEMON_OUTPUT_DIR = "."     # the PDF daemon only writes under this directory
@@ -1,58 +1,254 @@
 import re
+from typing import NamedTuple, List, Tuple, Optional
+
+from src.schema import (
+    MaturityItem, TechnicalScore, Solution, CriticalRisk, CompliancePosture, FinalMaturityScore, ReportData,
+)
+
+# --- Section tokenizer --------------------------------------------------------
+
+HEADING_RE = re.compile(r'(#{1,6})[ \t]+(.+?)[ \t]*$')
+RULE_RE = re.compile(r'[ \t]*-{3,}[ \t]*$')
+
+# "## <title>" prefixes of the sections the extractors read, keyed by section kind
+SECTION_KINDS = (
+    ("1. Critical Risks", "critical_risks"),
+    ("2. Platform Maturity Scoring", "platform_maturity"),
+    ("3. Final Maturity Score", "final_maturity"),
+    ("4. Compliance Posture", "compliance_posture"),
+    ("6. Technical Focus Area Scores", "technical_scores"),
+)
+
+RISK_TITLE_RE = re.compile(r'\d+\.\s*(.+)')
+COMPLIANCE_RE = re.compile(
+    r'[\*]{1,2}Overall Compliance Score:\*+\s*\*+(\d+%)\*+\s*\n\n(.+?)(?=\n\n##|\Z)',
+    re.DOTALL
+)
+FINAL_MATURITY_ROW_RE = re.compile(
+    r'^\|\s*(?:\*\*)?([^\|]+?)(?:\*\*)?\s*\|\s*([\d.]+)\s*%?\s*\|\s*([\d.]+)\s*%?\s*\|$'
+)
+
+
+class ReportSection(NamedTuple):
+    """One "#"/"##" section of a combined report, as yielded by tokenize_report()."""
+    kind: Optional[str]                    # e.g. "platform_maturity"; None for sections no extractor reads
+    title: str
+    line_no: int                           # 1-based line of the heading
+    text: str                              # body, without the heading and without "###"+ sub-heading lines
+    subsections: List[Tuple[int, str]]     # (offset into text, title) of each "###"+ sub-heading
+
+    @property
+    def lines(self):
+        return self.text.splitlines()
+
+    def subsection_texts(self):
+        """Yield (title, body) for each sub-heading; the body runs to the next sub-heading."""
+        ends = [offset for offset, _ in self.subsections[1:]] + [len(self.text)]
+        for (offset, title), end in zip(self.subsections, ends):
+            yield title, self.text[offset:end]
+
+
+def _section_kind(level, title):
+    if level == 2:
+        for prefix, kind in SECTION_KINDS:
+            if title.startswith(prefix):
+                return kind
+    return None
+
+
+def _heading_lines(text):
+    """Yield (start, end, match) for each heading line, jumping between "\n#" hits with str.find."""
+    start = 0 if text.startswith("#") else text.find("\n#") + 1
+    while start > 0 or (start == 0 and text.startswith("#")):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        m = HEADING_RE.match(text, start, end)
+        if m:
+            yield start, end, m
+        start = text.find("\n#", end) + 1
+        if start == 0:
+            break
+
+
+def tokenize_report(text):
+    """Walk the report once and yield a ReportSection for every top-level ("#"/"##") heading.
+
+    Only heading lines are visited in Python; section bodies are slices of the original text.
+    """
+    current = None          # (level, title, line_no) of the open section
+    pieces, subsections = [], []
+    size = 0                # length of the body pieces collected so far
+    body_start = 0
+    line_no, pos = 1, 0
+    for start, end, m in _heading_lines(text):
+        line_no += text.count("\n", pos, start)
+        pos = start
+        level, title = len(m.group(1)), m.group(2)
+        if current:
+            pieces.append(text[body_start:start])
+            size += len(pieces[-1])
+        if level <= 2:
+            if current:
+                yield ReportSection(_section_kind(*current[:2]), current[1], current[2], "".join(pieces), subsections)
+            current = (level, title, line_no)
+            pieces, subsections, size = [], [], 0
+        elif current:
+            subsections.append((size, title))
+        body_start = end + 1
+    if current:
+        pieces.append(text[body_start:])
+        yield ReportSection(_section_kind(*current[:2]), current[1], current[2], "".join(pieces), subsections)
+
+
+def index_sections(text):
+    """Map section kind -> first ReportSection of that kind (like text.find, later duplicates are ignored)."""
+    sections = {}
+    for section in tokenize_report(text):
+        if section.kind and section.kind not in sections:
+            sections[section.kind] = section
+    return sections
+
+
+def _get_section(text, sections, kind):
+    if sections is None:
+        sections = index_sections(text)
+    return sections.get(kind)
+
+
+def _trim_rules(text):
+    """Drop trailing blank lines and '---' rules, which separate sections rather than belong to them."""
+    text = text.rstrip()
+    while text.endswith("---"):
+        cut = text.rfind("\n") + 1
+        if not RULE_RE.match(text, cut):
+            break
+        text = text[:cut].rstrip()
+    return text
+
+
+def _preview(text, limit=500):
+    return text[:limit] + "..." if len(text) > limit else text
 
-def extract_platform_entries(text):
-    start = text.find("## 2. Platform Maturity Scoring")
-    if start == -1:
+
+# --- Line parsers ---------------------------------------------------------------
+# Each line is looked at a bounded number of times and only with str methods, so
+# parsing is linear in the section size even for malformed LLM output.
+
+def _parse_platform_header(line):
+    """Split "- **Title (Score: N) (Priority level: N) (Personas: ...)**" into its fields, or return None."""
+    line = line.strip()
+    if not line.startswith("- **") or not line.endswith(")**"):
+        return None
+    rest, sep, personas = line[4:-3].rpartition(" (Personas: ")
+    if not sep or not personas.strip() or ")" in personas:
+        return None
+    rest, sep, priority = rest.rpartition(" (Priority level: ")
+    if not sep or len(priority) != 2 or not priority[0].isdigit() or priority[1] != ")":
+        return None
+    title, sep, score = rest.rpartition(" (Score: ")
+    if not sep or not title.strip() or not score.endswith(")") or not score[:-1].replace(".", "").isdigit():
+        return None
+    try:
+        score = float(score[:-1])
+    except ValueError:
+        return None
+    return title.strip(), score, int(priority[0]), personas.strip()
+
+
+def _parse_platform_entries(lines):
+    """Yield (title, score, priority_level, personas, findings) for each maturity bullet.
+
+    Findings start at the first non-blank line after the bullet and run until the next
+    "- **" bullet, a "---" rule or the end of the section.
+    """
+    header, findings = None, []
+    for line in lines + ["---"]:
+        stripped = line.strip()
+        if header and (stripped.startswith("- **") or RULE_RE.match(line)):
+            if findings:
+                yield (*header, "\n".join(findings).strip())
+            header, findings = None, []
+        if stripped.startswith("- **"):
+            header = _parse_platform_header(line)
+        elif header and (findings or stripped):
+            if not findings and stripped.startswith("-"):
+                header = None   # a plain list right after the bullet is not findings text
+                continue
+            findings.append(line)
+
+
+# risk body labels, in the order they must appear
+RISK_LABELS = (
+    ("business_impact", "**Business Impact:**"),
+    ("solution", "**Solution:**"),
+    ("immediate", "- **Immediate:**"),
+    ("short_term", "- **Short-term:**"),
+    ("long_term", "- **Long-term:**"),
+)
+
+
+def _parse_risk_body(lines):
+    """Return {business_impact, immediate, short_term, long_term} for one risk sub-section, or None.
+
+    Each label opens the next field; text on the label line and the lines after it belong to
+    that field. A risk is only returned when every label is present in order.
+    """
+    fields = {}
+    state = -1          # index into RISK_LABELS of the field being filled
+    for line in lines:
+        stripped = line.strip()
+        if state + 1 < len(RISK_LABELS) and stripped.startswith(RISK_LABELS[state + 1][1]):
+            state += 1
+            key, label = RISK_LABELS[state]
+            fields[key] = [stripped[len(label):]]
+        elif state >= 0:
+            fields[RISK_LABELS[state][0]].append(line)
+        elif stripped:
+            return None     # text before "**Business Impact:**"
+    if state != len(RISK_LABELS) - 1:
+        return None
+    return {key: "\n".join(fields[key]).strip() for key, _ in RISK_LABELS if key != "solution"}
+
+
+# --- Extractors ---------------------------------------------------------------
+
+def extract_platform_entries(text, sections=None):
+    section = _get_section(text, sections, "platform_maturity")
+    if section is None:
         print("❌ Error: 'Platform Maturity Scoring' section not found.")
         return []
 
-    end = text.find("## 3. Final Maturity Score", start)
-    if end == -1:
-        end = len(text)
-    section_text = text[start:end]
-    # Filter out lines starting with ###
-    section_text = "\n".join(line for line in section_text.splitlines() if not line.strip().startswith("###"))
-    print(f"🔍 Platform Maturity Scoring section found. Length: {len(section_text)} chars")
-
-    pattern = re.compile(
-        r'- \*\*(.+?) \(Score: ([\d.]+)\) \(Priority level: (\d)\) \(Personas: ([^\)]+)\)\*\*\s*\n\s*([^\n-].+?)(?=\n\s*(?:- \*\*|\n\s*####|\n---|\Z))',
-        re.DOTALL
-    )
-    matches = list(pattern.finditer(section_text))
+    # "###" sub-headings are already split out by the tokenizer
+    print(f"🔍 Platform Maturity Scoring section found. Length: {len(section.text)} chars")
+
+    matches = list(_parse_platform_entries(section.lines))
     print(f"✅ Found {len(matches)} platform entries.")
 
     entries = []
-    for match in matches:
-        title, score_str, priority_level, personas, findings = match.groups()
-        title = title.strip()
-        score = float(score_str)
-        priority_level = int(priority_level)
-        personas = personas.strip()
-        findings = findings.strip()
-        entries.append({
-            "title": title,
-            "priority_level": priority_level,
-            "personas": personas,
-            "previous_score": "N/A",
-            "current_score": score,
-            "target_score": min(score + 1, 5.0),  # Cap at 5.0 for float scores
-            "findings": findings
-        })
+    for title, score, priority_level, personas, findings in matches:
+        entries.append(MaturityItem(
+            title=title,
+            priority=priority_level,
+            personas=personas,
+            previous=None,
+            current=score,
+            target=min(score + 1, 5.0),  # Cap at 5.0 for float scores
+            findings=findings
+        ))
         print(f"  - Extracted: Title='{title}', Score={score}, Priority={priority_level}, Personas='{personas}', Findings='{findings[:50]}...'")
     return entries
 
-def extract_technical_scores(text):
-    start = text.find("## 6. Technical Focus Area Scores")
-    if start == -1:
+def extract_technical_scores(text, sections=None):
+    section = _get_section(text, sections, "technical_scores")
+    if section is None:
         print("❌ Could not find 'Technical Focus Area Scores' section.")
         return []
 
     rows = []
-    for line in text[start:].splitlines():
+    for line in section.lines:
         if line.strip().startswith("| Area") or set(line.strip()) <= {"|", "-"} or not line.strip().startswith("|"):
             continue
-        if line.strip() == "":
-            break
 
         cells = [cell.strip() for cell in line.strip().strip('|').split('|')][:3]
         if len(cells) < 3:
@@ -65,116 +261,82 @@ def extract_technical_scores(text):
             score = min(int(score_str), 2)
             if int(score_str) > 2:
                 print(f"⚠️ Score for '{area}' exceeds 2. Clamped to 2.")
-            rows.append({
-                "area": area,
-                "previous": "N/A",
-                "score": score,
-                "target": min(score + 1, 2),
-                "justification": justification
-            })
+            rows.append(TechnicalScore(
+                area=area,
+                previous=None,
+                current=score,
+                target=min(score + 1, 2),
+                justification=justification
+            ))
         except ValueError:
             print(f"⚠️ Invalid score for '{area}': '{score_str}'")
 
     print(f"✅ Found {len(rows)} technical scores.")
     return rows
 
-def extract_critical_risks(text):
-    start = text.find("## 1. Critical Risks")
-    if start == -1:
+def extract_critical_risks(text, sections=None):
+    section = _get_section(text, sections, "critical_risks")
+    if section is None:
         print("❌ Could not find '1. Critical Risks' section.")
         return []
 
-    end = text.find("## 2. Platform Maturity Scoring", start)
-    if end == -1:
-        end = len(text)
-    section_text = text[start:end]
-
-    pattern = re.compile(
-        r'### \d+\.\s*(?:\*\*)?(.+?)(?:\*\*)?\n\n'
-        r'\*\*Business Impact:\*\*\s*\n(.+?)\n\n'
-        r'\*\*Solution:\*\*\s*\n'
-        r'- \*\*Immediate:\*\*\s*(.+?)\n'
-        r'- \*\*Short-term:\*\*\s*(.+?)\n'
-        r'- \*\*Long-term:\*\*\s*(.+?)(?=\n\n### \d+\.\s*(?:\*\*)?|\n\n##|\Z)',
-        re.DOTALL
-    )
-    matches = list(pattern.finditer(section_text))
-
-    if not matches:
+    # Each numbered "### N. Title" sub-heading opens one risk; its body runs to the next sub-heading
+    risks = []
+    for heading, body in section.subsection_texts():
+        title_match = RISK_TITLE_RE.match(heading)
+        fields = _parse_risk_body(_trim_rules(body).split("\n")) if title_match else None
+        if not fields:
+            continue
+        risks.append(CriticalRisk(
+            title=title_match.group(1).replace("**", "").strip(),
+            business_impact=fields["business_impact"],
+            solution=Solution(
+                immediate=fields["immediate"],
+                short_term=fields["short_term"],
+                long_term=fields["long_term"]
+            )
+        ))
+
+    if not risks:
         print("⚠️ No critical risks matched. Section text:")
-        print(section_text[:500] + "..." if len(section_text) > 500 else section_text)
-        print("Pattern used:", pattern.pattern)
+        print(_preview(section.text))
+        print("Expected labels:", ", ".join(label for _, label in RISK_LABELS))
 
-    print(f"✅ Found {len(matches)} critical risks.")
-
-    risks = []
-    for match in matches:
-        title, business_impact, immediate, short_term, long_term = match.groups()
-        clean_title = title.replace("**", "").strip()
-        risks.append({
-            "title": clean_title,
-            "business_impact": business_impact.strip(),
-            "solution": {
-                "immediate": immediate.strip(),
-                "short_term": short_term.strip(),
-                "long_term": long_term.strip()
-            }
-        })
+    print(f"✅ Found {len(risks)} critical risks.")
     return risks
 
-def extract_compliance_posture(text):
-    start = text.find("## 4. Compliance Posture")
-    if start == -1:
+def extract_compliance_posture(text, sections=None):
+    section = _get_section(text, sections, "compliance_posture")
+    if section is None:
         print("❌ Could not find '4. Compliance Posture' section.")
         return None
 
-    end = text.find("## 5. Recommendations Summary", start)
-    if end == -1:
-        end = len(text)
-    section_text = text[start:end]
-
-    pattern = re.compile(
-        r'[\*]{1,2}Overall Compliance Score:\*+\s*\*+(\d+%)\*+\s*\n\n(.+?)(?=\n\n##|\Z)',
-        re.DOTALL
-    )
-    match = pattern.search(section_text)
+    match = COMPLIANCE_RE.search(_trim_rules(section.text))
 
     if not match:
         print("⚠️ No compliance posture matched. Section text:")
-        print(section_text[:500] + "..." if len(section_text) > 500 else section_text)
-        print("Pattern used:", pattern.pattern)
+        print(_preview(section.text))
+        print("Pattern used:", COMPLIANCE_RE.pattern)
         return None
 
     score, description = match.groups()
     print(f"✅ Extracted Overall Compliance Score: {score}")
-    return {
-        "score": score.strip(),
-        "description": description.strip()
-    }
-
-def extract_final_maturity_scores(text):
-    start = text.find("## 3. Final Maturity Score")
-    if start == -1:
+    return CompliancePosture(score=score.strip(), description=description.strip())
+
+def extract_final_maturity_scores(text, sections=None):
+    section = _get_section(text, sections, "final_maturity")
+    if section is None:
         print("❌ Could not find '3. Final Maturity Score' section in the provided text.")
         return []
 
-    end = text.find("## 4. Compliance Posture", start)
-    if end == -1:
-        end = len(text)
-    section_text = text[start:end]
-
     print(f"🔍 Extracting Final Maturity Scores. Section text (first 500 chars):")
-    print(section_text[:500] + "..." if len(section_text) > 500 else section_text)
+    print(_preview(section.text))
 
-    pattern = re.compile(
-        r'^\|\s*(?:\*\*)?([^\|]+?)(?:\*\*)?\s*\|\s*([\d.]+)\s*%?\s*\|\s*([\d.]+)\s*%?\s*\|$',
-        re.MULTILINE
-    )
-    matches = list(pattern.finditer(section_text))
+    matches = [m for m in map(FINAL_MATURITY_ROW_RE.match, section.lines) if m]
 
     if not matches:
         print("⚠️ No final maturity scores matched.")
-        print("Pattern used:", pattern.pattern)
+        print("Pattern used:", FINAL_MATURITY_ROW_RE.pattern)
         return []
 
     print(f"✅ Found {len(matches)} final maturity scores.")
@@ -186,14 +348,10 @@ def extract_final_maturity_scores(text):
         try:
             current = float(current)
             target = float(target)
-            entry = {
-                "rubric": rubric,
-                "current_percent": current,
-                "target_percent": target
-            }
+            entry = FinalMaturityScore(rubric=rubric, current_percent=current, target_percent=target)
             if rubric == "Overall":
                 decline = max(current - 20, 5)
-                entry["decline_percent"] = decline
+                entry.decline_percent = decline
             scores.append(entry)
             print(f"  - Matched: Rubric='{rubric}', Current={current}%, Target={target}%"
                   + (f", Decline={decline}%" if rubric == "Overall" else ""))
@@ -202,61 +360,81 @@ def extract_final_maturity_scores(text):
 
     return scores
 
+def extract_report(text):
+    """Tokenize the report once and run every extractor on the shared sections; returns a ReportData."""
+    sections = index_sections(text)
+    return ReportData(
+        maturity=extract_platform_entries(text, sections),
+        technical=extract_technical_scores(text, sections),
+        critical_risks=extract_critical_risks(text, sections),
+        compliance=extract_compliance_posture(text, sections),
+        final_maturity=extract_final_maturity_scores(text, sections),
+    )
+
+def _na(value):
+    return "N/A" if value is None else value
+
 def write_entry(f, entry, is_tech=False):
-    f.write(f"{entry['area' if is_tech else 'title']}\n")
+    f.write(f"{entry.area if is_tech else entry.title}\n")
     if not is_tech:
-        f.write(f"Priority Level: {entry['priority_level']}\n")
-        f.write(f"Personas: {entry['personas']}\n")
-    f.write(f"Previous Score: {entry['previous' if is_tech else 'previous_score']}\n")
-    f.write(f"{'Score' if is_tech else 'Current Score'}: {entry['score' if is_tech else 'current_score']}\n")
-    f.write(f"Target Score: {entry['target' if is_tech else 'target_score']}\n")
-    f.write(f"{'Justification' if is_tech else 'Findings'}: {entry['justification' if is_tech else 'findings']}\n\n")
+        f.write(f"Priority Level: {_na(entry.priority)}\n")
+        f.write(f"Personas: {entry.personas}\n")
+    f.write(f"Previous Score: {_na(entry.previous)}\n")
+    f.write(f"{'Score' if is_tech else 'Current Score'}: {entry.current}\n")
+    f.write(f"Target Score: {entry.target}\n")
+    f.write(f"{'Justification' if is_tech else 'Findings'}: {entry.justification if is_tech else entry.findings}\n\n")
+
+def write_critical_risk_entry(f, risk):
+    f.write(f"Title: {risk.title}\n")
+    f.write(f"Business Impact: {risk.business_impact}\n")
+    f.write("Solution:\n")
+    f.write(f"- Immediate: {risk.solution.immediate}\n")
+    f.write(f"- Short-term: {risk.solution.short_term}\n")
+    f.write(f"- Long-term: {risk.solution.long_term}\n\n")
 
 def write_final_maturity_entry(f, entry):
-    f.write(f"Rubric: {entry['rubric']}\n")
-    f.write(f"Current Percent: {entry['current_percent']}%\n")
-    f.write(f"Target Percent: {entry['target_percent']}%\n")
-    if "decline_percent" in entry:
-        f.write(f"Decline Percent: {entry['decline_percent']}%\n")
+    f.write(f"Rubric: {entry.rubric}\n")
+    f.write(f"Current Percent: {entry.current_percent}%\n")
+    f.write(f"Target Percent: {entry.target_percent}%\n")
+    if entry.decline_percent is not None:
+        f.write(f"Decline Percent: {entry.decline_percent}%\n")
     f.write("\n")
 
-def write_report_file(text, output_path):
-    print("🔍 Starting report generation...")
-    platform_entries = extract_platform_entries(text)
-    technical_scores = extract_technical_scores(text)
-    critical_risks = extract_critical_risks(text)
-    compliance_posture = extract_compliance_posture(text)
-    final_maturity_scores = extract_final_maturity_scores(text)
-
+def write_text_report(report, output_path):
+    """Write the legacy report.txt export for an already extracted (and merged) ReportData."""
     with open(output_path, "w", encoding="utf-8") as f:
         f.write("## Technical Overview\n\n")
-        for entry in platform_entries:
-            print(f"Writing entry: {entry['title']}")
+        for entry in report.maturity:
             write_entry(f, entry)
 
         f.write("## Technical Focus Area Scores\n\n")
-        for entry in technical_scores:
+        for entry in report.technical:
             write_entry(f, entry, is_tech=True)
 
         f.write("## Critical Risks\n\n")
-        for risk in critical_risks:
-            f.write(f"Title: {risk['title']}\n")
-            f.write(f"Business Impact: {risk['business_impact']}\n")
-            f.write("Solution:\n")
-            f.write(f"- Immediate: {risk['solution']['immediate']}\n")
-            f.write(f"- Short-term: {risk['solution']['short_term']}\n")
-            f.write(f"- Long-term: {risk['solution']['long_term']}\n\n")
-
-        if compliance_posture:
+        for risk in report.critical_risks:
+            write_critical_risk_entry(f, risk)
+
+        if report.compliance:
             f.write("## Compliance Posture\n\n")
-            f.write(f"Overall Compliance Score: {compliance_posture['score']}\n")
-            f.write(f"Description: {compliance_posture['description']}\n\n")
+            f.write(f"Overall Compliance Score: {report.compliance.score}\n")
+            f.write(f"Description: {report.compliance.description}\n\n")
 
-        if final_maturity_scores:
+        if report.final_maturity:
             f.write("## Final Maturity Scores\n\n")
-            for entry in final_maturity_scores:
+            for entry in report.final_maturity:
                 write_final_maturity_entry(f, entry)
         else:
-            print("⚠️ No final maturity scores written to report.txt.")
+            print(f"⚠️ No final maturity scores written to {output_path}.")
 
-    print(f"✅ Generated {output_path} with {len(platform_entries)} technical overview entries, {len(technical_scores)} technical scores, {len(critical_risks)} critical risks, and {len(final_maturity_scores)} final maturity scores.")
+    print(f"✅ Generated {output_path} with {len(report.maturity)} technical overview entries, {len(report.technical)} technical scores, {len(report.critical_risks)} critical risks, and {len(report.final_maturity)} final maturity scores.")
+
+def write_report_json(report, output_path):
+    """Write ReportData as JSON; load it back losslessly with src.utils.load_report_json."""
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(report.to_json(indent=2))
+    print(f"✅ Generated {output_path}")
+
+def write_report_file(text, output_path):
+    print("🔍 Starting report generation...")
+    write_text_report(extract_report(text), output_path)
@@ -4,11 +4,77 @@ from src.styles import TABLE_STYLE, CELL_STYLE, HEADER_STYLE, BOLD_CELL_STYLE, C
 from src.business_overview import create_business_overview
 from src.operational_overview import create_operational_overview
 from src.technical_overview import create_technical_overview
+from src.portfolio_overview import create_portfolio_overview
+from src.pagination import paginate
 from src.utils import read_file
 
-def create_dash_app(maturity_data, technical_data, critical_risks, final_maturity_scores):
-    app = dash.Dash(__name__, use_pages=False)
-    app.index_string = '''
+# Published on the page as window.reportReady / <html data-report-ready="true"> (plus a "report-ready"
+# event) once every graph counted in the layout root's data-graphs has drawn, all images have loaded
+# and webfonts are ready. PDF exporters wait for this instead of sleeping.
+READY_SCRIPT = """
+            <script>
+                (function () {
+                    window.reportReady = false;
+                    var fontsPending = false;
+                    function drawn(gd) {
+                        if (!gd.__reportHooked && gd.on) {
+                            gd.__reportHooked = true;
+                            gd.on("plotly_afterplot", function () { gd.__reportDrawn = true; check(); });
+                        }
+                        return gd.__reportDrawn ||
+                            (gd._fullLayout && !(gd._promises && gd._promises.length) && gd.querySelector(".main-svg"));
+                    }
+                    function check() {
+                        var root = document.querySelector("[data-graphs]");
+                        if (window.reportReady || fontsPending || !root) return;
+                        var graphs = document.querySelectorAll(".js-plotly-plot");
+                        if (graphs.length < Number(root.getAttribute("data-graphs"))) return;
+                        for (var i = 0; i < graphs.length; i++) if (!drawn(graphs[i])) return;
+                        for (var j = 0; j < document.images.length; j++) if (!document.images[j].complete) return;
+                        fontsPending = true;
+                        document.fonts.ready.then(function () {
+                            window.reportReady = true;
+                            document.documentElement.setAttribute("data-report-ready", "true");
+                            document.dispatchEvent(new Event("report-ready"));
+                        });
+                    }
+                    (function tick() { check(); if (!window.reportReady) requestAnimationFrame(tick); })();
+                })();
+            </script>"""
+
+# Lazy Technical Overview cards (technical_overview.register_card_callbacks): presses the "Show more"
+# button whenever it comes within a screen of the viewport, again after each batch that leaves it there.
+LAZY_SCRIPT = """
+            <script>
+                (function () {
+                    if (!("IntersectionObserver" in window)) return;
+                    var observer = new IntersectionObserver(function (entries) {
+                        entries.forEach(function (entry) {
+                            var button = entry.target;
+                            if (entry.isIntersecting && button.offsetParent && !button.hasAttribute("data-dash-is-loading")) {
+                                button.click();
+                            }
+                        });
+                    }, {rootMargin: "100% 0px"});
+                    var pending = false;
+                    new MutationObserver(function () {
+                        if (pending) return;
+                        pending = true;
+                        requestAnimationFrame(function () {
+                            pending = false;
+                            var button = document.getElementById("technical-load-more");
+                            if (!button) return;
+                            observer.unobserve(button);     // re-observing reports the current intersection
+                            observer.observe(button);
+                        });
+                    }).observe(document.documentElement, {childList: true, subtree: true, attributes: true,
+                                                          attributeFilter: ["data-dash-is-loading"]});
+                })();
+            </script>"""
+
+
+# Page template of every report app: print CSS, READY_SCRIPT and LAZY_SCRIPT
+INDEX_STRING = '''
     <!DOCTYPE html>
     <html>
         <head>
@@ -26,10 +92,13 @@ def create_dash_app(maturity_data, technical_data, critical_risks, final_maturit
                         margin-right: 20px;
                     }
                     hr { display: none; }
-                    div { page-break-inside: avoid; }
+                    /* Pages are assigned server-side (src/pagination.py): one forced break per container */
+                    .report-page { break-after: page; page-break-after: always; }
+                    .report-page:last-child { break-after: auto; page-break-after: auto; }
                     .graph-container { page-break-inside: avoid; page-break-after: auto; }
                     h1, h2 { page-break-before: auto; page-break-after: avoid; }
                     .section-break { page-break-before: always; }
+                    .technical-filters, .lazy-load-more { display: none !important; }
                     body {
                         margin: 0;
                         width: 100%;
@@ -49,10 +118,6 @@ def create_dash_app(maturity_data, technical_data, critical_risks, final_maturit
                         flex: 1;
                         min-width: 145px !important;
                     }
-                    dcc-graph {
-                        width: 100% !important;
-                        max-width: 100% !important;
-                    }
                     /* Ensure Plotly graph container scales */
                     .js-plotly-plot .plotly {
                         width: 100% !important;
@@ -82,6 +147,8 @@ def create_dash_app(maturity_data, technical_data, critical_risks, final_maturit
                     }
                 }
             </style>
+            {READY_SCRIPT}
+            {LAZY_SCRIPT}
         </head>
         <body>
             {%app_entry%}
@@ -92,11 +159,55 @@ def create_dash_app(maturity_data, technical_data, critical_risks, final_maturit
             </footer>
         </body>
     </html>
-    '''
+    '''.replace("{READY_SCRIPT}", READY_SCRIPT).replace("{LAZY_SCRIPT}", LAZY_SCRIPT)
 
-    app.layout = html.Div(style={"fontFamily": "Arial", "padding": "20px"}, children=[
-        *create_business_overview(critical_risks, final_maturity_scores),
-        *create_operational_overview(technical_data, final_maturity_scores),
-        *create_technical_overview(maturity_data)
-    ])
+def count_graphs(component):
+    """Number of dcc.Graph components in a layout tree."""
+    if isinstance(component, (list, tuple)):
+        return sum(count_graphs(child) for child in component)
+    if not hasattr(component, "to_plotly_json"):
+        return 0
+    return (type(component).__name__ == "Graph") + count_graphs(getattr(component, "children", None))
+
+
+def create_report_sections(maturity_data, technical_data, critical_risks, final_maturity_scores, compliance_posture=None,
+                           benchmark=None, client=None, svg_charts=False, chart_grid=False, source=None, card_index=None,
+                           lazy_cards=None):
+    """
+    {section title: components} in page order; sections with nothing to show are left out.
+    source, card_index and lazy_cards make the Technical Overview interactive (see create_technical_overview);
+    leave them unset for print.
+    """
+    sections = {
+        "Business Overview": create_business_overview(critical_risks, final_maturity_scores, svg_charts),
+        "Operational Overview": create_operational_overview(technical_data, final_maturity_scores, compliance_posture, svg_charts),
+        "Technical Overview": create_technical_overview(maturity_data, svg_charts, chart_grid, source, card_index, lazy_cards),
+        "Portfolio Benchmark": create_portfolio_overview(benchmark, client),
+    }
+    return {title: children for title, children in sections.items() if children}
+
+
+def report_layout(children):
+    """
+    The page root: report styling, the components split into one .report-page container per printed
+    page (see src.pagination) and the data-graphs count READY_SCRIPT waits for.
+    """
+    pages = [html.Div(className="report-page", children=page) for page in paginate(children)]
+    return html.Div(style={"fontFamily": "Arial", "padding": "20px"}, children=pages,
+                    **{"data-graphs": count_graphs(pages)})
+
+
+def create_dash_app(maturity_data, technical_data, critical_risks, final_maturity_scores, compliance_posture=None,
+                    benchmark=None, client=None, svg_charts=False, chart_grid=False):
+    return create_report_app(create_report_sections(
+        maturity_data, technical_data, critical_risks, final_maturity_scores, compliance_posture,
+        benchmark, client, svg_charts, chart_grid
+    ))
+
+
+def create_report_app(sections):
+    """Dash app showing the sections from create_report_sections one after another."""
+    app = dash.Dash(__name__, use_pages=False)
+    app.index_string = INDEX_STRING
+    app.layout = report_layout([component for children in sections.values() for component in children])
     return app
@@ -0,0 +1,372 @@
+"""SQLite store of every extracted assessment, per client and assessment date.
+
+Findings and justifications are stored zlib-compressed. Rubric titles and focus areas are
+indexed on a normalized key, so "Previous Score" is one indexed query per report and
+multi-period trends never re-parse old Markdown. Findings, business impact and solution
+text are also kept in an FTS5 full-text index, and each client's latest scores in the
+benchmark cube (src/portfolio_cube.py); both are updated as each assessment is saved.
+"""
+import sqlite3
+import zlib
+from dataclasses import replace
+from typing import NamedTuple
+
+from src.portfolio_cube import PortfolioCube
+from src.schema import (
+    MaturityItem,
+    TechnicalScore,
+    Solution,
+    CriticalRisk,
+    CompliancePosture,
+    FinalMaturityScore,
+    ReportData,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    id          INTEGER PRIMARY KEY,
+    client      TEXT NOT NULL,
+    assessed_on TEXT NOT NULL,          -- ISO date, so text order is date order
+    source      TEXT,
+    UNIQUE (client, assessed_on)
+);
+CREATE TABLE IF NOT EXISTS maturity_items (
+    assessment_id INTEGER NOT NULL REFERENCES assessments (id) ON DELETE CASCADE,
+    position      INTEGER NOT NULL,
+    title         TEXT NOT NULL,
+    title_key     TEXT NOT NULL,
+    priority      INTEGER,
+    personas      TEXT NOT NULL,
+    current       REAL NOT NULL,
+    target        REAL NOT NULL,
+    findings      BLOB NOT NULL,        -- zlib-compressed UTF-8
+    PRIMARY KEY (assessment_id, position)
+);
+CREATE INDEX IF NOT EXISTS maturity_items_title ON maturity_items (title_key, assessment_id);
+CREATE TABLE IF NOT EXISTS technical_scores (
+    assessment_id INTEGER NOT NULL REFERENCES assessments (id) ON DELETE CASCADE,
+    position      INTEGER NOT NULL,
+    area          TEXT NOT NULL,
+    area_key      TEXT NOT NULL,
+    current       INTEGER NOT NULL,
+    target        INTEGER NOT NULL,
+    justification BLOB NOT NULL,        -- zlib-compressed UTF-8
+    PRIMARY KEY (assessment_id, position)
+);
+CREATE INDEX IF NOT EXISTS technical_scores_area ON technical_scores (area_key, assessment_id);
+CREATE TABLE IF NOT EXISTS critical_risks (
+    assessment_id   INTEGER NOT NULL REFERENCES assessments (id) ON DELETE CASCADE,
+    position        INTEGER NOT NULL,
+    title           TEXT NOT NULL,
+    business_impact TEXT NOT NULL,
+    immediate       TEXT NOT NULL,
+    short_term      TEXT NOT NULL,
+    long_term       TEXT NOT NULL,
+    PRIMARY KEY (assessment_id, position)
+);
+CREATE TABLE IF NOT EXISTS compliance (
+    assessment_id INTEGER PRIMARY KEY REFERENCES assessments (id) ON DELETE CASCADE,
+    score         TEXT NOT NULL,
+    description   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS final_maturity (
+    assessment_id   INTEGER NOT NULL REFERENCES assessments (id) ON DELETE CASCADE,
+    position        INTEGER NOT NULL,
+    rubric          TEXT NOT NULL,
+    current_percent REAL NOT NULL,
+    target_percent  REAL NOT NULL,
+    decline_percent REAL,
+    PRIMARY KEY (assessment_id, position)
+);
+CREATE INDEX IF NOT EXISTS final_maturity_rubric ON final_maturity (rubric, assessment_id);
+"""
+
+# Separate from SCHEMA: SQLite builds without FTS5 still get the history tables.
+# The index keeps its own (uncompressed) copy of the text it searches. Row ids are
+# (assessment_id << SEARCH_ID_BITS) + n, so one assessment's rows are a rowid range.
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE search_index USING fts5 (
+    title,
+    body,
+    kind UNINDEXED,                     -- finding / business_impact / solution
+    tokenize = 'porter unicode61'
+);
+"""
+SEARCH_ID_BITS = 16
+
+# The latest assessment for a client strictly before a date (served by the UNIQUE index)
+PREVIOUS_ID = "SELECT id FROM assessments WHERE client = ? AND assessed_on < ? ORDER BY assessed_on DESC LIMIT 1"
+
+
+def history_key(text):
+    """Match key for rubric titles / focus areas: case- and whitespace-insensitive."""
+    return " ".join(text.split()).casefold()
+
+
+def fts_query(text):
+    """Quote every word of a plain-text query, so punctuation ("Day-1", "BCDR?") is not FTS syntax."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+class SearchHit(NamedTuple):
+    client: str
+    assessed_on: str
+    kind: str
+    title: str
+    snippet: str
+    rank: float                         # bm25; lower is a better match
+
+
+def _search_rows(assessment_id, report):
+    """(rowid, title, body, kind) rows for the full-text index."""
+    rows = [(item.title, item.findings, "finding") for item in report.maturity]
+    for risk in report.critical_risks:
+        rows.append((risk.title, risk.business_impact, "business_impact"))
+        solution = risk.solution
+        rows.append((
+            risk.title,
+            f"Immediate: {solution.immediate}\nShort-term: {solution.short_term}\nLong-term: {solution.long_term}",
+            "solution",
+        ))
+    first = assessment_id << SEARCH_ID_BITS
+    return [(first + n, *row) for n, row in enumerate(rows)]
+
+
+def _pack(text):
+    return zlib.compress(text.encode("utf-8"))
+
+
+def _unpack(blob):
+    return zlib.decompress(blob).decode("utf-8")
+
+
+class AssessmentHistory:
+    """Open (creating if needed) the history database at `path`; usable as a context manager."""
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        self.searchable = self._create_search_index()
+        self.cube = PortfolioCube(self.conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _create_search_index(self):
+        if self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'search_index'").fetchone():
+            return True
+        try:
+            self.conn.executescript(SEARCH_SCHEMA)
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ Full-text search disabled ({e}); this SQLite build has no FTS5.")
+            return False
+        self.rebuild_search_index()     # stores created before the index existed
+        return True
+
+    def rebuild_search_index(self):
+        """Re-index every stored assessment from scratch."""
+        with self.conn:
+            self.conn.execute("DELETE FROM search_index")
+            for client, assessed_on in self.conn.execute("SELECT client, assessed_on FROM assessments").fetchall():
+                assessment_id, report = self._load(client, assessed_on)
+                self._index(assessment_id, report)
+
+    def _index(self, assessment_id, report):
+        self.conn.executemany(
+            "INSERT INTO search_index (rowid, title, body, kind) VALUES (?, ?, ?, ?)",
+            _search_rows(assessment_id, report))
+
+    def save(self, client, assessed_on, report, source=None):
+        """Store `report` as the client's assessment on `assessed_on` (ISO date), replacing any earlier save."""
+        with self.conn:
+            if self.searchable:
+                old = self.conn.execute(
+                    "SELECT id FROM assessments WHERE client = ? AND assessed_on = ?", (client, assessed_on)).fetchone()
+                if old:
+                    self.conn.execute(
+                        "DELETE FROM search_index WHERE rowid BETWEEN ? AND ?",
+                        (old[0] << SEARCH_ID_BITS, ((old[0] + 1) << SEARCH_ID_BITS) - 1))
+            self.conn.execute("DELETE FROM assessments WHERE client = ? AND assessed_on = ?", (client, assessed_on))
+            assessment_id = self.conn.execute(
+                "INSERT INTO assessments (client, assessed_on, source) VALUES (?, ?, ?)",
+                (client, assessed_on, source),
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO maturity_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (assessment_id, i, item.title, history_key(item.title), item.priority, item.personas,
+                     item.current, item.target, _pack(item.findings))
+                    for i, item in enumerate(report.maturity)
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO technical_scores VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (assessment_id, i, item.area, history_key(item.area), item.current, item.target,
+                     _pack(item.justification))
+                    for i, item in enumerate(report.technical)
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO critical_risks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (assessment_id, i, risk.title, risk.business_impact,
+                     risk.solution.immediate, risk.solution.short_term, risk.solution.long_term)
+                    for i, risk in enumerate(report.critical_risks)
+                ],
+            )
+            if report.compliance:
+                self.conn.execute(
+                    "INSERT INTO compliance VALUES (?, ?, ?)",
+                    (assessment_id, report.compliance.score, report.compliance.description),
+                )
+            self.conn.executemany(
+                "INSERT INTO final_maturity VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (assessment_id, i, score.rubric, score.current_percent, score.target_percent, score.decline_percent)
+                    for i, score in enumerate(report.final_maturity)
+                ],
+            )
+            if self.searchable:
+                self._index(assessment_id, report)
+            self.cube.refresh_client(client)
+        print(f"✅ Saved {client} assessment of {assessed_on} to {self.path}")
+        return assessment_id
+
+    def clients(self):
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT client FROM assessments ORDER BY client")]
+
+    def assessment_dates(self, client):
+        return [row[0] for row in self.conn.execute(
+            "SELECT assessed_on FROM assessments WHERE client = ? ORDER BY assessed_on", (client,))]
+
+    def find_assessment(self, client, assessed_on=None):
+        """(id, assessed_on, is latest) of the client's assessment on assessed_on (default: the latest), or None."""
+        rows = self.conn.execute(
+            "SELECT id, assessed_on FROM assessments WHERE client = ? ORDER BY assessed_on", (client,)).fetchall()
+        latest = rows[-1][1] if rows else None
+        return next(((row_id, date, date == latest) for row_id, date in rows if date == (assessed_on or latest)), None)
+
+    def previous_scores(self, client, before):
+        """({title_key: current}, {area_key: current}) from the client's latest assessment before `before`."""
+        maturity = dict(self.conn.execute(
+            f"SELECT title_key, current FROM maturity_items WHERE assessment_id = ({PREVIOUS_ID})", (client, before)))
+        technical = dict(self.conn.execute(
+            f"SELECT area_key, current FROM technical_scores WHERE assessment_id = ({PREVIOUS_ID})", (client, before)))
+        return maturity, technical
+
+    def apply_previous(self, report, client, before):
+        """Return `report` with "Previous" scores filled from the client's latest assessment before `before`."""
+        maturity, technical = self.previous_scores(client, before)
+        if not maturity and not technical:
+            print(f"⚠️ No assessment for {client} before {before} in {self.path}; previous scores stay N/A.")
+            return report
+        return replace(
+            report,
+            maturity=[
+                replace(item, previous=maturity[history_key(item.title)]) if history_key(item.title) in maturity else item
+                for item in report.maturity
+            ],
+            technical=[
+                replace(item, previous=technical[history_key(item.area)]) if history_key(item.area) in technical else item
+                for item in report.technical
+            ],
+        )
+
+    def load(self, client, assessed_on):
+        """Rebuild the stored ReportData (with previous scores filled), or None if there is no such assessment."""
+        assessment_id, report = self._load(client, assessed_on)
+        if report is None:
+            return None
+        return self.apply_previous(report, client, assessed_on)
+
+    def _load(self, client, assessed_on):
+        row = self.conn.execute(
+            "SELECT id FROM assessments WHERE client = ? AND assessed_on = ?", (client, assessed_on)).fetchone()
+        if row is None:
+            return None, None
+        assessment_id = row[0]
+        maturity = [
+            MaturityItem(title, priority, personas, None, current, target, _unpack(findings))
+            for title, priority, personas, current, target, findings in self.conn.execute(
+                "SELECT title, priority, personas, current, target, findings FROM maturity_items"
+                " WHERE assessment_id = ? ORDER BY position", (assessment_id,))
+        ]
+        technical = [
+            TechnicalScore(area, None, current, target, _unpack(justification))
+            for area, current, target, justification in self.conn.execute(
+                "SELECT area, current, target, justification FROM technical_scores"
+                " WHERE assessment_id = ? ORDER BY position", (assessment_id,))
+        ]
+        risks = [
+            CriticalRisk(title, impact, Solution(immediate, short_term, long_term))
+            for title, impact, immediate, short_term, long_term in self.conn.execute(
+                "SELECT title, business_impact, immediate, short_term, long_term FROM critical_risks"
+                " WHERE assessment_id = ? ORDER BY position", (assessment_id,))
+        ]
+        compliance = self.conn.execute(
+            "SELECT score, description FROM compliance WHERE assessment_id = ?", (assessment_id,)).fetchone()
+        final = [
+            FinalMaturityScore(*row)
+            for row in self.conn.execute(
+                "SELECT rubric, current_percent, target_percent, decline_percent FROM final_maturity"
+                " WHERE assessment_id = ? ORDER BY position", (assessment_id,))
+        ]
+        return assessment_id, ReportData(maturity, technical, risks, CompliancePosture(*compliance) if compliance else None, final)
+
+    def search(self, query, client=None, kinds=None, limit=20, raw=False):
+        """Ranked full-text hits over findings, business impact and solution text.
+
+        Every word of `query` must match (Porter-stemmed, so "backups" finds "backup"); pass
+        raw=True to use FTS5 syntax instead (OR, NEAR, "exact phrase", prefix*).
+        """
+        if not self.searchable:
+            print("❌ Full-text search is not available in this SQLite build.")
+            return []
+        sql = (
+            "SELECT a.client, a.assessed_on, s.kind, s.title, snippet(search_index, 1, '[', ']', '…', 16),"
+            " bm25(search_index, 2.0, 1.0) AS hit_rank"
+            f" FROM search_index s JOIN assessments a ON a.id = s.rowid >> {SEARCH_ID_BITS}"
+            " WHERE search_index MATCH ?"
+        )
+        params = [query if raw else fts_query(query)]
+        if client:
+            sql += " AND a.client = ?"
+            params.append(client)
+        if kinds:
+            sql += f" AND s.kind IN ({', '.join('?' * len(kinds))})"
+            params += list(kinds)
+        sql += " ORDER BY hit_rank LIMIT ?"
+        params.append(limit)
+        try:
+            return [SearchHit(*row) for row in self.conn.execute(sql, params)]
+        except sqlite3.OperationalError as e:    # malformed raw FTS5 query
+            print(f"❌ Invalid search query {query!r}: {e}")
+            return []
+
+    def maturity_trend(self, client, title):
+        """[(assessed_on, current score)] for one rubric item, oldest first."""
+        return self.conn.execute(
+            "SELECT a.assessed_on, m.current FROM maturity_items m JOIN assessments a ON a.id = m.assessment_id"
+            " WHERE m.title_key = ? AND a.client = ? ORDER BY a.assessed_on", (history_key(title), client)).fetchall()
+
+    def technical_trend(self, client, area):
+        """[(assessed_on, score)] for one technical focus area, oldest first."""
+        return self.conn.execute(
+            "SELECT a.assessed_on, t.current FROM technical_scores t JOIN assessments a ON a.id = t.assessment_id"
+            " WHERE t.area_key = ? AND a.client = ? ORDER BY a.assessed_on", (history_key(area), client)).fetchall()
+
+    def final_maturity_trend(self, client, rubric):
+        """[(assessed_on, current %, target %)] for one final maturity rubric (e.g. "Overall"), oldest first."""
+        return self.conn.execute(
+            "SELECT a.assessed_on, f.current_percent, f.target_percent FROM final_maturity f"
+            " JOIN assessments a ON a.id = f.assessment_id"
+            " WHERE f.rubric = ? AND a.client = ? ORDER BY a.assessed_on", (rubric, client)).fetchall()
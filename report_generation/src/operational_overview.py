@@ -1,12 +1,13 @@
 from dash import html, dcc
 from src.styles import TABLE_STYLE, CELL_STYLE, HEADER_STYLE, BOLD_CELL_STYLE
-from src.utils import build_legend, extract_compliance_posture_from_report
+from src.utils import build_legend
 from src.chart_generation import get_technical_color, TECHNICAL_LEGEND, generate_final_maturity_chart
+from src.svg_charts import final_maturity_chart_svg, svg_graph
 
-def create_technical_table(technical_data):
+def create_technical_table(technical_data, compliance_posture=None):
     """Create a table for Technical Focus Area Scores with summary rows and compliance posture."""
     total_max = len(technical_data) * 2
-    scores = [[item["scores"][i] for item in technical_data] for i in range(3)]
+    scores = [[item.scores[i] for item in technical_data] for i in range(3)]
     totals = [sum(score) for score in scores]
     percents = [(total / total_max) * 100 if total_max > 0 else 0 for total in totals]
     # Calculate differences between consecutive years
@@ -21,11 +22,11 @@ def create_technical_table(technical_data):
     ])
 
     rows = [html.Tr([
-        html.Td(item["title"], style=CELL_STYLE),
-        html.Td("N/A" if item["prev_score_missing"] else str(item["scores"][0]), style={
-            **CELL_STYLE, "backgroundColor": get_technical_color(item["scores"][0]) if not item["prev_score_missing"] else "white"}),
-        html.Td(str(item["scores"][1]), style={**CELL_STYLE, "backgroundColor": get_technical_color(item["scores"][1])}),
-        html.Td(str(item["scores"][2]), style={**CELL_STYLE, "backgroundColor": get_technical_color(item["scores"][2])})
+        html.Td(item.area, style=CELL_STYLE),
+        html.Td("N/A" if item.prev_score_missing else str(item.previous), style={
+            **CELL_STYLE, "backgroundColor": get_technical_color(item.previous) if not item.prev_score_missing else "white"}),
+        html.Td(str(item.current), style={**CELL_STYLE, "backgroundColor": get_technical_color(item.current)}),
+        html.Td(str(item.target), style={**CELL_STYLE, "backgroundColor": get_technical_color(item.target)})
     ]) for item in technical_data]
 
     summary_rows = [
@@ -45,9 +46,6 @@ def create_technical_table(technical_data):
         ])
     ]
 
-    # Extract compliance posture from report.txt
-    compliance_posture = extract_compliance_posture_from_report()
-
     # Build the compliance posture display
     compliance_display = []
     if compliance_posture:
@@ -55,7 +53,7 @@ def create_technical_table(technical_data):
             html.Div(style={"display": "flex", "alignItems": "center", "marginTop": "20px", "pageBreakInside": "avoid"}, children=[
                 # Square box with the score
                 html.Div(
-                    html.Span(compliance_posture["score"], style={"fontSize": "24px", "fontWeight": "bold"}),
+                    html.Span(compliance_posture.score, style={"fontSize": "24px", "fontWeight": "bold"}),
                     style={
                         "width": "150px",
                         "height": "100px",
@@ -71,7 +69,7 @@ def create_technical_table(technical_data):
                 html.Div([
                     html.Strong("Overall Compliance Score"),
                     html.Br(),
-                    html.Span(compliance_posture["description"], style={"fontSize": "14px"})
+                    html.Span(compliance_posture.description, style={"fontSize": "14px"})
                 ], style={"flexGrow": "1"})
             ])
         ]
@@ -82,16 +80,19 @@ def create_technical_table(technical_data):
         *compliance_display  # Add the compliance posture display below the table and legend
     ])
 
-def create_operational_overview(technical_data, final_maturity_scores=None):
-    """Generate the Operational Overview section layout."""
+def create_operational_overview(technical_data, final_maturity_scores=None, compliance_posture=None, svg_charts=False):
+    """Generate the Operational Overview section layout; svg_charts draws the bar chart as static SVG."""
     # Filter out the Overall rubric from final_maturity_scores
-    filtered_maturity_scores = [score for score in final_maturity_scores if score["rubric"] != "Overall"] if final_maturity_scores else []
+    filtered_maturity_scores = [score for score in final_maturity_scores if score.rubric != "Overall"] if final_maturity_scores else []
 
     final_maturity_graph = []
     if filtered_maturity_scores:
         final_maturity_graph = [
             html.H3("Final Maturity Scores", style={"color": "#2a4e85", "marginTop": "20px"}),
-            dcc.Graph(
+            svg_graph(
+                final_maturity_chart_svg(filtered_maturity_scores),
+                style={"marginTop": "10px", "pageBreakInside": "avoid"}
+            ) if svg_charts else dcc.Graph(
                 figure=generate_final_maturity_chart(filtered_maturity_scores),
                 config={"displayModeBar": False},
                 style={"marginTop": "10px", "pageBreakInside": "avoid"}
@@ -100,7 +101,7 @@ def create_operational_overview(technical_data, final_maturity_scores=None):
 
     return [
         html.H1("Operational Overview", style={"color": "#2a4e85", "marginTop": "40px"}),
-        create_technical_table(technical_data),
+        create_technical_table(technical_data, compliance_posture),
         html.Div([
             html.P([
                 html.Strong("Platform Maturity:"),
@@ -0,0 +1,287 @@
+"""Server-side pagination of the report for print.
+
+Instead of leaving Chromium to resolve page-break constraints on every nested card and table, the
+printed height of each top-level block is estimated from what the layout already knows (figure
+heights, SVG sizes, font sizes and text length at the column width) and the blocks are packed into
+explicit `.report-page` containers. The print CSS then only needs one forced break per container,
+so layout is a single cheap pass and the same report always paginates the same way.
+
+Tall tables are split between rows (repeating their header row), headings are kept with the block
+that follows them, and `pageBreakBefore: always` still starts a new page. A block taller than a
+page starts in place, breaks naturally inside its container and the next block starts a new page.
+"""
+import base64
+import re
+
+from dash import html
+
+# A4 is 794 x 1123 CSS px; the print CSS has 20px @page margins and the root div 20px padding
+PAGE_WIDTH = 794 - 2 * 20 - 2 * 20
+PAGE_HEIGHT = 1123 - 2 * 20
+ROOT_PADDING = 20               # only the first page carries the root's top padding
+PAGE_FILL = 0.92                # share of a page the estimates may fill; they are approximate
+
+BASE_FONT = 16                  # px
+CHAR_WIDTH = 0.5                # average Arial advance, in em
+BOLD_CHAR_WIDTH = 0.55
+LINE_HEIGHT = 1.15              # "normal" line height, in em
+
+# Browser defaults: heading font sizes and vertical margins, in em
+TAG_FONT = {"H1": 2.0, "H2": 1.5, "H3": 1.17, "H4": 1.0, "H5": 0.83, "H6": 0.67}
+TAG_MARGIN = {"H1": 0.67, "H2": 0.83, "H3": 1.0, "H4": 1.33, "H5": 1.67, "H6": 2.33, "P": 1.0}
+HEADINGS = {"H1", "H2", "H3", "H4", "H5", "H6"}
+INLINE_TAGS = {"Span", "Strong", "B", "Em", "I", "A", "Code", "Small", "Br"}
+CELL_PADDING = 1                # default <td>/<th> padding
+DEFAULT_GRAPH_HEIGHT = 450      # plotly.js default figure height
+SVG_PREFIX = "data:image/svg+xml;base64,"
+SVG_SIZE = re.compile(r'<svg[^>]*? width="([\d.]+)" height="([\d.]+)"')
+LENGTH = re.compile(r"\s*(-?\d+(?:\.\d+)?)(px|em)?(?=\s|$)")     # "20px", "1.5em", 0, "2px solid #000"
+
+
+def _kind(node):
+    return type(node).__name__
+
+
+def _children(node):
+    children = getattr(node, "children", None)
+    if children is None:
+        return []
+    return list(children) if isinstance(children, (list, tuple)) else [children]
+
+
+def _px(value, font=BASE_FONT):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = LENGTH.match(value) if isinstance(value, str) else None
+    if not match:
+        return None
+    return float(match[1]) * (font if match[2] == "em" else 1)
+
+
+def _edge(style, prop, side, font, default=0.0):
+    """One side of margin/padding/border from its longhand or its (single-value) shorthand."""
+    for key in (f"{prop}{side}", prop):
+        value = _px(style.get(key), font)
+        if value is not None:
+            return value
+    return default
+
+
+def _text(node):
+    """Inline text of node, with <br> as a newline."""
+    if node is None:
+        return ""
+    if isinstance(node, (list, tuple)):
+        return "".join(_text(child) for child in node)
+    if isinstance(node, (str, int, float)):
+        return str(node)
+    if _kind(node) == "Br":
+        return "\n"
+    return _text(getattr(node, "children", None))
+
+
+def _text_height(text, width, font, char_width=CHAR_WIDTH):
+    per_line = max(1, int(width / (font * char_width)))
+    return sum(max(1, -(-len(line) // per_line)) for line in text.split("\n")) * font * LINE_HEIGHT
+
+
+def _flow(children, width, font, char_width=CHAR_WIDTH):
+    """Height of block content: runs of inline children wrap as text, block children stack."""
+    height, run = 0.0, []
+    for child in children:
+        if isinstance(child, (str, int, float)) or _kind(child) in INLINE_TAGS:
+            run.append(_text(child))
+            continue
+        if "".join(run).strip():
+            height += _text_height("".join(run), width, font, char_width)
+        run = []
+        height += estimate(child, width, font)
+    if "".join(run).strip():
+        height += _text_height("".join(run), width, font, char_width)
+    return height
+
+
+def _figure_size(figure):
+    layout = (figure.to_plotly_json() if hasattr(figure, "to_plotly_json") else figure or {}).get("layout") or {}
+    return layout.get("width"), layout.get("height") or DEFAULT_GRAPH_HEIGHT
+
+
+def _image_size(node):
+    src = getattr(node, "src", "") or ""
+    if src.startswith(SVG_PREFIX):
+        head = base64.b64decode(src[len(SVG_PREFIX):len(SVG_PREFIX) + 400]).decode("utf-8", "ignore")
+        size = SVG_SIZE.match(head)
+        if size:
+            return float(size[1]), float(size[2])
+    return _px(getattr(node, "width", None)), _px(getattr(node, "height", None))
+
+
+def _flex_basis(node):
+    """Width a flex item takes before growing, or None if it grows into the free space."""
+    if isinstance(node, (str, int, float)):
+        return None
+    style = getattr(node, "style", None) or {}
+    flex = str(style.get("flex", ""))
+    if style.get("flexGrow") not in (None, 0, "0") or (flex and len(flex.split()) == 1):
+        return None
+    for value in (flex.split()[-1] if flex else None, style.get("flexBasis"), style.get("width"), style.get("minWidth")):
+        if _px(value) is not None:
+            return _px(value)
+    if _kind(node) == "Graph":
+        return _figure_size(getattr(node, "figure", None))[0]
+    if _kind(node) == "Img":
+        return _image_size(node)[0]
+    return None
+
+
+def _flex_height(children, width, style, font):
+    items = [child for child in children if child is not None]
+    if not items:
+        return 0.0
+    gap = _px(style.get("gap")) or 0.0
+    bases = [_flex_basis(item) for item in items]
+    free = width - sum(basis for basis in bases if basis) - gap * (len(items) - 1)
+    growing = sum(basis is None for basis in bases)
+    widths = [basis if basis is not None else max(free, 0) / growing for basis in bases]
+    if style.get("flexWrap") == "wrap" and growing and free / growing < min(
+            _px((getattr(item, "style", None) or {}).get("minWidth")) or 0 for item in items):
+        # Not enough room for the growing items: each item wraps onto its own row
+        return sum(estimate(item, width, font) for item in items) + gap * (len(items) - 1)
+    return max(estimate(item, item_width, font) for item, item_width in zip(items, widths))
+
+
+def _rows(table):
+    rows = []
+    for child in _children(table):
+        rows.extend(_rows(child) if _kind(child) in ("Thead", "Tbody", "Tfoot") else [child])
+    return rows
+
+
+def _cell_metrics(cell, font):
+    style = getattr(cell, "style", None) or {}
+    cell_font = _px(style.get("fontSize")) or font
+    pad = [_edge(style, "padding", side, cell_font, CELL_PADDING) for side in ("Top", "Bottom", "Left", "Right")]
+    char_width = BOLD_CHAR_WIDTH if _kind(cell) == "Th" or style.get("fontWeight") == "bold" else CHAR_WIDTH
+    text = _text(cell)
+    longest = max((len(word) for word in text.split()), default=0) * cell_font * char_width + pad[2] + pad[3]
+    preferred = _px(style.get("width")) or max(map(len, text.split("\n"))) * cell_font * char_width + pad[2] + pad[3]
+    return style, cell_font, pad, char_width, longest, max(preferred, longest)
+
+
+def _row_height(row, width, font):
+    """Tallest cell of a row; columns get at least their longest word, like the auto table layout."""
+    cells = [cell for cell in _children(row) if _kind(cell) in ("Td", "Th")]
+    if not cells:
+        return 0.0
+    metrics = [_cell_metrics(cell, font) for cell in cells]
+    minimum, preferred = sum(m[4] for m in metrics), sum(m[5] for m in metrics)
+    if preferred <= width:
+        # Fixed-width cells keep their width, the others share what is left in proportion to their text
+        flexible = sum(m[5] for m, cell in zip(metrics, cells) if not _px(m[0].get("width")))
+        spare = width - preferred
+        widths = [m[5] + (0 if _px(m[0].get("width")) else spare * m[5] / flexible) for m in metrics] \
+            if flexible else [m[5] for m in metrics]
+    else:
+        spare = max(width - minimum, 0)
+        widths = [m[4] + spare * (m[5] - m[4]) / max(preferred - minimum, 1) for m in metrics]
+    height = 0.0
+    for cell, (style, cell_font, pad, char_width, _, _), cell_width in zip(cells, metrics, widths):
+        inner = max(cell_width - pad[2] - pad[3], cell_font)
+        height = max(height, pad[0] + pad[1] + 2 * _edge(style, "border", "Top", cell_font)
+                     + _flow(_children(cell), inner, cell_font, char_width))
+    return height
+
+
+def estimate(node, width=PAGE_WIDTH, font=BASE_FONT):
+    """Printed height in px of a Dash component laid out `width` px wide (margins included)."""
+    if node is None:
+        return 0.0
+    if isinstance(node, (list, tuple)):
+        return _flow(node, width, font)
+    if isinstance(node, (str, int, float)):
+        return _text_height(str(node), width, font)
+    kind = _kind(node)
+    if kind == "Hr":                    # hidden in print
+        return 0.0
+    style = getattr(node, "style", None) or {}
+    font = _px(style.get("fontSize"), font) or font * TAG_FONT.get(kind, 1)
+    outer = sum(_edge(style, "margin", side, font, TAG_MARGIN.get(kind, 0) * font) for side in ("Top", "Bottom"))
+    box = sum(_edge(style, prop, side, font) for prop in ("padding", "border") for side in ("Top", "Bottom"))
+    inner = width - sum(_edge(style, prop, side, font) for prop in ("margin", "padding", "border")
+                        for side in ("Left", "Right"))
+
+    if _px(style.get("height")) is not None:
+        return outer + _px(style["height"]) + (0 if style.get("boxSizing") == "border-box" else box)
+    if kind == "Graph":
+        content = _figure_size(getattr(node, "figure", None))[1]
+    elif kind == "Img":
+        image_width, image_height = _image_size(node)
+        content = (image_height or 0) * (min(image_width, inner) / image_width if image_width else 1)
+    elif kind == "Table":
+        content = sum(_row_height(row, inner, font) for row in _rows(node))
+    elif style.get("display") == "flex":
+        content = _flex_height(_children(node), inner, style, font)
+    else:
+        content = _flow(_children(node), inner, font, BOLD_CHAR_WIDTH if kind in HEADINGS else CHAR_WIDTH)
+    return outer + box + content
+
+
+def _blocks(children):
+    """Top-level blocks in page order; unstyled wrapper divs are opened so their contents can start pages.
+
+    A div with an id stays whole: callbacks may target it, even while it is empty.
+    """
+    for child in children:
+        if _kind(child) == "Div" and not any(getattr(child, prop, None) for prop in ("id", "style", "className")):
+            yield from _blocks(_children(child))
+        elif child is not None:
+            yield child
+
+
+def _table_parts(table, width, space, budget):
+    """Split a table between rows into (part, height) pieces: the first fits `space`, the rest `budget`."""
+    rows = _rows(table)
+    header = rows[:1] if rows and any(_kind(cell) == "Th" for cell in _children(rows[0])) else []
+    body = rows[len(header):]
+    style = getattr(table, "style", None) or {}
+    extra = estimate(html.Table(style=style, children=header), width)
+    part, used = [], extra
+    for row in body:
+        height = _row_height(row, width, BASE_FONT)
+        if part and used + height > space:
+            yield html.Table(style=style, children=header + part), used
+            part, used, space = [], extra, budget
+        part.append(row)
+        used += height
+    yield html.Table(style=style, children=header + part), used
+
+
+def paginate(children, width=PAGE_WIDTH, height=PAGE_HEIGHT):
+    """Split a section's components into lists of components, one list per printed page."""
+    budget = height * PAGE_FILL
+    pages, page, used = [], [], ROOT_PADDING
+
+    def place(block, block_height):
+        nonlocal page, used
+        # A block taller than a page breaks inside anyway, so it starts where it is
+        if page and used + block_height > budget and block_height <= budget:
+            # Keep a trailing heading with the block it introduces
+            carried = [page.pop()] if _kind(page[-1]) in HEADINGS and len(page) > 1 else []
+            pages.append(page)
+            page, used = carried, sum(estimate(heading, width) for heading in carried)
+        page.append(block)
+        used += block_height
+
+    for block in _blocks(children):
+        if page and (getattr(block, "style", None) or {}).get("pageBreakBefore") == "always":
+            pages.append(page)
+            page, used = [], 0.0
+        block_height = estimate(block, width)
+        if _kind(block) == "Table" and used + block_height > budget:
+            for part, part_height in _table_parts(block, width, budget - used, budget):
+                place(part, part_height)
+        else:
+            place(block, block_height)
+    if page:
+        pages.append(page)
+    return pages
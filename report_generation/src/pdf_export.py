@@ -6,13 +6,10 @@ async def export_dash_to_pdf():
     page = await browser.newPage()
 
     # Load your Dash app
-    await page.goto('http://127.0.0.1:8050', {'waitUntil': 'networkidle2'})
+    await page.goto('http://127.0.0.1:8050', {'waitUntil': 'load'})
 
-    # Wait for Plotly to fully render bars (wait for at least one graph SVG node)
-    await page.waitForSelector('g.cartesianlayer')
-
-    # Give it a little buffer just in case (helps with animations)
-    await asyncio.sleep(2)
+    # Wait until every graph has drawn and fonts are loaded (window.reportReady, see document_creation)
+    await page.waitForFunction('() => window.reportReady === true', {'timeout': 120000, 'polling': 'raf'})
 
     # Export to PDF
     await page.pdf({
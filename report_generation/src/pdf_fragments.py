@@ -0,0 +1,113 @@
+"""Section-fragment PDF export with a content-hash cache.
+
+Each report section (Business, Operational, Technical, Portfolio) is rendered to its own static
+HTML page and printed on its own browser page, all sections in parallel. A fragment is stored
+under the SHA-256 of its HTML, which holds the section's data, figures, styles and print CSS, so
+a re-export only prints the sections whose content changed and reuses the cached PDFs of the rest.
+The fragments are then concatenated with one bookmark per section and "n / total" page numbers
+stamped across the whole document, and the result is deduplicated by src.pdf_optimize (each
+fragment embeds its own copy of the fonts).
+"""
+import hashlib
+import json
+import os
+import time
+
+from pypdf import PageObject, PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from src.browser_pool import PDF_OPTIONS, export_pdfs
+from src.config import PDF_FRAGMENT_DIR
+from src.document_creation import report_layout
+from src.pdf_optimize import describe, optimize_pdf
+from src.static_html import render_static_html
+
+FRAGMENT_CACHE_LIMIT = 200      # cached fragment PDFs kept; the least recently used are removed
+PAGE_NUMBER_FONT_SIZE = 7
+PAGE_NUMBER_BASELINE = 5        # points above the bottom edge, inside the 20px print margin
+
+
+def fragment_key(html):
+    """Cache key for a section page: its HTML and the print options it is rendered with."""
+    digest = hashlib.sha256(json.dumps(PDF_OPTIONS, sort_keys=True).encode())
+    digest.update(html.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _page_number_stamp(width, height, text):
+    """A transparent page holding only `text`, centred in the bottom margin (Helvetica needs no embedding)."""
+    stamp = PageObject.create_blank_page(width=width, height=height)
+    font = DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    })
+    stamp[NameObject("/Resources")] = DictionaryObject({
+        NameObject("/Font"): DictionaryObject({NameObject("/FPageNumber"): font})
+    })
+    x = (width - len(text) * PAGE_NUMBER_FONT_SIZE * 0.5) / 2     # ~0.5em per digit/space in Helvetica
+    content = DecodedStreamObject()
+    content.set_data(
+        f"BT /FPageNumber {PAGE_NUMBER_FONT_SIZE} Tf 0.4 g {x:.2f} {PAGE_NUMBER_BASELINE} Td ({text}) Tj ET".encode()
+    )
+    stamp[NameObject("/Contents")] = content
+    return stamp
+
+
+def assemble(fragments, output):
+    """Concatenate [(section title, fragment PDF)] into output, bookmarking each section and numbering pages."""
+    writer = PdfWriter()
+    for title, path in fragments:
+        writer.append(path, outline_item=title)
+    total = len(writer.pages)
+    for number, page in enumerate(writer.pages, 1):
+        page.merge_page(_page_number_stamp(float(page.mediabox.width), float(page.mediabox.height), f"{number} / {total}"))
+    with open(output, "wb") as f:
+        writer.write(f)
+    return total
+
+
+def _prune(cache_dir, limit=FRAGMENT_CACHE_LIMIT):
+    paths = sorted((os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".pdf")),
+                   key=os.path.getmtime, reverse=True)
+    for path in paths[limit:]:
+        os.remove(path)
+
+
+async def export_sectioned_pdf(app, sections, output, cache_dir=PDF_FRAGMENT_DIR, endpoint_path=None):
+    """
+    Print {title: components} from create_report_sections to output, one fragment per section, in the
+    app's page template. Only fragments missing from cache_dir are rendered; returns (rendered, cached).
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    fragments, jobs = [], {}
+    for title, children in sections.items():
+        html = render_static_html(app, layout=report_layout(children))
+        path = os.path.join(cache_dir, f"{fragment_key(html)}.pdf")
+        fragments.append((title, path))
+        if os.path.exists(path):
+            os.utime(path)          # keep recently used fragments through _prune
+        elif path not in jobs:
+            jobs[path] = (title, html)
+
+    if jobs:
+        parts = {path: f"{path}.{os.getpid()}.part" for path in jobs}
+        results = await export_pdfs([(html, parts[path]) for path, (_, html) in jobs.items()],
+                                    pages=len(jobs), endpoint_path=endpoint_path)
+        failed = []
+        for (path, (title, _)), result in zip(jobs.items(), results):
+            if isinstance(result, BaseException):
+                failed.append(f"{title}: {result}")
+                if os.path.exists(parts[path]):
+                    os.remove(parts[path])
+            else:
+                os.replace(parts[path], path)   # only complete fragments enter the cache
+        if failed:
+            raise RuntimeError("; ".join(failed))
+
+    start = time.perf_counter()
+    pages = assemble(fragments, output)
+    _prune(cache_dir)
+    print(f"✅ Assembled {len(fragments)} sections, {pages} pages in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"✅ Optimised {describe(output, optimize_pdf(output))}")
+    return len(jobs), len(fragments) - len(jobs)
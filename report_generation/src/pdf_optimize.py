@@ -0,0 +1,116 @@
+"""PDF post-processing: the same pages in fewer bytes.
+
+Chromium already embeds subset fonts and keeps Plotly's SVG and the SVG charts as vector paths, but
+every print of a section, fragment or report embeds its own copy of each font subset and image, and
+page content is compressed at the default level. optimize_pdf stores identical objects (font
+programs, images, XObjects) once, drops unreferenced ones and recompresses page content at the
+highest zlib level; when that does not make the file smaller (a print with few repeated objects
+can come out slightly larger), the original bytes are kept. It also reports what is embedded, so
+a font embedded whole or a chart printed as a raster image shows up in the logs.
+"""
+import io
+import re
+from typing import NamedTuple
+
+from pypdf import PdfReader, PdfWriter
+
+SUBSET_FONT = re.compile(r"^/?[A-Z]{6}\+")      # subset fonts are named ABCDEF+FontName
+
+
+class PdfStats(NamedTuple):
+    before: int             # bytes
+    after: int
+    pages: int
+    fonts: int              # distinct embedded font programs
+    full_fonts: list        # base names of fonts embedded without subsetting
+    images: int             # distinct raster images
+    forms: int              # distinct vector form XObjects
+    kept_original: bool = False     # the optimised copy was not smaller, so the input bytes were kept
+
+    @property
+    def saved(self):
+        return 1 - self.after / self.before if self.before else 0.0
+
+
+def _font_files(font):
+    descriptors = [font.get("/FontDescriptor")]
+    descriptors += [descendant.get_object().get("/FontDescriptor") for descendant in font.get("/DescendantFonts", [])]
+    for descriptor in descriptors:
+        descriptor = descriptor.get_object() if descriptor is not None else {}
+        for key in ("/FontFile", "/FontFile2", "/FontFile3"):
+            if key in descriptor:
+                yield descriptor.raw_get(key)
+
+
+def _resources(resources, fonts, xobjects, seen):
+    """Collect embedded fonts and XObjects of a resource dictionary, following nested form XObjects."""
+    resources = resources.get_object() if resources is not None else {}
+    for ref in (resources.get("/Font") or {}).values():
+        font = ref.get_object()
+        for file_ref in _font_files(font):
+            fonts.setdefault(getattr(file_ref, "idnum", id(file_ref)), set()).add(str(font.get("/BaseFont", "")))
+    for ref in (resources.get("/XObject") or {}).values():
+        key = getattr(ref, "idnum", id(ref))
+        if key in seen:
+            continue
+        seen.add(key)
+        xobject = ref.get_object()
+        xobjects[key] = xobject.get("/Subtype")
+        if xobject.get("/Subtype") == "/Form":
+            _resources(xobject.get("/Resources"), fonts, xobjects, seen)
+
+
+def embedded_resources(pdf):
+    """({font file id: {base font names}}, {xobject id: subtype}) across every page of a reader or writer."""
+    fonts, xobjects, seen = {}, {}, set()
+    for page in pdf.pages:
+        _resources(page.get("/Resources"), fonts, xobjects, seen)
+    return fonts, xobjects
+
+
+def optimize_writer(writer):
+    """Deduplicate and recompress a PdfWriter in place before it is written."""
+    for page in writer.pages:
+        page.compress_content_streams(level=9)
+    writer.compress_identical_objects()
+
+
+def optimize_pdf(path, output=None):
+    """
+    Rewrite path (or write output) with optimize_writer, keeping the original bytes unless that
+    makes the file smaller; returns PdfStats for the result.
+    """
+    output = output or path
+    with open(path, "rb") as f:
+        original = f.read()     # output may be path itself
+    writer = PdfWriter(clone_from=PdfReader(io.BytesIO(original)))
+    optimize_writer(writer)
+    optimized = io.BytesIO()
+    writer.write(optimized)
+    kept_original = optimized.getbuffer().nbytes >= len(original)
+    result = original if kept_original else optimized.getvalue()
+    if not (kept_original and output == path):
+        with open(output, "wb") as f:
+            f.write(result)
+    fonts, xobjects = embedded_resources(PdfReader(io.BytesIO(result)))
+    return PdfStats(
+        before=len(original),
+        after=len(result),
+        pages=len(writer.pages),
+        fonts=len(fonts),
+        full_fonts=sorted({name.lstrip("/") for names in fonts.values() for name in names if not SUBSET_FONT.match(name)}),
+        images=sum(subtype == "/Image" for subtype in xobjects.values()),
+        forms=sum(subtype == "/Form" for subtype in xobjects.values()),
+        kept_original=kept_original,
+    )
+
+
+def describe(path, stats):
+    """One-line size and resource summary for the logs."""
+    size = (f"{stats.before / 1024:.0f} KB, kept as is (optimising did not make it smaller)" if stats.kept_original
+            else f"{stats.before / 1024:.0f} KB -> {stats.after / 1024:.0f} KB ({stats.saved:.0%} smaller)")
+    line = (f"{path}: {size}, "
+            f"{stats.pages} pages, {stats.fonts} fonts, {stats.images} raster images, {stats.forms} vector forms")
+    if stats.full_fonts:
+        line += f"; fonts embedded whole: {', '.join(stats.full_fonts)}"
+    return line
@@ -0,0 +1,151 @@
+"""Vectorized analytics over every assessment in the history store.
+
+Portfolio.from_history loads the maturity, technical and final maturity scores of all stored
+assessments into (assessments x columns) NumPy arrays, NaN where a report has no such row.
+Rows are sorted by client, then assessment date, so "latest per client" and "previous period"
+are array masks and shifts rather than per-report loops.
+"""
+import warnings
+from typing import List, NamedTuple
+
+import numpy as np
+
+PERCENTILES = (10, 25, 50, 75, 90)
+TECHNICAL_MAX = 2                       # technical focus areas are scored 0–2
+
+# (assessment_id, match key, display name, score) for each kind of score
+SCORE_QUERIES = {
+    "maturity": "SELECT assessment_id, title_key, title, current FROM maturity_items ORDER BY assessment_id, position",
+    "technical": "SELECT assessment_id, area_key, area, current FROM technical_scores ORDER BY assessment_id, position",
+    "final": "SELECT assessment_id, rubric, rubric, current_percent FROM final_maturity ORDER BY assessment_id, position",
+}
+
+
+class ScoreMatrix(NamedTuple):
+    columns: List[str]                  # display names, in the order they first appear
+    values: np.ndarray                  # float (n_assessments, n_columns); NaN = not in that report
+
+
+def _score_matrix(rows, row_of, n_rows):
+    column_of, columns = {}, []
+    for _, key, name, _ in rows:
+        if key not in column_of:
+            column_of[key] = len(columns)
+            columns.append(name)
+    values = np.full((n_rows, len(columns)), np.nan)
+    if rows:
+        assessment_ids, keys, _, scores = zip(*rows)
+        cols = np.fromiter((column_of[key] for key in keys), dtype=np.intp, count=len(rows))
+        values[row_of[np.array(assessment_ids)], cols] = scores
+    return ScoreMatrix(columns, values)
+
+
+def _quietly(func, *args, **kwargs):
+    """Run a nan-aware NumPy reduction; all-NaN columns give NaN without a RuntimeWarning."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return func(*args, **kwargs)
+
+
+class Portfolio:
+    """Scores of many assessments as arrays; `kind` is "maturity", "technical" or "final"."""
+
+    def __init__(self, clients, dates, maturity, technical, final):
+        self.clients = clients          # str (n_assessments,), sorted
+        self.dates = dates              # ISO date str (n_assessments,), sorted within each client
+        self.scores = {"maturity": maturity, "technical": technical, "final": final}
+
+        new_client = np.ones(len(clients), bool)
+        new_client[1:] = clients[1:] != clients[:-1]
+        self.latest = np.roll(new_client, -1)             # the row before each client's first is its latest
+        self.previous = np.arange(len(clients)) - 1      # row of the same client's previous assessment, or -1
+        self.previous[new_client] = -1
+
+    @classmethod
+    def from_history(cls, history):
+        """Load every assessment in an AssessmentHistory."""
+        assessments = history.conn.execute(
+            "SELECT id, client, assessed_on FROM assessments ORDER BY client, assessed_on").fetchall()
+        ids = np.array([row[0] for row in assessments], dtype=np.int64)
+        row_of = np.full(ids.max() + 1 if len(ids) else 1, -1)
+        row_of[ids] = np.arange(len(ids))
+        matrices = {
+            kind: _score_matrix(history.conn.execute(sql).fetchall(), row_of, len(ids))
+            for kind, sql in SCORE_QUERIES.items()
+        }
+        return cls(
+            np.array([row[1] for row in assessments], dtype=str),
+            np.array([row[2] for row in assessments], dtype=str),
+            matrices["maturity"], matrices["technical"], matrices["final"],
+        )
+
+    def __len__(self):
+        return len(self.clients)
+
+    def columns(self, kind):
+        return self.scores[kind].columns
+
+    def _values(self, kind, latest_only):
+        values = self.scores[kind].values
+        return values[self.latest] if latest_only else values
+
+    def client_row(self, client):
+        """Row index of the client's latest assessment, or None."""
+        rows = np.flatnonzero(self.latest & (self.clients == client))
+        return int(rows[0]) if len(rows) else None
+
+    def distribution(self, kind, latest_only=True):
+        """Per-column count, mean, std, min and max (over each client's latest assessment by default)."""
+        values = self._values(kind, latest_only)
+        return {
+            "count": np.count_nonzero(~np.isnan(values), axis=0),
+            "mean": _quietly(np.nanmean, values, axis=0),
+            "std": _quietly(np.nanstd, values, axis=0),
+            "min": _quietly(np.nanmin, values, axis=0, initial=np.nan),
+            "max": _quietly(np.nanmax, values, axis=0, initial=np.nan),
+        }
+
+    def percentiles(self, kind, q=PERCENTILES, latest_only=True):
+        """(len(q), n_columns) array of score percentiles."""
+        return _quietly(np.nanpercentile, self._values(kind, latest_only), q, axis=0)
+
+    def deltas(self, kind):
+        """Change of every score versus the same client's previous assessment; NaN for first assessments."""
+        values = self.scores[kind].values
+        deltas = values - values[self.previous]
+        deltas[self.previous < 0] = np.nan
+        return deltas
+
+    def percentile_ranks(self, kind, client):
+        """Where the client's latest scores fall among every other client's latest scores (0–100 per column)."""
+        row = self.client_row(client)
+        if row is None:
+            return None
+        values = self.scores[kind].values
+        own = values[row]
+        others = values[self.latest & (self.clients != client)]
+        valid = np.count_nonzero(~np.isnan(others), axis=0)
+        below = np.count_nonzero(others < own, axis=0)
+        tied = np.count_nonzero(others == own, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ranks = (below + 0.5 * tied) / valid * 100
+        ranks[np.isnan(own) | (valid == 0)] = np.nan
+        return ranks
+
+    def cohort_means(self, kind, cohort_of):
+        """({cohort: per-column mean of latest scores}) for a {client: cohort} mapping; unmapped clients are skipped."""
+        values = self._values(kind, latest_only=True)
+        labels = np.array([cohort_of.get(client, "") for client in self.clients[self.latest]], dtype=str)
+        cohorts, codes = np.unique(labels, return_inverse=True)
+        members = (codes == np.arange(len(cohorts))[:, None]).astype(float)   # (n_cohorts, n_latest) one-hot
+        present = ~np.isnan(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = (members @ np.where(present, values, 0.0)) / (members @ present)
+        return {str(cohort): means[i] for i, cohort in enumerate(cohorts) if cohort}
+
+    def technical_percent(self):
+        """Technical focus area total as a percentage of the maximum, per assessment (as in the Operational Overview)."""
+        values = self.scores["technical"].values
+        answered = np.count_nonzero(~np.isnan(values), axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.nansum(values, axis=1) / (answered * TECHNICAL_MAX) * 100
@@ -0,0 +1,140 @@
+"""Pre-aggregated benchmark cube kept inside the assessment history database.
+
+cube_latest holds each client's latest Final Maturity and Technical Focus Area scores, and
+cube_counts how many clients currently have each score value per rubric/area. When a report
+is saved, only that client's rows are swapped and the counts adjusted, so the portfolio view
+reads a handful of aggregate rows instead of scanning stored reports. cube_version counts those
+refreshes, so readers can tell whether anything was saved since they last looked.
+"""
+import math
+from typing import NamedTuple, Optional
+
+CUBE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cube_latest (
+    client     TEXT NOT NULL,
+    kind       TEXT NOT NULL,           -- final / technical
+    column_key TEXT NOT NULL,
+    column     TEXT NOT NULL,
+    position   INTEGER NOT NULL,
+    value      REAL NOT NULL,
+    PRIMARY KEY (client, kind, column_key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cube_counts (
+    kind       TEXT NOT NULL,
+    column_key TEXT NOT NULL,
+    value      REAL NOT NULL,
+    clients    INTEGER NOT NULL,
+    PRIMARY KEY (kind, column_key, value)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cube_version (
+    id      INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL            -- bumped by every refresh_client
+);
+"""
+
+# One client's latest assessment, as (kind, column_key, column, position, value) rows
+LATEST_SCORES = """
+WITH latest AS (SELECT id FROM assessments WHERE client = :client ORDER BY assessed_on DESC LIMIT 1)
+SELECT 'final', rubric, rubric, position, current_percent FROM final_maturity WHERE assessment_id = (SELECT id FROM latest)
+UNION ALL
+SELECT 'technical', area_key, area, position, current FROM technical_scores WHERE assessment_id = (SELECT id FROM latest)
+"""
+
+# Final maturity rubrics shown in the benchmark (Overall is their average)
+BENCHMARK_RUBRICS = ("Viability", "Success", "Upkeep", "Support")
+
+
+class BenchmarkRow(NamedTuple):
+    column: str                         # rubric or technical focus area
+    value: float                        # the client's latest score
+    percentile: Optional[float]         # share of other clients scoring lower (ties count half), 0–100
+    p25: Optional[float]
+    median: Optional[float]
+    p75: Optional[float]
+    peers: int                          # other clients with a score for this column
+
+
+def _quantile(counts, total, q):
+    """Nearest-rank quantile from sorted (value, clients) buckets."""
+    rank = max(1, math.ceil(q * total))
+    seen = 0
+    for value, clients in counts:
+        seen += clients
+        if seen >= rank:
+            return value
+    return None
+
+
+def _benchmark_row(column, value, counts):
+    counts = [(v, n - 1 if v == value else n) for v, n in counts]   # compare against the *other* clients
+    counts = [(v, n) for v, n in counts if n > 0]
+    peers = sum(n for _, n in counts)
+    if not peers:
+        return BenchmarkRow(column, value, None, None, None, None, 0)
+    below = sum(n for v, n in counts if v < value)
+    tied = sum(n for v, n in counts if v == value)
+    return BenchmarkRow(
+        column, value, (below + 0.5 * tied) / peers * 100,
+        _quantile(counts, peers, 0.25), _quantile(counts, peers, 0.5), _quantile(counts, peers, 0.75), peers,
+    )
+
+
+class PortfolioCube:
+    """Maintains the cube tables on an open history connection (see AssessmentHistory.save)."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        created = not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'cube_counts'").fetchone()
+        conn.executescript(CUBE_SCHEMA)
+        if created:
+            with conn:
+                self.rebuild()          # stores created before the cube existed
+
+    def rebuild(self):
+        self.conn.execute("DELETE FROM cube_latest")
+        self.conn.execute("DELETE FROM cube_counts")
+        for (client,) in self.conn.execute("SELECT DISTINCT client FROM assessments").fetchall():
+            self.refresh_client(client)
+
+    def refresh_client(self, client):
+        """Swap in the client's latest scores and adjust the counts; call inside the saving transaction."""
+        old = self.conn.execute(
+            "SELECT kind, column_key, value FROM cube_latest WHERE client = ?", (client,)).fetchall()
+        new = self.conn.execute(LATEST_SCORES, {"client": client}).fetchall()
+        self.conn.executemany(
+            "UPDATE cube_counts SET clients = clients - 1 WHERE kind = ? AND column_key = ? AND value = ?", old)
+        self.conn.execute("DELETE FROM cube_counts WHERE clients <= 0")
+        self.conn.execute("DELETE FROM cube_latest WHERE client = ?", (client,))
+        self.conn.executemany(
+            "INSERT INTO cube_latest VALUES (?, ?, ?, ?, ?, ?)", [(client, *row) for row in new])
+        self.conn.executemany(
+            "INSERT INTO cube_counts VALUES (?, ?, ?, 1)"
+            " ON CONFLICT (kind, column_key, value) DO UPDATE SET clients = clients + 1",
+            [(kind, key, value) for kind, key, _, _, value in new])
+        self.conn.execute(
+            "INSERT INTO cube_version VALUES (1, 1) ON CONFLICT (id) DO UPDATE SET version = version + 1")
+
+    def version(self):
+        """Number of refreshes so far; it changes whenever any client's assessment is saved."""
+        row = self.conn.execute("SELECT version FROM cube_version").fetchone()
+        return row[0] if row else 0
+
+    def client_view(self, client):
+        """{"final": [BenchmarkRow], "technical": [BenchmarkRow]} for the client's latest assessment, or None."""
+        own = self.conn.execute(
+            "SELECT kind, column_key, column, value FROM cube_latest WHERE client = ? ORDER BY kind, position",
+            (client,)).fetchall()
+        if not own:
+            return None
+        view = {"final": [], "technical": []}
+        for kind, key, column, value in own:
+            if kind == "final" and column not in BENCHMARK_RUBRICS:
+                continue
+            counts = self.conn.execute(
+                "SELECT value, clients FROM cube_counts WHERE kind = ? AND column_key = ? ORDER BY value",
+                (kind, key)).fetchall()
+            view[kind].append(_benchmark_row(column, value, counts))
+        return view
+
+    def client_count(self):
+        return self.conn.execute("SELECT COUNT(DISTINCT client) FROM cube_latest").fetchone()[0]
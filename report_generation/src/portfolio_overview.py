@@ -0,0 +1,34 @@
+from dash import html, dcc
+from src.chart_generation import generate_benchmark_chart
+
+
+def create_portfolio_overview(benchmark, client):
+    """Generate the Portfolio Benchmark section from PortfolioCube.client_view (pre-aggregated, no report scans)."""
+    if not benchmark or not (benchmark["final"] or benchmark["technical"]):
+        return []
+
+    peers = max((row.peers for rows in benchmark.values() for row in rows), default=0)
+    charts = []
+    if benchmark["final"]:
+        charts.append(dcc.Graph(
+            figure=generate_benchmark_chart(benchmark["final"], "Final Maturity Scores (%)", [0, 100]),
+            config={"displayModeBar": False},
+            style={"marginTop": "10px", "pageBreakInside": "avoid"}
+        ))
+    if benchmark["technical"]:
+        charts.append(dcc.Graph(
+            figure=generate_benchmark_chart(benchmark["technical"], "Technical Focus Area Scores (0–2)", [-0.2, 2.4]),
+            config={"displayModeBar": False},
+            style={"marginTop": "10px", "pageBreakInside": "avoid"}
+        ))
+
+    return [
+        html.H1("Portfolio Benchmark", style={"color": "#2a4e85", "marginTop": "40px", "pageBreakBefore": "always"}),
+        html.P(
+            f"Places {client}'s latest scores against the latest assessment of {peers} other client"
+            f"{'' if peers == 1 else 's'}. The grey bar spans the middle 50% of clients, the black tick marks "
+            "the median, and P-values give the share of clients scoring lower.",
+            style={"marginTop": "10px"}
+        ),
+        *charts,
+    ]
@@ -0,0 +1,234 @@
+"""One Dash app serving every report, for production deployment behind a multi-worker WSGI server.
+
+Routes (dcc.Location):
+    /                          index of the reports and clients that can be opened
+    /reports/<report id>       <reports_dir>/<report id>.md
+    /clients/<client>[/<date>] the client's latest (or dated) assessment from the history store,
+                               with the Portfolio Benchmark section
+
+Layouts are cached per worker in a LayoutCache keyed by a hash of the report file's content, or
+for clients of the assessment id and the benchmark cube's version (which any save changes), plus
+the chart options and month labels the charts are drawn with; a report is only rebuilt after it
+changes, and the least recently used layouts are evicted. The Technical Overview filters and, with
+lazy_cards=N, the cards after the first N are answered by callbacks from whichever worker gets
+them. Each page carries its path; a worker that routed the path looks its card index up by the
+content key it routed to, and any other worker resolves the report from the path first. Add
+?full=1 to a URL for every card at once (e.g. for export_pdf.py). The app never runs Dash's debug
+machinery: serve it with scripts/serve.py or any WSGI server pointed at `wsgi_app()`.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qs, quote, unquote
+
+import dash
+from dash import Input, Output, dcc, html
+
+from src.chart_generation import get_month_labels
+from src.config import HISTORY_DB_PATH, REPORTS_DIR
+from src.data_extraction import extract_report
+from src.document_creation import INDEX_STRING, create_report_sections, report_layout
+from src.history import AssessmentHistory
+from src.technical_overview import build_card_index, register_card_callbacks
+from src.utils import read_file
+
+LAYOUT_CACHE_SIZE = 64          # report layouts kept per worker process
+REPORT_ID = re.compile(r"^[\w.-]+$")    # report ids are file stems; no path separators
+
+
+class LayoutCache:
+    """Thread-safe LRU of built layouts by content hash, with hit/miss counts."""
+
+    def __init__(self, maxsize=LAYOUT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._layouts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        with self._lock:
+            if key in self._layouts:
+                self._layouts.move_to_end(key)
+                self.hits += 1
+                return self._layouts[key]
+            self.misses += 1
+        layout = build()        # outside the lock: other reports keep being served meanwhile
+        self.put(key, layout)
+        return layout
+
+    def peek(self, key):
+        """The cached value for key, or None; never builds."""
+        with self._lock:
+            if key not in self._layouts:
+                return None
+            self._layouts.move_to_end(key)
+            return self._layouts[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._layouts[key] = value
+            self._layouts.move_to_end(key)
+            while len(self._layouts) > self.maxsize:
+                self._layouts.popitem(last=False)
+
+
+def content_key(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _message(title, text):
+    return html.Div(style={"fontFamily": "Arial", "padding": "20px"}, children=[
+        html.H1(title, style={"color": "#2a4e85"}),
+        html.P(text),
+        dcc.Link("All reports", href="/"),
+    ])
+
+
+class ReportServer:
+    """Resolves URL paths to reports, and reports to layouts through the LayoutCache."""
+
+    def __init__(self, reports_dir=REPORTS_DIR, history_path=HISTORY_DB_PATH, svg_charts=False, chart_grid=False,
+                 cache_size=LAYOUT_CACHE_SIZE, lazy_cards=None):
+        self.reports_dir = reports_dir
+        self.history_path = history_path
+        self.options = {"svg_charts": svg_charts, "chart_grid": chart_grid}
+        self.lazy_cards = lazy_cards
+        self.cache = LayoutCache(cache_size)
+        self.reports = LayoutCache(cache_size)      # extracted report files
+        self.client_reports = LayoutCache(cache_size)   # (report, benchmark) loaded from the history store
+        self.card_indexes = LayoutCache(cache_size)     # build_card_index per report, for the card callbacks
+        self.routes = LayoutCache(cache_size)           # pathname -> content key it was last routed to
+
+    def _key(self, *content):
+        return content_key(*content, json.dumps(self.options, sort_keys=True), "|".join(get_month_labels()))
+
+    def _build(self, report, benchmark=None, client=None, source=None, card_index=None, lazy_cards=None):
+        sections = create_report_sections(
+            report.maturity, report.technical, report.critical_risks, report.final_maturity, report.compliance,
+            benchmark=benchmark, client=client, source=source, card_index=card_index, lazy_cards=lazy_cards,
+            **self.options
+        )
+        return report_layout([component for children in sections.values() for component in children])
+
+    def report_ids(self):
+        if not os.path.isdir(self.reports_dir):
+            return []
+        return sorted(name[:-3] for name in os.listdir(self.reports_dir) if name.endswith(".md"))
+
+    def clients(self):
+        if not os.path.exists(self.history_path):
+            return []
+        with AssessmentHistory(self.history_path) as history:
+            return history.clients()
+
+    def report_file(self, report_id):
+        """(content key, report, None, None) for <reports_dir>/<report_id>.md, or a message layout."""
+        path = os.path.join(self.reports_dir, f"{report_id}.md")
+        if not REPORT_ID.match(report_id) or not os.path.isfile(path):
+            return _message("Report not found", f"There is no report '{report_id}' in {self.reports_dir}.")
+        text = read_file(path)
+        key = self._key("report", text)
+        return key, self.reports.get(key, lambda: extract_report(text)), None, None
+
+    def client_report(self, client, assessed_on=None):
+        """(content key, report, benchmark, client) for a client's assessment in the history store, or a message layout."""
+        if not os.path.exists(self.history_path):
+            return _message("Client not found", f"No assessment history at {self.history_path}.")
+        with AssessmentHistory(self.history_path) as history:
+            found = history.find_assessment(client, assessed_on)
+            if found is None:
+                return _message("Client not found", f"No assessment for '{client}'{f' on {assessed_on}' if assessed_on else ''}.")
+            assessment_id, assessed_on, latest = found
+            # Any save bumps the cube version, which covers changed previous scores and benchmarks too
+            key = self._key("client", client, str(assessment_id), assessed_on, str(history.cube.version()))
+            report, benchmark = self.client_reports.get(key, lambda: (
+                history.load(client, assessed_on),
+                # The benchmark compares the latest assessments, so it is only shown on the latest one
+                history.cube.client_view(client) if latest else None,
+            ))
+        return key, report, benchmark, client
+
+    def resolve(self, pathname):
+        """(content key, report, benchmark, client) for a /reports or /clients path, or a message layout."""
+        parts = [unquote(part) for part in (pathname or "/").strip("/").split("/") if part]
+        if parts and parts[0] == "reports" and len(parts) == 2:
+            return self.report_file(parts[1])
+        if parts and parts[0] == "clients" and len(parts) in (2, 3):
+            return self.client_report(*parts[1:])
+        return _message("Page not found", f"Nothing is served at {pathname}.")
+
+    def _card_index(self, key, report):
+        return self.card_indexes.get(key, lambda: build_card_index(report.maturity))
+
+    def card_index(self, pathname):
+        """
+        The CardIndex of the report at pathname (the card callbacks' source), or None. Pages this worker
+        routed are answered from the index of the content they were built from, without touching the
+        report; others (routed by another worker, or evicted) are resolved from the path.
+        """
+        key = self.routes.peek(pathname)
+        card_index = self.card_indexes.peek(key) if key else None
+        if card_index is not None:
+            return card_index
+        resolved = self.resolve(pathname)
+        if not isinstance(resolved, tuple):
+            return None
+        self.routes.put(pathname, resolved[0])
+        return self._card_index(*resolved[:2])
+
+    def index_page(self):
+        reports, clients = self.report_ids(), self.clients()
+        return html.Div(style={"fontFamily": "Arial", "padding": "20px"}, children=[
+            html.H1("Assessment Reports", style={"color": "#2a4e85"}),
+            html.H2("Reports"),
+            html.Ul([html.Li(dcc.Link(report_id, href=f"/reports/{quote(report_id)}")) for report_id in reports])
+            if reports else html.P(f"No reports in {self.reports_dir}."),
+            html.H2("Clients"),
+            html.Ul([html.Li(dcc.Link(client, href=f"/clients/{quote(client)}")) for client in clients])
+            if clients else html.P(f"No clients in {self.history_path}."),
+        ])
+
+    def page(self, pathname, search=None):
+        """The layout for pathname; a ?full=1 query turns lazy cards off."""
+        if not (pathname or "/").strip("/"):
+            return self.index_page()
+        resolved = self.resolve(pathname)
+        if not isinstance(resolved, tuple):
+            return resolved
+        key, report, benchmark, client = resolved
+        self.routes.put(pathname, key)
+        lazy_cards = None if parse_qs((search or "").lstrip("?")).get("full") == ["1"] else self.lazy_cards
+        # The layout embeds pathname as the card callbacks' source, so paths never share a layout
+        return self.cache.get(content_key(key, pathname, str(lazy_cards)), lambda: self._build(
+            report, benchmark, client, pathname, self._card_index(key, report), lazy_cards
+        ))
+
+
+def create_report_server(reports_dir=REPORTS_DIR, history_path=HISTORY_DB_PATH, svg_charts=False, chart_grid=False,
+                         cache_size=LAYOUT_CACHE_SIZE, lazy_cards=None):
+    """Dash app routing /reports/<id> and /clients/<client>[/<date>] to cached report layouts."""
+    reports = ReportServer(reports_dir, history_path, svg_charts, chart_grid, cache_size, lazy_cards)
+    app = dash.Dash(__name__, use_pages=False, title="Assessment Reports")
+    app.index_string = INDEX_STRING
+    app.layout = html.Div([dcc.Location(id="url"), html.Div(id="report-page")])
+
+    @app.callback(Output("report-page", "children"), Input("url", "pathname"), Input("url", "search"))
+    def route(pathname, search):
+        return reports.page(pathname, search)
+
+    register_card_callbacks(app, reports.card_index, lazy_cards, svg_charts)
+    return app
+
+
+def wsgi_app():
+    """WSGI entry point with the default paths, e.g. gunicorn -w 4 'src.report_server:wsgi_app()'."""
+    return create_report_server(
+        os.environ.get("REPORTS_DIR", REPORTS_DIR), os.environ.get("HISTORY_DB_PATH", HISTORY_DB_PATH)
+    ).server
@@ -0,0 +1,131 @@
+"""Typed records for extracted report data, shared from extraction through the Dash builders.
+
+Every record is a slotted dataclass (no per-instance __dict__), and converts to and from
+plain dicts/JSON by field name without deep-copying its values.
+"""
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+class _Record:
+    """Shallow dict/JSON conversion for the slotted records below."""
+    __slots__ = ()
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+@dataclass(slots=True)
+class MaturityItem(_Record):
+    """A Platform Maturity rubric item (scores 1–5)."""
+    title: str
+    priority: Optional[int]         # None when the report says N/A
+    personas: str
+    previous: Optional[float]       # None when there is no previous report
+    current: float
+    target: float
+    findings: str
+
+    @property
+    def prev_score_missing(self):
+        return self.previous is None
+
+    @property
+    def scores(self):
+        """[previous, current, target] as plotted; a missing previous score plots as 0."""
+        return [0 if self.previous is None else self.previous, self.current, self.target]
+
+
+@dataclass(slots=True)
+class TechnicalScore(_Record):
+    """A Technical Focus Area row (scores 0–2)."""
+    area: str
+    previous: Optional[int]
+    current: int
+    target: int
+    justification: str
+
+    @property
+    def prev_score_missing(self):
+        return self.previous is None
+
+    @property
+    def scores(self):
+        return [0 if self.previous is None else self.previous, self.current, self.target]
+
+
+@dataclass(slots=True)
+class Solution(_Record):
+    immediate: str
+    short_term: str
+    long_term: str
+
+
+@dataclass(slots=True)
+class CriticalRisk(_Record):
+    title: str
+    business_impact: str
+    solution: Solution
+
+    def to_dict(self):
+        return {"title": self.title, "business_impact": self.business_impact, "solution": self.solution.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["title"], data["business_impact"], Solution.from_dict(data["solution"]))
+
+
+@dataclass(slots=True)
+class CompliancePosture(_Record):
+    score: str                      # as written in the report, e.g. "85%"
+    description: str
+
+
+@dataclass(slots=True)
+class FinalMaturityScore(_Record):
+    rubric: str
+    current_percent: float
+    target_percent: float
+    decline_percent: Optional[float] = None     # only set on the Overall rubric
+
+
+@dataclass(slots=True)
+class ReportData(_Record):
+    """Everything extracted from one combined report."""
+    maturity: List[MaturityItem] = field(default_factory=list)
+    technical: List[TechnicalScore] = field(default_factory=list)
+    critical_risks: List[CriticalRisk] = field(default_factory=list)
+    compliance: Optional[CompliancePosture] = None
+    final_maturity: List[FinalMaturityScore] = field(default_factory=list)
+
+    def to_dict(self):
+        return {
+            "maturity": [item.to_dict() for item in self.maturity],
+            "technical": [item.to_dict() for item in self.technical],
+            "critical_risks": [risk.to_dict() for risk in self.critical_risks],
+            "compliance": self.compliance.to_dict() if self.compliance else None,
+            "final_maturity": [score.to_dict() for score in self.final_maturity],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            [MaturityItem.from_dict(item) for item in data.get("maturity", [])],
+            [TechnicalScore.from_dict(item) for item in data.get("technical", [])],
+            [CriticalRisk.from_dict(risk) for risk in data.get("critical_risks", [])],
+            CompliancePosture.from_dict(data["compliance"]) if data.get("compliance") else None,
+            [FinalMaturityScore.from_dict(score) for score in data.get("final_maturity", [])],
+        )
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
+
@@ -0,0 +1,132 @@
+"""Static, self-contained HTML export of the Dash report, without running a server.
+
+Walks the component tree built by create_dash_app, writes each html.* component as its HTML tag
+and each dcc.Graph as a placeholder <div> plus its pre-serialised figure JSON, and fills the app's
+index_string (so the print CSS is the same inline <style>) with that body. Plotly.js is inlined
+only when the page has graphs; with svg_charts the report's own charts need no JavaScript.
+"""
+import json
+import re
+from html import escape
+
+import plotly
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+
+# Void elements have no closing tag
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+# React props that are spelled differently as HTML attributes
+ATTRIBUTE_NAMES = {"className": "class", "htmlFor": "for", "colSpan": "colspan", "rowSpan": "rowspan"}
+# Dash bookkeeping props with no HTML meaning
+SKIPPED_PROPS = {"children", "style", "n_clicks", "n_clicks_timestamp", "disable_n_clicks", "key", "loading_state"}
+# Style properties React leaves unitless; other numeric values get "px", as in the browser
+UNITLESS_STYLES = {"flex", "flexGrow", "flexShrink", "fontWeight", "lineHeight", "opacity", "order", "zIndex"}
+CAMEL_CASE, KEBAB_CASE = re.compile(r"([A-Z])"), r"-\1"      # flexGrow -> flex-grow
+
+PLOT_SCRIPT = """
+<script>
+(function () {
+    var figures = JSON.parse(document.getElementById("report-figures").textContent);
+    figures.forEach(function (f) {
+        Plotly.newPlot(document.getElementById(f.id), f.figure.data || [], f.figure.layout || {}, f.config);
+    });
+})();
+</script>"""
+
+
+def _css(style):
+    declarations = []
+    for name, value in style.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and name not in UNITLESS_STYLES:
+            value = f"{value}px"
+        declarations.append(f"{CAMEL_CASE.sub(KEBAB_CASE, name).lower()}: {value}")
+    return "; ".join(declarations)
+
+
+def _attributes(props):
+    attrs = []
+    if props.get("style"):
+        attrs.append(f'style="{escape(_css(props["style"]))}"')
+    for name, value in props.items():
+        if name in SKIPPED_PROPS or value is None or value is False:
+            continue
+        name = ATTRIBUTE_NAMES.get(name, name.lower())
+        attrs.append(name if value is True else f'{name}="{escape(str(value))}"')
+    return "".join(f" {attr}" for attr in attrs)
+
+
+class _Renderer:
+    def __init__(self):
+        self.figures = []           # [{"id", "figure", "config"}] in page order
+
+    def render(self, node):
+        if node is None:
+            return ""
+        if isinstance(node, (list, tuple)):
+            return "".join(self.render(child) for child in node)
+        if isinstance(node, (str, int, float)):
+            return escape(str(node))
+        spec = node.to_plotly_json()
+        props = spec["props"]
+        if spec["namespace"] == "dash_core_components" and spec["type"] == "Graph":
+            return self._graph(props)
+        if spec["namespace"] != "dash_html_components":
+            print(f"⚠️ {spec['namespace']}.{spec['type']} has no static HTML form; writing its children only.")
+            return self.render(props.get("children"))
+        tag = spec["type"].lower()
+        if tag in VOID_TAGS:
+            return f"<{tag}{_attributes(props)}>"
+        return f"<{tag}{_attributes(props)}>{self.render(props.get('children'))}</{tag}>"
+
+    def _graph(self, props):
+        graph_id = props.get("id") or f"report-graph-{len(self.figures) + 1}"
+        figure = props.get("figure") or {}
+        if hasattr(figure, "to_plotly_json"):
+            figure = figure.to_plotly_json()
+        self.figures.append({"id": graph_id, "figure": figure, "config": props.get("config") or {}})
+        style = f' style="{escape(_css(props["style"]))}"' if props.get("style") else ""
+        return f'<div class="dash-graph"{style}><div id="{escape(graph_id)}"></div></div>'
+
+
+def render_static_html(app, include_plotlyjs="inline", layout=None):
+    """
+    The app's layout (or `layout`, in the app's page template) as one HTML document. include_plotlyjs:
+    "inline" embeds plotly.js (fully offline), "cdn" links it from the Plotly CDN and a path ending
+    in ".js" links that file (see write_plotlyjs); it is left out when the page has no graphs.
+    """
+    renderer = _Renderer()
+    body = renderer.render(app.layout if layout is None else layout)
+    scripts = ""
+    if renderer.figures:
+        figures = json.dumps(renderer.figures, cls=plotly.utils.PlotlyJSONEncoder).replace("</", "<\\/")
+        if include_plotlyjs == "cdn":
+            plotlyjs = f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+        elif include_plotlyjs.endswith(".js"):
+            plotlyjs = f'<script src="{escape(include_plotlyjs)}"></script>'
+        else:
+            plotlyjs = f"<script>{get_plotlyjs()}</script>"
+        scripts = f'{plotlyjs}\n<script type="application/json" id="report-figures">{figures}</script>{PLOT_SCRIPT}'
+
+    placeholders = {
+        "metas": '<meta charset="UTF-8">',
+        "title": escape(app.title),
+        "favicon": "",
+        "css": "",
+        "app_entry": f'<div id="react-entry-point">{body}</div>',
+        "config": "",
+        "scripts": scripts,
+        "renderer": "",
+    }
+    return re.sub(r"\{%(\w+)%\}", lambda m: placeholders.get(m.group(1), ""), app.index_string)
+
+
+def write_plotlyjs(path):
+    """Write plotly.js once for pages rendered with include_plotlyjs=<that path>."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+
+
+def write_static_html(app, path, include_plotlyjs="inline"):
+    html = render_static_html(app, include_plotlyjs)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"✅ Generated static HTML report: {path} ({len(html) / 1024:.0f} KB)")
@@ -0,0 +1,205 @@
+"""Pure-Python SVG rendering of the three report chart types, without Plotly or a browser.
+
+Draws the same shapes as chart_generation's generate_chart (maturity 3-bar),
+generate_final_maturity_chart (grouped bars) and generate_single_maturity_chart (Overall line),
+with the same sizes, colours and labels. The SVG strings can be shown in Dash with svg_graph(),
+written to files, or embedded in static HTML/PDF output; render_svgs() spreads large batches
+over a process pool.
+"""
+import base64
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape, quoteattr
+
+from dash import html
+
+from src.chart_generation import (
+    MATURITY_CHART_LAYOUT, get_maturity_color, get_month_labels, get_current_quarter_and_target,
+)
+
+FONT_FAMILY = '"Open Sans", verdana, arial, sans-serif'    # Plotly's default font
+TEXT_COLOR = "#444"
+GRID_COLOR = "#ddd"
+CURRENT_COLOR = "#2a4e85"
+TARGET_COLOR = "#6b9ad9"
+DECLINE_COLOR = "#FF0000"
+LINE_HEIGHT = 1.2                                           # em, for <br>-separated labels
+SERIAL_BATCH_SIZE = 32                                      # smaller batches skip the process pool
+
+
+# --- SVG primitives ----------------------------------------------------------
+
+def _num(value):
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _text(x, y, label, size=12, color=TEXT_COLOR, anchor="middle", weight=None, rotate=None):
+    """<text>, one <tspan> per <br>-separated line; y is the baseline of the first line."""
+    lines = str(label).split("<br>")
+    attrs = f'x="{_num(x)}" y="{_num(y)}" font-size="{size}" fill="{color}" text-anchor="{anchor}"'
+    if weight:
+        attrs += f' font-weight="{weight}"'
+    if rotate is not None:
+        attrs += f' transform="rotate({rotate} {_num(x)} {_num(y)})"'
+    if len(lines) == 1:
+        return f"<text {attrs}>{escape(lines[0])}</text>"
+    spans = "".join(
+        f'<tspan x="{_num(x)}" dy="{0 if i == 0 else LINE_HEIGHT}em">{escape(line)}</tspan>'
+        for i, line in enumerate(lines)
+    )
+    return f"<text {attrs}>{spans}</text>"
+
+
+def _rect(x, y, width, height, fill, stroke=None):
+    outline = f' stroke="{stroke}" stroke-width="1"' if stroke else ""
+    return f'<rect x="{_num(x)}" y="{_num(y)}" width="{_num(width)}" height="{_num(height)}" fill="{fill}"{outline}/>'
+
+
+def _line(x1, y1, x2, y2, color, width=1, dash=None):
+    pattern = f' stroke-dasharray="{dash}"' if dash else ""
+    return (f'<line x1="{_num(x1)}" y1="{_num(y1)}" x2="{_num(x2)}" y2="{_num(y2)}"'
+            f' stroke="{color}" stroke-width="{width}"{pattern}/>')
+
+
+def _svg(width, height, title, body):
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}"'
+        f' viewBox="0 0 {width} {height}" font-family={quoteattr(FONT_FAMILY)} role="img"'
+        f' aria-label={quoteattr(title)}>'
+        f'<rect width="{width}" height="{height}" fill="white"/>{"".join(body)}</svg>'
+    )
+
+
+def _y_scale(top, bottom, low, high):
+    return lambda value: bottom - (value - low) / (high - low) * (bottom - top)
+
+
+def _y_ticks(scale, left, right, ticks, size, grid):
+    """Tick labels left of the plot area, plus horizontal grid lines if `grid`."""
+    parts = []
+    for tick in ticks:
+        y = scale(tick)
+        if grid:
+            parts.append(_line(left, y, right, y, GRID_COLOR))
+        parts.append(_text(left - 4, y + size * 0.35, tick, size=size, anchor="end"))
+    return parts
+
+
+# --- Charts ------------------------------------------------------------------
+
+def maturity_chart_svg(scores, prev_score_missing: bool = False, labels=None):
+    """SVG twin of generate_chart(): Previous / Current / Target bars on a 0–5 axis."""
+    width, height = MATURITY_CHART_LAYOUT["width"], MATURITY_CHART_LAYOUT["height"]
+    margin = MATURITY_CHART_LAYOUT["margin"]
+    labels = labels or get_month_labels()
+    left, right = margin["l"] + 20, width - margin["r"]
+    top, bottom = margin["t"], height - margin["b"] - 10      # room for three-line month labels
+    y = _y_scale(top, bottom, 0, 5)
+    slot = (right - left) / 3
+
+    body = _y_ticks(y, left, right, range(6), 12, grid=False)
+    for i, (score, label) in enumerate(zip(scores, labels)):
+        missing = i == 0 and prev_score_missing
+        center = left + (i + 0.5) * slot
+        value = 0 if missing else min(max(float(score), 0), 5)
+        bar_top = y(value)
+        if bar_top < bottom:
+            color = "#CCCCCC" if missing else get_maturity_color(score)
+            body.append(_rect(center - 0.15 * slot, bar_top, 0.3 * slot, bottom - bar_top, color))
+        if bottom - bar_top >= 16:                              # Plotly hides inside text that doesn't fit
+            body.append(_text(center, bar_top + 14, "N/A" if missing else score, color="white"))
+        body.append(_text(center, bottom + 16, label))
+    return _svg(width, height, "Platform maturity scores", body)
+
+
+def final_maturity_chart_svg(final_maturity_scores):
+    """SVG twin of generate_final_maturity_chart(): grouped Current / Target percentage bars per rubric."""
+    width, height = 600, 300
+    left, right, top, bottom = 20 + 45, width - 20, 50, height - 100
+    y = _y_scale(top, bottom, 0, 100)
+    slot = (right - left) / max(len(final_maturity_scores), 1)
+    bar = slot * (1 - 0.2) / 2                                  # bargap 0.2, two bars per group
+
+    body = [_text(width / 2, 28, "Final Maturity Scores", size=17)]
+    body += _y_ticks(y, left, right, range(0, 101, 10), 12, grid=True)
+    body.append(_text(22, (top + bottom) / 2, "Percentage (%)", size=14, rotate=-90))
+    for i, score in enumerate(final_maturity_scores):
+        start = left + i * slot + slot * 0.1
+        for j, (percent, color) in enumerate(((score.current_percent, CURRENT_COLOR),
+                                              (score.target_percent, TARGET_COLOR))):
+            bar_top = y(min(max(percent, 0), 100))
+            body.append(_rect(start + j * bar, bar_top, bar, bottom - bar_top, color))
+            if bottom - bar_top >= 16:
+                body.append(_text(start + (j + 0.5) * bar, bar_top + 14, f"{percent:.1f}%", color="white"))
+        body.append(_text(left + (i + 0.5) * slot, bottom + 18, score.rubric))
+
+    legend_y = bottom + 0.3 * (bottom - top) + 10
+    for dx, (name, color) in zip((-130, 20), (("Current Percent", CURRENT_COLOR), ("Target Percent", TARGET_COLOR))):
+        x = (left + right) / 2 + dx
+        body.append(_rect(x, legend_y - 9, 12, 12, color))
+        body.append(_text(x + 18, legend_y + 1, name, anchor="start"))
+    return _svg(width, height, "Final Maturity Scores", body)
+
+
+def single_maturity_chart_svg(rubric_data, width=450, quarters=None):
+    """SVG twin of generate_single_maturity_chart(): Current → Target line, plus Current → Decline on Overall."""
+    height = 200
+    quarters = quarters or get_current_quarter_and_target()
+    left, right, top, bottom = 10 + 26, width - 10, 26, height - 34
+    y = _y_scale(top, bottom, 0, 100)
+    x = [left + (right - left) * 0.1, left + (right - left) * 0.9]
+    current = rubric_data.current_percent
+
+    body = [_text(width / 2, 14, f"{rubric_data.rubric} Maturity Score", size=10)]
+    body += _y_ticks(y, left, right, range(0, 101, 20), 6, grid=True)
+    body.append(_text(14, (top + bottom) / 2, "Percentage (%)", size=8, rotate=-90))
+    body += [_text(xq, bottom + 9, quarter, size=6) for xq, quarter in zip(x, quarters)]
+    body.append(_text((left + right) / 2, bottom + 24, "Time Period", size=8))
+
+    lines = [(rubric_data.target_percent, TARGET_COLOR, CURRENT_COLOR, None, True)]
+    if rubric_data.decline_percent is not None:
+        lines.append((rubric_data.decline_percent, DECLINE_COLOR, DECLINE_COLOR, "6,6", False))
+    for end, end_color, line_color, dash, label_start in lines:
+        body.append(_line(x[0], y(current), x[1], y(end), line_color, width=2, dash=dash))
+        for xp, value, color, labelled in ((x[0], current, CURRENT_COLOR, label_start),
+                                           (x[1], end, end_color, True)):
+            body.append(f'<circle cx="{_num(xp)}" cy="{_num(y(value))}" r="3" fill="{color}"'
+                        f' stroke="black" stroke-width="1"/>')
+            if labelled:
+                body.append(_text(xp, y(value) - 6, f"{value:.1f}%", size=10))
+    return _svg(width, height, f"{rubric_data.rubric} Maturity Score", body)
+
+
+# --- Dash and batch use ------------------------------------------------------
+
+def svg_data_uri(svg):
+    return "data:image/svg+xml;base64," + base64.b64encode(svg.encode("utf-8")).decode("ascii")
+
+
+def svg_graph(svg, style=None):
+    """Dash component showing a rendered SVG chart (vector in print/PDF, no plotly.js)."""
+    return html.Img(src=svg_data_uri(svg), style={"display": "block", **(style or {})})
+
+
+RENDERERS = {
+    "maturity": maturity_chart_svg,
+    "final_maturity": final_maturity_chart_svg,
+    "single_maturity": single_maturity_chart_svg,
+}
+
+
+def render_svg(job):
+    """Render one (kind, args) job, kind being a RENDERERS key."""
+    kind, args = job
+    return RENDERERS[kind](*args)
+
+
+def render_svgs(jobs, workers=None, chunksize=16):
+    """
+    Render (kind, args) jobs, in order. Batches of SERIAL_BATCH_SIZE or more go to a process pool
+    of `workers` processes (default: one per CPU); pass workers=1 to stay in-process.
+    """
+    jobs = list(jobs)
+    if workers == 1 or len(jobs) < SERIAL_BATCH_SIZE:
+        return [render_svg(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_svg, jobs, chunksize=chunksize))
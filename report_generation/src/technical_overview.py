@@ -1,24 +1,270 @@
-from dash import html, dcc
+from typing import NamedTuple
+
+from dash import ALL, Input, Output, Patch, State, ctx, html, dcc, no_update
+from dash.exceptions import PreventUpdate
 from src.utils import build_legend
-from src.chart_generation import generate_chart, MATURITY_RISK_LEVELS
+from src.chart_generation import maturity_chart_figure, maturity_grid_figure, MATURITY_RISK_LEVELS, MATURITY_CHART_LAYOUT
+from src.svg_charts import maturity_chart_svg, svg_graph
 from src.styles import CARD_STYLE
 
-def create_maturity_card(title, priority_level, personas, chart_figure, findings_text):
-    """Create a card for Technical Overview with a bar chart."""
-    return html.Div(style={**CARD_STYLE, "marginBottom": "30px"}, children=[
+CHART_STYLE = {"flexBasis": "160px", "flexShrink": "0", "pageBreakInside": "avoid"}
+MATURITY_CARD_STYLE = {**CARD_STYLE, "marginBottom": "30px"}
+HIDDEN_CARD_STYLE = {**MATURITY_CARD_STYLE, "display": "none"}
+
+def create_maturity_card(title, priority_level, personas, chart_figure, findings_text, chart_svg=None, card_id=None,
+                         style=MATURITY_CARD_STYLE):
+    """Create a card for Technical Overview with a bar chart (a static image when chart_svg is given)."""
+    chart = svg_graph(chart_svg, CHART_STYLE) if chart_svg else \
+        dcc.Graph(figure=chart_figure, config={"displayModeBar": False}, style=CHART_STYLE)
+    return html.Div(**({"id": card_id} if card_id is not None else {}), style=style, children=[
         html.H3(title, style={"color": "#2a4e85"}),
         html.Div(style={"display": "flex", "gap": "30px", "flexWrap": "nowrap"}, children=[
             html.Div([
                 html.Strong("Priority Level"), html.Br(), html.Span(str(priority_level)), html.Br(), html.Br(),
                 html.Strong("Personas"), html.Br(), html.Span(personas)
             ], style={"minWidth": "120px", "fontSize": "14px"}),
-            dcc.Graph(figure=chart_figure, config={"displayModeBar": False}, style={"flexBasis": "160px", "flexShrink": "0", "pageBreakInside": "avoid"}),
+            chart,
             html.Div(findings_text, style={"flexGrow": "1", "fontSize": "14px", "minWidth": "0"})
         ])
     ])
 
-def create_technical_overview(maturity_data):
-    """Generate the Technical Overview section layout."""
+# Chart-grid layout: every row's height is fixed up front from a conservative text estimate,
+# so the text column and the single grid figure stay aligned without measuring in the browser.
+GRID_TEXT_MIN_WIDTH = 300       # px; narrowest the text column gets (A4 print next to the 420px chart)
+GRID_ROW_GAP = 30               # px between rows (the cards' marginBottom)
+GRID_CHARS_PER_LINE = {"title": 28, "body": 42}     # at GRID_TEXT_MIN_WIDTH, 18.7px bold / 14px text
+GRID_LINE_HEIGHT = {"title": 24, "body": 17}
+
+
+def _lines(text, kind):
+    return max(1, -(-len(text) // GRID_CHARS_PER_LINE[kind]))
+
+
+def grid_row_height(item):
+    """Pixel height of an item's row: its chart, or its text if that is taller (with ~15% slack)."""
+    text = (
+        _lines(item.title, "title") * GRID_LINE_HEIGHT["title"] + 40                  # H3 and its margins
+        + (2 + _lines(item.personas, "body")) * GRID_LINE_HEIGHT["body"]              # priority / personas
+        + _lines(findings_text(item), "body") * GRID_LINE_HEIGHT["body"] + 24               # padding and border
+    )
+    return max(MATURITY_CHART_LAYOUT["height"], round(text * 1.15))
+
+
+def create_maturity_grid(maturity_data):
+    """Technical Overview cards as a text column next to ONE dcc.Graph holding every bar chart as a subplot row."""
+    heights = [grid_row_height(item) for item in maturity_data]
+    figure = maturity_grid_figure([(item.scores, item.prev_score_missing) for item in maturity_data], heights, GRID_ROW_GAP)
+    text_column = html.Div(style={"flex": "1", "minWidth": f"{GRID_TEXT_MIN_WIDTH}px"}, children=[
+        html.Div(style={**CARD_STYLE, "marginBottom": f"{GRID_ROW_GAP}px", "height": f"{height}px",
+                        "boxSizing": "border-box", "overflowY": "auto", "pageBreakInside": "auto"}, children=[
+            html.H3(item.title, style={"color": "#2a4e85", "marginTop": "0"}),
+            html.Div([
+                html.Strong("Priority Level: "), html.Span("N/A" if item.priority is None else str(item.priority)), html.Br(),
+                html.Strong("Personas: "), html.Span(item.personas),
+            ], style={"fontSize": "14px", "marginBottom": "10px"}),
+            html.Div(findings_text(item), style={"fontSize": "14px"}),
+        ])
+        for item, height in zip(maturity_data, heights)
+    ])
+    return html.Div(className="maturity-grid", style={"display": "flex", "gap": "20px", "alignItems": "flex-start"}, children=[
+        text_column,
+        dcc.Graph(figure=figure, config={"displayModeBar": False},
+                  style={"flex": f"0 0 {MATURITY_CHART_LAYOUT['width']}px"}),
+    ])
+
+class CardIndex(NamedTuple):
+    """A report's maturity items with the positions of the items for each persona and priority level."""
+    items: list
+    personas: dict          # persona -> frozenset of item positions
+    priorities: dict        # "1".."3" or "N/A" -> frozenset of item positions
+
+    def matching(self, personas=None, priorities=None):
+        """Positions of the items for any of `personas` at any of `priorities`; an empty selection matches all."""
+        shown = frozenset(range(len(self.items)))
+        if personas:
+            shown &= frozenset().union(*(self.personas.get(persona, ()) for persona in personas))
+        if priorities:
+            shown &= frozenset().union(*(self.priorities.get(priority, ()) for priority in priorities))
+        return shown
+
+
+def priority_label(item):
+    return "N/A" if item.priority is None else str(item.priority)
+
+
+def findings_text(item):
+    """The findings as cards show them: without the *italics* the report wraps them in (kept in exports)."""
+    return item.findings.strip("*")
+
+
+def build_card_index(maturity_data):
+    """CardIndex over maturity_data; personas come from the comma-separated Personas field."""
+    personas, priorities = {}, {}
+    for position, item in enumerate(maturity_data):
+        for persona in item.personas.split(","):
+            persona = persona.strip()
+            if persona and persona.upper() != "N/A":
+                personas.setdefault(persona, set()).add(position)
+        priorities.setdefault(priority_label(item), set()).add(position)
+    return CardIndex(
+        items=list(maturity_data),
+        personas={persona: frozenset(positions) for persona, positions in sorted(personas.items())},
+        priorities={label: frozenset(positions) for label, positions in
+                    sorted(priorities.items(), key=lambda entry: (entry[0] == "N/A", entry[0]))},
+    )
+
+
+def create_maturity_cards(maturity_data, svg_charts=False, start=None, shown=None):
+    """
+    One create_maturity_card per maturity item. With start (the position of the first item in the
+    report) the cards get the pattern-matching ids the filter callback restyles; with shown, the
+    cards whose position is not in it are hidden.
+    """
+    return [create_maturity_card(
+        item.title,
+        priority_label(item),
+        item.personas,
+        None if svg_charts else maturity_chart_figure(item.scores, item.prev_score_missing),
+        findings_text(item),
+        maturity_chart_svg(item.scores, item.prev_score_missing) if svg_charts else None,
+        card_id=None if start is None else {"type": CARD_TYPE, "index": start + offset},
+        style=MATURITY_CARD_STYLE if shown is None or start + offset in shown else HIDDEN_CARD_STYLE,
+    ) for offset, item in enumerate(maturity_data)]
+
+# Interactive cards: the ids the callbacks of register_card_callbacks read and update
+CARD_TYPE = "maturity-card"
+PERSONA_FILTER_ID = "technical-persona-filter"
+PRIORITY_FILTER_ID = "technical-priority-filter"
+FILTER_COUNT_ID = "technical-filter-count"
+CARDS_STATE_ID = "technical-cards-state"
+MORE_CARDS_ID = "technical-more-cards"
+LOAD_MORE_ID = "technical-load-more"
+LOAD_MORE_STYLE = {"display": "block", "margin": "0 auto 30px", "padding": "8px 20px", "fontSize": "14px",
+                   "color": "#2a4e85", "backgroundColor": "white", "border": "1px solid #2a4e85",
+                   "borderRadius": "4px", "cursor": "pointer"}
+
+
+def _load_more_label(remaining):
+    return f"Show more findings ({remaining} remaining)"
+
+
+def _filter_count_label(shown, total):
+    return f"Showing {shown} of {total} items"
+
+
+def create_filter_controls(card_index):
+    """Persona and priority level dropdowns (empty = all) with the number of matching items."""
+    dropdown_style = {"minWidth": "220px", "fontSize": "14px"}
+    return html.Div(className="technical-filters", style={"display": "flex", "gap": "20px", "alignItems": "center",
+                                                          "flexWrap": "wrap", "marginBottom": "20px"}, children=[
+        dcc.Dropdown(id=PERSONA_FILTER_ID, options=list(card_index.personas), multi=True, placeholder="All personas",
+                     style=dropdown_style),
+        dcc.Dropdown(id=PRIORITY_FILTER_ID, multi=True, placeholder="All priority levels", style=dropdown_style,
+                     options=[{"label": f"Priority level {label}", "value": label} for label in card_index.priorities]),
+        html.Span(_filter_count_label(len(card_index.items), len(card_index.items)), id=FILTER_COUNT_ID,
+                  style={"fontSize": "14px", "color": "#555"}),
+    ])
+
+
+def create_interactive_cards(card_index, source, lazy_cards=None, svg_charts=False):
+    """
+    The filter controls and the cards, each with a pattern-matching id. With lazy_cards=N only the
+    first N cards are included, then an empty container and a "Show more" button for the rest.
+    `source` tells register_card_callbacks' callbacks which report the page shows.
+    """
+    items = card_index.items
+    first = lazy_cards if lazy_cards and len(items) > lazy_cards else len(items)
+    controls = [
+        create_filter_controls(card_index),
+        dcc.Store(id=CARDS_STATE_ID, data={"source": source, "loaded": first}),
+        *create_maturity_cards(items[:first], svg_charts, start=0),
+    ]
+    if first == len(items):
+        return controls
+    return [
+        *controls,
+        html.Div(id=MORE_CARDS_ID, children=[]),
+        html.Button(_load_more_label(len(items) - first), id=LOAD_MORE_ID, className="lazy-load-more",
+                    style=LOAD_MORE_STYLE),
+    ]
+
+
+def register_card_callbacks(app, resolve, lazy_cards=None, svg_charts=False):
+    """
+    Add the Technical Overview callbacks of create_interactive_cards layouts; resolve(source) returns
+    the report's CardIndex, or None when it is gone.
+
+    Filtering looks the matching items up in the index and restyles only the cards whose visibility
+    changes. With lazy_cards=N, pressing "Show more" (INDEX_STRING presses it as it scrolls into
+    view) appends the next N cards, filtered the same way, as a Patch on their container.
+    """
+    # The components only exist on report pages, or with more than N cards; others must not fail validation
+    app.config.suppress_callback_exceptions = True
+
+    @app.callback(
+        Output({"type": CARD_TYPE, "index": ALL}, "style"),
+        Output(FILTER_COUNT_ID, "children"),
+        Input(PERSONA_FILTER_ID, "value"),
+        Input(PRIORITY_FILTER_ID, "value"),
+        State({"type": CARD_TYPE, "index": ALL}, "style"),
+        State(CARDS_STATE_ID, "data"),
+        prevent_initial_call=True,
+    )
+    def filter_cards(personas, priorities, styles, state):
+        card_index = resolve(state["source"])
+        if card_index is None:
+            raise PreventUpdate
+        shown = card_index.matching(personas, priorities)
+        updates = []
+        for output, style in zip(ctx.outputs_list[0], styles):
+            visible = output["id"]["index"] in shown
+            hidden = (style or {}).get("display") == "none"
+            updates.append(no_update if visible != hidden else MATURITY_CARD_STYLE if visible else HIDDEN_CARD_STYLE)
+        return updates, _filter_count_label(len(shown), len(card_index.items))
+
+    if not lazy_cards:
+        return
+
+    @app.callback(
+        Output(MORE_CARDS_ID, "children"),
+        Output(CARDS_STATE_ID, "data"),
+        Output(LOAD_MORE_ID, "children"),
+        Output(LOAD_MORE_ID, "style"),
+        Input(LOAD_MORE_ID, "n_clicks"),
+        State(CARDS_STATE_ID, "data"),
+        State(PERSONA_FILTER_ID, "value"),
+        State(PRIORITY_FILTER_ID, "value"),
+        prevent_initial_call=True,
+    )
+    def load_more_cards(_, state, personas, priorities):
+        card_index = resolve(state["source"])
+        if card_index is None:
+            raise PreventUpdate
+        start = state["loaded"]
+        stop = min(start + lazy_cards, len(card_index.items))
+        cards = Patch()
+        cards.extend(create_maturity_cards(card_index.items[start:stop], svg_charts, start=start,
+                                           shown=card_index.matching(personas, priorities)))
+        remaining = len(card_index.items) - stop
+        return (cards, {**state, "loaded": stop}, _load_more_label(remaining),
+                LOAD_MORE_STYLE if remaining else {"display": "none"})
+
+
+def create_technical_overview(maturity_data, svg_charts=False, chart_grid=False, source=None, card_index=None,
+                              lazy_cards=None):
+    """
+    Generate the Technical Overview section layout; svg_charts draws the bar charts as static SVG,
+    chart_grid draws them all in one subplot-grid figure beside the card text (see create_maturity_grid).
+    With a source (served pages, not print) the cards come from create_interactive_cards: persona and
+    priority filters and, with lazy_cards=N, only the first N cards up front. card_index is the
+    report's build_card_index, built here when not given; chart_grid layouts are never interactive.
+    """
+    if chart_grid and maturity_data and not svg_charts:
+        cards = [create_maturity_grid(maturity_data)]
+    elif source is not None and maturity_data:
+        cards = create_interactive_cards(card_index or build_card_index(maturity_data), source, lazy_cards, svg_charts)
+    else:
+        cards = create_maturity_cards(maturity_data, svg_charts)
     return [
         html.H1("Technical Overview", style={"color": "#2a4e85", "marginTop": "40px", "pageBreakBefore": "always"}),
         html.P("Provides a detailed analysis of the Kubernetes infrastructure’s maturity and security posture."),
@@ -27,11 +273,5 @@ def create_technical_overview(maturity_data):
         html.Div(style={"marginBottom": "20px"}),
         build_legend(MATURITY_RISK_LEVELS, is_horizontal=True),
         html.H2("Technical Overview Results", style={"marginTop": "40px"}),
-        *[create_maturity_card(
-            item["title"],
-            item["priority"],
-            item["personas"],
-            generate_chart(item["scores"], item["prev_score_missing"]),
-            item["findings"]
-        ) for item in maturity_data]
+        *cards
     ]
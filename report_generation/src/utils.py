@@ -1,7 +1,6 @@
 from pathlib import Path
 from dash import html
-import re
-from src.config import REPORT_PATH
+from src.schema import MaturityItem, TechnicalScore, Solution, CriticalRisk, FinalMaturityScore, ReportData
 
 def read_file(file_path):
     """Read the content of a file and return it as a string."""
@@ -12,6 +11,13 @@ def read_file(file_path):
         print(f"❌ {e}")
         return None
 
+def load_report_json(path):
+    """Load a ReportData written by src.data_extraction.write_report_json."""
+    text = read_file(path)
+    if not text:
+        return None
+    return ReportData.from_json(text)
+
 def parse_report_file(path):
     """Parse report.txt into maturity, technical, critical risk, and final maturity score data sections."""
     if not Path(path).exists():
@@ -60,7 +66,8 @@ def parse_report_file(path):
                     print(f"⚠️ Skipped block due to insufficient lines (expected {expected_lines}, got {len(lines)}):\n{block}\n")
                     continue
 
-                priority = lines[1].split(":")[1].strip() if is_maturity else "N/A"
+                priority_raw = lines[1].split(":")[1].strip() if is_maturity else "N/A"
+                priority = None if priority_raw.upper() == "N/A" else int(priority_raw)
                 personas = lines[2].split(":")[1].strip() if is_maturity else "N/A"
                 prev_score_raw = lines[3 if is_maturity else 1].split(":")[1].strip()
                 # Parse scores as float for maturity, int for technical
@@ -73,14 +80,10 @@ def parse_report_file(path):
                 findings = lines[6 if is_maturity else 4].split(":", 1)[1].strip().strip("*")
 
                 prev = None if prev_score_raw.upper() == "N/A" else float(prev_score_raw) if is_maturity else int(prev_score_raw)
-                parsed.append({
-                    "title": title,
-                    "priority": priority,
-                    "personas": personas,
-                    "scores": [prev if prev is not None else 0, current, min(target, cap_score_at)],
-                    "findings": findings,
-                    "prev_score_missing": prev is None
-                })
+                if is_tech:
+                    parsed.append(TechnicalScore(title, prev, current, min(target, cap_score_at), findings))
+                else:
+                    parsed.append(MaturityItem(title, priority, personas, prev, current, min(target, cap_score_at), findings))
                 print(f"Parsed entry: {title}")
             except Exception as e:
                 print(f"⚠️ Skipped block due to error: {e}\nBlock:\n{block}\n")
@@ -106,15 +109,7 @@ def parse_report_file(path):
                 short_term = lines[4].split(":", 1)[1].strip() if lines[4].startswith("- Short-term:") else ""
                 long_term = lines[5].split(":", 1)[1].strip() if lines[5].startswith("- Long-term:") else ""
 
-                parsed.append({
-                    "title": title,
-                    "business_impact": business_impact,
-                    "solution": {
-                        "immediate": immediate,
-                        "short_term": short_term,
-                        "long_term": long_term
-                    }
-                })
+                parsed.append(CriticalRisk(title, business_impact, Solution(immediate, short_term, long_term)))
             except Exception as e:
                 print(f"⚠️ Skipped block due to error: {e}\nBlock:\n{block}\n")
         return parsed
@@ -140,12 +135,12 @@ def parse_report_file(path):
                 if rubric == "Overall" and len(lines) >= 4 and lines[3].startswith("Decline Percent:"):
                     decline_percent = lines[3].split(":", 1)[1].strip().rstrip("%")
 
-                parsed.append({
-                    "rubric": rubric,
-                    "current_percent": float(current_percent),
-                    "target_percent": float(target_percent),
-                    "decline_percent": float(decline_percent) if decline_percent is not None else None
-                })
+                parsed.append(FinalMaturityScore(
+                    rubric,
+                    float(current_percent),
+                    float(target_percent),
+                    float(decline_percent) if decline_percent is not None else None
+                ))
             except Exception as e:
                 print(f"⚠️ Skipped final maturity block due to error: {e}\nBlock:\n{block}\n")
         return parsed
@@ -191,30 +186,3 @@ def build_legend(legend_items, is_horizontal=True):
                 ])
             ]
         )
-
-def extract_compliance_posture_from_report():
-    """Extract the Overall Compliance Score and Description from report.txt."""
-    text = read_file(REPORT_PATH)
-    if not text:
-        return None
-
-    start = text.find("Compliance Posture\n")
-    if start == -1:
-        print("❌ Could not find 'Compliance Posture' section in report.txt.")
-        return None
-
-    pattern = re.compile(
-        r'Overall Compliance Score: (.+?)\nDescription: (.+?)(?=\n##|\Z)',
-        re.DOTALL
-    )
-    match = pattern.search(text[start:])
-
-    if not match:
-        print("⚠️ No compliance posture matched in report.txt.")
-        return None
-
-    score, description = match.groups()
-    return {
-        "score": score.strip(),
-        "description": description.strip()
-    }
@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 import sys, re, os
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 
 HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*$')
 LIST_RE    = re.compile(r'^\s*(?:[-*+]|\d+\.)\s+')
 TABLE_SEP  = re.compile(r'^\s*\|?(?:\s*:?-{3,}:?\s*\|)+\s*:?-{3,}:?\s*\|?\s*$')
 CODE_FENCE = re.compile(r'^\s*```')
 
+# value constraints implied by report_template.yaml (what data_extraction.py can actually parse)
+MATURITY_ITEM_RE = re.compile(
+    r'^\s*-\s+\*\*(?P<title>.+?) \(Score: (?P<score>[^)]*)\) '
+    r'\(Priority level: (?P<priority>[^)]*)\) \(Personas: (?P<personas>[^)]*)\)\*\*'
+)
+BOLD_BULLET_RE = re.compile(r'^\s*-\s+\*\*')
+SOLUTION_RE    = re.compile(r'^\s*-\s+\*\*(Immediate|Short-term|Long-term):\*\*\s*(.*)$')
+COMPLIANCE_RE  = re.compile(r'^\*{1,2}Overall Compliance Score:\*+\s*\*+([^*]*)\*+')
+PERCENT_RE     = re.compile(r'^\d+(?:\.\d+)?\s*%?$')   # the cell forms FINAL_MATURITY_ROW_RE reads: 70, 70.00%, 70.00 %
+PLACEHOLDERS   = {'', '...', 'tbd', 'x'}
+FINAL_RUBRICS  = ('Viability', 'Success', 'Upkeep', 'Support', 'Overall')
+
 def slugify(s: str) -> str:
     s = s.strip().lower()
     s = re.sub(r'`.+?`', '', s)              # remove inline code
@@ -14,19 +26,170 @@ def slugify(s: str) -> str:
     s = re.sub(r'\s+', ' ', s).strip()
     return s
 
-def parse_outline_and_blocks(text: str):
+def _cell_values(ln: str) -> List[str]:
+    return [c.strip() for c in ln.strip().strip('|').split('|')]
+
+def _is_table_rule(ln: str) -> bool:
+    return set(ln.strip()) <= {'|', '-', ':', ' '}
+
+class ValueChecker:
+    """
+    Checks the values inside the scored sections (maturity items, final maturity table,
+    compliance score, technical table, risk solutions) while the outline pass walks the lines.
+    Each problem is recorded as "Line N: ..." so it can be fixed before the Dash/PDF stages run.
+    """
+    AREAS = {
+        'critical risks': 'risks',
+        'platform maturity scoring': 'maturity',
+        'final maturity score': 'final',
+        'compliance posture': 'compliance',
+        'technical focus area scores': 'technical',
+    }
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        self.area = None
+        self.pending_item = None     # (line_no, title) of a maturity item still waiting for findings
+        self.rubrics_seen = set()
+        self.compliance_seen = False
+        self.technical_rows = 0
+
+    def error(self, line_no: int, msg: str):
+        self.errors.append(f'Line {line_no}: {msg}')
+
+    def heading(self, line_no: int, level: int, slug: str):
+        self.flush_item(line_no)
+        if level > 2:
+            return
+        self.close_area(line_no)
+        # headings may or may not carry their "N." prefix ("4 compliance posture" / "compliance posture")
+        self.area = self.AREAS.get(re.sub(r'^\d+\s+', '', slug))
+
+    def flush_item(self, line_no: int):
+        if self.pending_item:
+            item_line, title = self.pending_item
+            self.error(item_line, f'Maturity item "{title}" has no findings text')
+            self.pending_item = None
+
+    def close_area(self, line_no: int):
+        if self.area == 'final':
+            missing = [r for r in FINAL_RUBRICS if r not in self.rubrics_seen]
+            if missing:
+                self.error(line_no, f'Final Maturity Score table is missing rows: {", ".join(missing)}')
+        elif self.area == 'compliance' and not self.compliance_seen:
+            self.error(line_no, 'Compliance Posture has no "Overall Compliance Score: **NN%**" line')
+        elif self.area == 'technical' and not self.technical_rows:
+            self.error(line_no, 'Technical Focus Area Scores table has no rows')
+        self.area = None
+        self.rubrics_seen = set()
+        self.compliance_seen = False
+        self.technical_rows = 0
+
+    def finish(self, line_no: int):
+        self.flush_item(line_no)
+        self.close_area(line_no)
+
+    def line(self, line_no: int, ln: str):
+        if not ln.strip() or self.area is None:
+            return
+        getattr(self, f'check_{self.area}')(line_no, ln)
+
+    def check_risks(self, line_no: int, ln: str):
+        m = SOLUTION_RE.match(ln)
+        if m and m.group(2).strip().lower() in PLACEHOLDERS:
+            self.error(line_no, f'{m.group(1)} solution is empty')
+
+    def check_maturity(self, line_no: int, ln: str):
+        if not BOLD_BULLET_RE.match(ln):
+            if self.pending_item:
+                findings = ln.strip().strip('*').strip()
+                if findings.startswith('Findings:'):
+                    findings = findings[len('Findings:'):].strip().strip('*').strip()
+                if findings.lower() in PLACEHOLDERS:
+                    self.error(line_no, f'Maturity item "{self.pending_item[1]}" has placeholder findings "{ln.strip()}"')
+                self.pending_item = None
+            return
+
+        self.flush_item(line_no)
+        m = MATURITY_ITEM_RE.match(ln)
+        if not m:
+            self.error(line_no, 'Maturity item does not match "- **Title (Score: N) (Priority level: N) (Personas: ...)**"')
+            return
+        title = m.group('title').strip()
+        score = m.group('score').strip()
+        try:
+            if not 1 <= float(score) <= 5:
+                self.error(line_no, f'Maturity item "{title}" has Score {score}; expected 1–5')
+        except ValueError:
+            self.error(line_no, f'Maturity item "{title}" has non-numeric Score "{score}"')
+        priority = m.group('priority').strip()
+        if priority not in ('1', '2', '3'):
+            self.error(line_no, f'Maturity item "{title}" has Priority level "{priority}"; expected 1, 2 or 3')
+        if not m.group('personas').strip():
+            self.error(line_no, f'Maturity item "{title}" has no Personas')
+        self.pending_item = (line_no, title)
+
+    def check_final(self, line_no: int, ln: str):
+        if '|' not in ln or _is_table_rule(ln):
+            return
+        cells = _cell_values(ln)
+        if cells and cells[0] == 'Rubric':
+            return
+        if len(cells) != 3:
+            self.error(line_no, f'Final Maturity Score row has {len(cells)} cells; expected 3')
+            return
+        rubric = cells[0].replace('**', '').strip()
+        self.rubrics_seen.add(rubric)
+        for label, value in (('Current %', cells[1]), ('Target %', cells[2])):
+            if not PERCENT_RE.match(value):
+                self.error(line_no, f'Final Maturity Score "{rubric}" {label} is "{value}"; expected a percentage like 70.00%')
+            elif float(value.rstrip('% ')) > 100:
+                self.error(line_no, f'Final Maturity Score "{rubric}" {label} is {value}; expected at most 100 %')
+
+    def check_compliance(self, line_no: int, ln: str):
+        if 'Overall Compliance Score' not in ln:
+            return
+        self.compliance_seen = True
+        m = COMPLIANCE_RE.match(ln.strip())
+        value = m.group(1).strip() if m else ''
+        if not re.fullmatch(r'\d{1,3}%', value) or int(value[:-1]) > 100:
+            self.error(line_no, f'Overall Compliance Score is "{value or ln.strip()}"; expected **NN%** between 0% and 100%')
+
+    def check_technical(self, line_no: int, ln: str):
+        if '|' not in ln or _is_table_rule(ln):
+            return
+        cells = _cell_values(ln)
+        if cells and cells[0] == 'Area':
+            return
+        self.technical_rows += 1
+        if len(cells) != 3:
+            self.error(line_no, f'Technical Focus Area row has {len(cells)} cells; expected 3')
+            return
+        area, score, justification = cells
+        area = area.replace('**', '').strip()
+        if not area:
+            self.error(line_no, 'Technical Focus Area row has no Area')
+        if score not in ('0', '1', '2'):
+            self.error(line_no, f'Technical Focus Area "{area}" has Score "{score}"; expected 0, 1 or 2')
+        if justification.lower() in PLACEHOLDERS:
+            self.error(line_no, f'Technical Focus Area "{area}" has an empty Justification')
+
+def parse_outline_and_blocks(text: str, value_errors: Optional[List[str]] = None):
     """
     Returns:
       outline: List[Tuple[level:int, title_slug:str]]
       blocks_by_section: Dict[index_in_outline, List[str]]  (coarse block types)
+    When value_errors is given, content-level problems found while walking the
+    lines are appended to it (see ValueChecker).
     """
     lines = text.splitlines()
     outline: List[Tuple[int, str]] = []
     # For block typing we segment by headings
     sections: List[Tuple[int, int]] = []  # (start_line, end_line) per heading content (exclusive)
     heading_lines: List[int] = []
+    checker = ValueChecker(value_errors) if value_errors is not None else None
 
-    # find headings
+    # find headings (and check values in the same walk)
     for i, ln in enumerate(lines):
         m = HEADING_RE.match(ln)
         if m:
@@ -34,6 +197,12 @@ def parse_outline_and_blocks(text: str):
             title = slugify(m.group(2))
             outline.append((lvl, title))
             heading_lines.append(i)
+            if checker:
+                checker.heading(i + 1, lvl, title)
+        elif checker:
+            checker.line(i + 1, ln)
+    if checker:
+        checker.finish(len(lines))
 
     # if no headings, it's invalid structure for our template use-case
     if not outline:
@@ -176,7 +345,8 @@ def main():
     got = open(got_path, 'r', encoding='utf-8').read()
 
     ref_outline, ref_blocks = parse_outline_and_blocks(ref)
-    got_outline, got_blocks = parse_outline_and_blocks(got)
+    value_errs: List[str] = []
+    got_outline, got_blocks = parse_outline_and_blocks(got, value_errs)
 
     errs = []
     # 1) strict heading/ordering check
@@ -190,9 +360,19 @@ def main():
         for e in errs:
             print("-", e)
         print("\nTip: headings must match exactly (text & level). Wording inside sections can differ.")
+
+    # 3) value check on the candidate (scores, percentages, table cells)
+    if value_errs:
+        print("\nVALUE CHECK FAILED\n" if errs else "VALUE CHECK FAILED\n")
+        for e in value_errs:
+            print("-", e)
+        print("\nTip: these rows would be dropped or mis-rendered by data_extraction.py.")
+
+    if errs or value_errs:
         sys.exit(1)
 
     print("Structure check passed: headings and basic layout match.")
+    print("Value check passed: scores, percentages and table cells are well-formed.")
     sys.exit(0)
 
 if __name__ == "__main__":